@@ -5,6 +5,8 @@ from .models import (
     AircraftData,
     AircraftType,
     FlightInstance,
+    FlightSchedule,
+    FlightStatusTransition,
     Route,
     Tracking,
     Vertiport,
@@ -28,7 +30,13 @@ class AircraftAdmin(admin.ModelAdmin):
 
 @admin.register(Vertiport)
 class VertiportAdmin(admin.ModelAdmin):
-    list_display = ("vertiport_code", "vertiport_name", "latitude", "longitude")
+    list_display = (
+        "vertiport_code",
+        "vertiport_name",
+        "latitude",
+        "longitude",
+        "slot_capacity",
+    )
     search_fields = ("vertiport_code", "vertiport_name")
 
 
@@ -120,3 +128,36 @@ class FlightInstanceAdmin(admin.ModelAdmin):
     search_fields = ("callsign", "aircraft__tail_number")
     date_hierarchy = "scheduled_departure_datetime"
     # inlines = [TrackingInline, AircraftDataInline]
+
+
+@admin.register(FlightSchedule)
+class FlightScheduleAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "callsign_prefix",
+        "departure_vertiport",
+        "arrival_vertiport",
+        "days_of_week",
+        "block_minutes",
+        "valid_from",
+        "valid_to",
+        "active",
+    )
+    list_filter = ("active", "departure_vertiport", "arrival_vertiport")
+    search_fields = ("name", "callsign_prefix")
+    filter_horizontal = ("aircraft",)
+
+
+@admin.register(FlightStatusTransition)
+class FlightStatusTransitionAdmin(admin.ModelAdmin):
+    list_display = (
+        "flight_instance",
+        "from_status",
+        "to_status",
+        "source",
+        "created_at",
+    )
+    list_filter = ("source", "from_status", "to_status")
+    search_fields = ("flight_instance__callsign",)
+    date_hierarchy = "created_at"
+    ordering = ("-created_at",)
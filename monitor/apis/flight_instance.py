@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from typing import List
 from uuid import UUID
 
 from ninja import Query, Router
@@ -10,7 +11,22 @@ from common_tools.schemas.flight_instance import (
     SubmitFlightInstance,
     UpdateFlightInstance,
 )
-from monitor.services.flight_instance import FlightInstanceService
+from monitor.schemas.flight_instance import (
+    BulkFlightInstanceErrorSchema,
+    BulkFlightInstanceResultSchema,
+)
+from monitor.schemas.schedule import (
+    ScheduleConflictFilterSchema,
+    ScheduleConflictSchemaList,
+)
+from monitor.services.flight_instance import (
+    BulkValidationError,
+    FlightInstanceService,
+)
+from monitor.services.schedule import (
+    ScheduleConflictError,
+    ScheduleValidationService,
+)
 
 flight_instance = Router(tags=["FlightInstance"])
 
@@ -34,12 +50,30 @@ def list_flight_instances(request, filters: FlightInstanceFilterSchema = Query(.
     return HTTPStatus.OK, fis
 
 
+@flight_instance.get(
+    path="/flight_instances/conflicts",
+    response={
+        HTTPStatus.OK: ScheduleConflictSchemaList,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def list_schedule_conflicts(
+    request, filters: ScheduleConflictFilterSchema = Query(...)
+):
+    service = ScheduleValidationService()
+    try:
+        return HTTPStatus.OK, service.audit(filters=filters)
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
 @flight_instance.post(
     path="/flight_instances",
     response={
         HTTPStatus.CREATED: FlightInstanceSchema,
         HTTPStatus.BAD_REQUEST: dict,
         HTTPStatus.NOT_FOUND: dict,
+        HTTPStatus.CONFLICT: dict,
         HTTPStatus.INTERNAL_SERVER_ERROR: dict,
     },
 )
@@ -48,18 +82,40 @@ def create_flight_instance(request, payload: SubmitFlightInstance):
     try:
         fi = service.create_flight_instance(payload=payload)
         return HTTPStatus.CREATED, fi
+    except ScheduleConflictError as e:
+        return HTTPStatus.CONFLICT, {"detail": str(e)}
     except ValueError as e:
         return HTTPStatus.NOT_FOUND, {"detail": str(e)}
     except Exception as e:
         return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
 
 
+@flight_instance.post(
+    path="/flight_instances/bulk",
+    response={
+        HTTPStatus.CREATED: BulkFlightInstanceResultSchema,
+        HTTPStatus.BAD_REQUEST: BulkFlightInstanceErrorSchema,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def bulk_create_flight_instances(request, payload: List[SubmitFlightInstance]):
+    service = FlightInstanceService()
+    try:
+        result = service.bulk_create_flight_instances(payloads=payload)
+        return HTTPStatus.CREATED, result
+    except BulkValidationError as e:
+        return HTTPStatus.BAD_REQUEST, {"detail": str(e), "errors": e.errors}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
 @flight_instance.patch(
     path="/flight_instances/{flight_instance_id}",
     response={
         HTTPStatus.OK: FlightInstanceSchema,
         HTTPStatus.BAD_REQUEST: dict,
         HTTPStatus.NOT_FOUND: dict,
+        HTTPStatus.CONFLICT: dict,
         HTTPStatus.INTERNAL_SERVER_ERROR: dict,
     },
 )
@@ -73,6 +129,8 @@ def update_flight_instance(
             payload=payload,
         )
         return HTTPStatus.OK, fi
+    except ScheduleConflictError as e:
+        return HTTPStatus.CONFLICT, {"detail": str(e)}
     except ValueError as e:
         return HTTPStatus.NOT_FOUND, {"detail": str(e)}
     except Exception as e:
@@ -0,0 +1,29 @@
+from http import HTTPStatus
+
+from ninja import Router
+
+from monitor.schemas.flight_schedule import (
+    ScheduleGenerationRequestSchema,
+    ScheduleGenerationResultSchema,
+)
+from monitor.services.flight_schedule import FlightScheduleService
+
+flight_schedule = Router(tags=["FlightSchedule"])
+
+
+@flight_schedule.post(
+    path="/flight_schedules/generate",
+    response={
+        HTTPStatus.OK: ScheduleGenerationResultSchema,
+        HTTPStatus.BAD_REQUEST: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def generate_flight_schedules(request, payload: ScheduleGenerationRequestSchema):
+    service = FlightScheduleService()
+    try:
+        return HTTPStatus.OK, service.generate(payload=payload)
+    except ValueError as e:
+        return HTTPStatus.BAD_REQUEST, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
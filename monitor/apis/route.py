@@ -10,7 +10,22 @@ from common_tools.schemas.route import (
     SubmitRouteSchema,
     UpdateRouteSchema,
 )
+from monitor.schemas.route_geometry import RouteGeometrySchema
+from monitor.schemas.route_planner import RoutePlanRequestSchema, RoutePlanSchema
+from monitor.schemas.route_search import (
+    RouteCorridorSearchSchema,
+    RouteSearchFilterSchema,
+    RouteSearchResultSchema,
+)
+from monitor.schemas.route_waypoints import (
+    CompactRouteSchemaList,
+    RouteWaypointsFilterSchema,
+    RouteWithWaypointsSchemaList,
+)
 from monitor.services.route import RouteService
+from monitor.services.route_geometry import RouteGeometryService
+from monitor.services.route_planner import RoutePlannerService
+from monitor.services.route_search import RouteSearchService
 
 route = Router(tags=["Route"])
 
@@ -35,6 +50,93 @@ def list_routes(request, filters: RouteFilterSchema = Query(...)):
     return HTTPStatus.OK, routes
 
 
+@route.get(
+    path="/routes/with_waypoints",
+    response={
+        HTTPStatus.OK: RouteWithWaypointsSchemaList | CompactRouteSchemaList,
+        HTTPStatus.NOT_FOUND: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def list_routes_with_waypoints(
+    request, filters: RouteWaypointsFilterSchema = Query(...)
+):
+    service = RouteService()
+    try:
+        routes = service.get_routes_with_waypoints(filters=filters)
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+    if not routes.root:
+        return HTTPStatus.NOT_FOUND, {"detail": "No routes found."}
+
+    return HTTPStatus.OK, routes
+
+
+@route.get(
+    path="/routes/search",
+    response={
+        HTTPStatus.OK: RouteSearchResultSchema,
+        HTTPStatus.BAD_REQUEST: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def search_routes(request, filters: RouteSearchFilterSchema = Query(...)):
+    service = RouteSearchService()
+    try:
+        result = service.search(
+            corridor=[(filters.latitude, filters.longitude)],
+            radius_km=filters.radius_km,
+            include_flights=filters.include_flights,
+        )
+        return HTTPStatus.OK, result
+    except ValueError as e:
+        return HTTPStatus.BAD_REQUEST, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
+@route.post(
+    path="/routes/search",
+    response={
+        HTTPStatus.OK: RouteSearchResultSchema,
+        HTTPStatus.BAD_REQUEST: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def search_routes_in_corridor(request, payload: RouteCorridorSearchSchema):
+    service = RouteSearchService()
+    try:
+        result = service.search(
+            corridor=payload.corridor,
+            radius_km=payload.radius_km,
+            include_flights=payload.include_flights,
+        )
+        return HTTPStatus.OK, result
+    except ValueError as e:
+        return HTTPStatus.BAD_REQUEST, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
+@route.get(
+    path="/routes/{route_id}/geometry",
+    response={
+        HTTPStatus.OK: RouteGeometrySchema,
+        HTTPStatus.NOT_FOUND: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def get_route_geometry(request, route_id: UUID):
+    service = RouteGeometryService()
+    try:
+        return HTTPStatus.OK, service.get_geometry(route_id=route_id)
+    except ValueError as e:
+        return HTTPStatus.NOT_FOUND, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
 @route.post(
     path="/routes",
     response={
@@ -55,6 +157,26 @@ def create_route(request, payload: SubmitRouteSchema):
         return HTTPStatus.NOT_FOUND, {"detail": str(e)}
 
 
+@route.post(
+    path="/routes/plan",
+    response={
+        HTTPStatus.OK: RoutePlanSchema,
+        HTTPStatus.CREATED: RoutePlanSchema,
+        HTTPStatus.NOT_FOUND: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def plan_route(request, payload: RoutePlanRequestSchema):
+    service = RoutePlannerService()
+    try:
+        plan = service.plan(payload=payload)
+        return (HTTPStatus.CREATED if plan.route else HTTPStatus.OK), plan
+    except ValueError as e:
+        return HTTPStatus.NOT_FOUND, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
 @route.patch(
     path="/routes/{route_id}",
     response={
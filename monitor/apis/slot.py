@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+from ninja import Query, Router
+
+from monitor.schemas.slot import (
+    OccupancyFilterSchema,
+    OccupancySchemaList,
+    SlotAllocationRequestSchema,
+    SlotAllocationResultSchema,
+)
+from monitor.services.slot_allocation import SlotAllocationService
+
+slot = Router(tags=["Slot"])
+
+
+@slot.post(
+    path="/slots/allocate",
+    response={
+        HTTPStatus.OK: SlotAllocationResultSchema,
+        HTTPStatus.BAD_REQUEST: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def allocate_slots(request, payload: SlotAllocationRequestSchema):
+    service = SlotAllocationService()
+    try:
+        return HTTPStatus.OK, service.allocate(payload=payload)
+    except ValueError as e:
+        return HTTPStatus.BAD_REQUEST, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
+@slot.get(
+    path="/slots/occupancy",
+    response={
+        HTTPStatus.OK: OccupancySchemaList,
+        HTTPStatus.BAD_REQUEST: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def get_occupancy(request, filters: OccupancyFilterSchema = Query(...)):
+    service = SlotAllocationService()
+    try:
+        return HTTPStatus.OK, service.get_occupancy(filters=filters)
+    except ValueError as e:
+        return HTTPStatus.BAD_REQUEST, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
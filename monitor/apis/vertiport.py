@@ -10,7 +10,12 @@ from common_tools.schemas.vertiport import (
     VertiportSchema,
     VertiportSchemaList,
 )
+from monitor.schemas.vertiport_board import (
+    VertiportBoardFilterSchema,
+    VertiportBoardSchema,
+)
 from monitor.services.vertiport import VertiportService
+from monitor.services.vertiport_board import VertiportBoardService
 
 vertiport = Router(tags=["Vertiport"])
 
@@ -55,6 +60,27 @@ def create_vertiport(request, payload: SubmitVertiportSchema):
         return HTTPStatus.NOT_FOUND, {"detail": str(e)}
 
 
+@vertiport.get(
+    path="/vertiports/{vertiport_id}/board",
+    response={
+        HTTPStatus.OK: VertiportBoardSchema,
+        HTTPStatus.NOT_FOUND: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def get_vertiport_board(
+    request, vertiport_id: UUID, filters: VertiportBoardFilterSchema = Query(...)
+):
+    service = VertiportBoardService()
+    try:
+        board = service.get_board(vertiport_id=vertiport_id, minutes=filters.minutes)
+        return HTTPStatus.OK, board
+    except ValueError as e:
+        return HTTPStatus.NOT_FOUND, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
 @vertiport.patch(
     path="/vertiports/{vertiport_id}",
     response={
@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from typing import List
 from uuid import UUID
 
 from ninja import Query, Router
@@ -10,7 +11,12 @@ from common_tools.schemas.waypoint import (
     WaypointSchema,
     WaypointSchemaList,
 )
-from monitor.services.waypoint import WaypointService
+from monitor.schemas.waypoint import (
+    BulkWaypointErrorSchema,
+    BulkWaypointResultSchema,
+    RouteWaypointItemSchema,
+)
+from monitor.services.waypoint import BulkWaypointValidationError, WaypointService
 
 waypoint = Router(tags=["Waypoint"])
 
@@ -91,3 +97,27 @@ def delete_waypoint(request, waypoint_id: UUID):
         return HTTPStatus.NOT_FOUND, {"detail": str(e)}
     except Exception as e:
         return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
+
+
+@waypoint.put(
+    path="/routes/{route_id}/waypoints",
+    response={
+        HTTPStatus.OK: BulkWaypointResultSchema,
+        HTTPStatus.BAD_REQUEST: BulkWaypointErrorSchema,
+        HTTPStatus.NOT_FOUND: dict,
+        HTTPStatus.INTERNAL_SERVER_ERROR: dict,
+    },
+)
+def replace_route_waypoints(
+    request, route_id: UUID, payload: List[RouteWaypointItemSchema]
+):
+    service = WaypointService()
+    try:
+        result = service.replace_route_waypoints(route_id=route_id, payload=payload)
+        return HTTPStatus.OK, result
+    except BulkWaypointValidationError as e:
+        return HTTPStatus.BAD_REQUEST, {"detail": str(e), "errors": e.errors}
+    except ValueError as e:
+        return HTTPStatus.NOT_FOUND, {"detail": str(e)}
+    except Exception as e:
+        return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": str(e)}
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class MonitorConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "monitor"
+
+    def ready(self):
+        from monitor.services.reference_cache import connect_signals
+
+        connect_signals()
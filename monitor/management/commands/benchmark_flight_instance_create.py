@@ -0,0 +1,111 @@
+# monitor/management/commands/benchmark_flight_instance_create.py
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from common_tools.schemas.flight_instance import SubmitFlightInstance
+from monitor.models import Aircraft, Route, Vertiport
+from monitor.services.flight_instance import FlightInstanceService
+
+BENCHMARK_OFFSET = timedelta(days=365)
+SLOT = timedelta(minutes=30)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmarks flight instance creation: one create per flight versus the "
+        "bulk path. Runs in a transaction that is rolled back unless --keep."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--flights", type=int, default=10_000)
+        parser.add_argument(
+            "--single-sample",
+            type=int,
+            default=1000,
+            help="Flights created one by one; the rest is extrapolated",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--keep", action="store_true", help="Commit the bulk-created flights"
+        )
+
+    def handle(self, *args, **options):
+        aircraft_ids = list(Aircraft.objects.values_list("id", flat=True))
+        route_ids = list(Route.objects.values_list("id", flat=True))
+        vertiport_ids = list(Vertiport.objects.values_list("id", flat=True))
+        if not aircraft_ids or len(vertiport_ids) < 2:
+            raise CommandError("Needs at least one aircraft and two vertiports.")
+
+        rng = random.Random(options["seed"])
+        # Far enough ahead not to collide with the existing schedule; each
+        # aircraft flies back-to-back slots so no flight is double-booked
+        start = timezone.now() + BENCHMARK_OFFSET
+        payloads = []
+        for index in range(options["flights"]):
+            dep, arr = rng.sample(vertiport_ids, 2)
+            slot, aircraft_index = divmod(index, len(aircraft_ids))
+            departure = start + slot * SLOT
+            payloads.append(
+                SubmitFlightInstance(
+                    aircraft=aircraft_ids[aircraft_index],
+                    callsign=f"BENCH{index:05d}",
+                    route=rng.choice(route_ids) if route_ids else None,
+                    departure_vertiport=dep,
+                    arrival_vertiport=arr,
+                    scheduled_departure_datetime=departure,
+                    scheduled_arrival_datetime=departure + timedelta(minutes=20),
+                )
+            )
+
+        service = FlightInstanceService()
+        sample = payloads[: options["single_sample"]]
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as single_queries:
+                started = time.perf_counter()
+                for payload in sample:
+                    service.create_flight_instance(payload=payload)
+                single_s = time.perf_counter() - started
+            # Only the bulk run is kept, if anything
+            transaction.set_rollback(True)
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as bulk_queries:
+                started = time.perf_counter()
+                result = service.bulk_create_flight_instances(payloads=payloads)
+                bulk_s = time.perf_counter() - started
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+        per_flight_s = single_s / len(sample) if sample else 0.0
+        projected_s = per_flight_s * len(payloads)
+        self.stdout.write(
+            f"{'PATH':<10}{'FLIGHTS':>9}{'SECONDS':>10}{'FLIGHTS/S':>12}"
+            f"{'QUERIES':>10}"
+        )
+        if sample:
+            self.stdout.write(
+                f"{'single':<10}{len(sample):>9}{single_s:>10.2f}"
+                f"{len(sample) / single_s:>12.0f}{len(single_queries):>10}"
+            )
+        self.stdout.write(
+            f"{'bulk':<10}{result.created:>9}{bulk_s:>10.2f}"
+            f"{result.created / bulk_s:>12.0f}{len(bulk_queries):>10}"
+        )
+        if sample and bulk_s > 0:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Single path projected to {projected_s:.1f}s for "
+                    f"{len(payloads)} flights: "
+                    f"bulk is {projected_s / bulk_s:.0f}x faster"
+                )
+            )
+        self.stdout.write(
+            "Bulk flights committed." if options["keep"] else "Rolled back."
+        )
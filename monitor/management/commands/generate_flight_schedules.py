@@ -0,0 +1,92 @@
+# monitor/management/commands/generate_flight_schedules.py
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from monitor.schemas.flight_schedule import ScheduleGenerationRequestSchema
+from monitor.services.flight_schedule import FlightScheduleService
+
+MAX_REPORTED_UNASSIGNED = 50
+
+
+class Command(BaseCommand):
+    help = (
+        "Expands the active recurring flight schedules into flight instances "
+        "for a date window. Occurrences generated before are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="date_from",
+            type=str,
+            default=None,
+            help="First day (YYYY-MM-DD). Defaults to today.",
+        )
+        parser.add_argument(
+            "--days", type=int, default=30, help="Days to generate, from --from"
+        )
+        parser.add_argument(
+            "--schedule",
+            dest="schedules",
+            action="append",
+            default=None,
+            help="Only this FlightSchedule id (repeatable)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Expand and assign aircraft without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < 1:
+            raise CommandError("--days must be at least 1.")
+        try:
+            date_from = (
+                date.fromisoformat(options["date_from"])
+                if options["date_from"]
+                else timezone.localdate()
+            )
+        except ValueError:
+            raise CommandError("--from must be a date as YYYY-MM-DD.")
+
+        payload = ScheduleGenerationRequestSchema(
+            date_from=date_from,
+            date_to=date_from + timedelta(days=options["days"] - 1),
+            schedules=options["schedules"],
+            dry_run=options["dry_run"],
+        )
+
+        started = time.perf_counter()
+        try:
+            result = FlightScheduleService().generate(payload=payload)
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        for item in result.unassigned[:MAX_REPORTED_UNASSIGNED]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{item.schedule} "
+                    f"{item.scheduled_departure_datetime:%Y-%m-%d %H:%M}Z: "
+                    f"{item.detail}"
+                )
+            )
+        if len(result.unassigned) > MAX_REPORTED_UNASSIGNED:
+            self.stdout.write(
+                f"Only the first {MAX_REPORTED_UNASSIGNED} unassigned "
+                "occurrences were listed."
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Planned' if result.dry_run else 'Generated'} "
+                f"{payload.date_from}..{payload.date_to} from {result.schedules} "
+                f"schedule(s) in {elapsed:.2f}s: occurrences={result.occurrences} "
+                f"existing={result.existing} created={result.created} "
+                f"unassigned={len(result.unassigned)}"
+            )
+        )
@@ -0,0 +1,246 @@
+# monitor/management/commands/import_schedule.py
+import csv
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import Aircraft, FlightInstance, Route, Vertiport
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+
+COLUMNS = (
+    "callsign",
+    "tail_number",
+    "route_name",
+    "departure_code",
+    "arrival_code",
+    "scheduled_departure",
+    "scheduled_arrival",
+)
+UPDATE_FIELDS = [
+    "aircraft",
+    "route",
+    "departure_vertiport",
+    "arrival_vertiport",
+    "scheduled_departure_datetime",
+    "scheduled_arrival_datetime",
+    "updated_at",
+]
+
+AMBIGUOUS = object()  # Lookup value of names shared by several rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports a flight schedule CSV (callsign, tail_number, route_name, "
+        "departure_code, arrival_code, scheduled_departure, scheduled_arrival) "
+        "in constant memory, with batched inserts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="CSV file with a header row")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument("--delimiter", type=str, default=",")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without writing anything",
+        )
+        parser.add_argument(
+            "--upsert",
+            action="store_true",
+            help="Update flights whose callsign already exists instead of "
+            "creating duplicates",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        # Reference data is small next to a schedule: resolved once, in memory
+        self._aircraft = self._lookup(Aircraft.objects.values_list("tail_number", "id"))
+        self._routes = self._lookup(Route.objects.values_list("name", "id"))
+        self._vertiports = self._lookup(
+            Vertiport.objects.values_list("vertiport_code", "id")
+        )
+
+        self._counts = {"rows": 0, "created": 0, "updated": 0, "invalid": 0}
+        started = time.perf_counter()
+
+        try:
+            with open(options["path"], newline="", encoding="utf-8-sig") as fp:
+                reader = csv.DictReader(fp, delimiter=options["delimiter"])
+                missing = set(COLUMNS) - set(reader.fieldnames or ())
+                if missing:
+                    raise CommandError(
+                        f"Missing CSV columns: {', '.join(sorted(missing))}"
+                    )
+
+                batch: List[FlightInstance] = []
+                for row in reader:
+                    self._counts["rows"] += 1
+                    fi = self._parse_row(reader.line_num, row, options["upsert"])
+                    if fi is None:
+                        continue
+                    batch.append(fi)
+                    if len(batch) >= options["batch_size"]:
+                        self._flush(batch, options)
+                        batch = []
+                if batch:
+                    self._flush(batch, options)
+        except OSError as e:
+            raise CommandError(f"Unable to read {options['path']}: {e}")
+
+        elapsed = time.perf_counter() - started
+        counts = self._counts
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Validated' if options['dry_run'] else 'Imported'} "
+                f"{counts['rows']} rows in {elapsed:.2f}s "
+                f"({counts['rows'] / elapsed if elapsed else 0:.0f} rows/s): "
+                f"created={counts['created']} updated={counts['updated']} "
+                f"invalid={counts['invalid']}"
+            )
+        )
+        if counts["invalid"] > MAX_REPORTED_ERRORS:
+            self.stdout.write(
+                f"Only the first {MAX_REPORTED_ERRORS} invalid rows were listed."
+            )
+
+    def _lookup(self, pairs: Iterable[Tuple[str, UUID]]) -> Dict[str, object]:
+        lookup: Dict[str, object] = {}
+        for key, pk in pairs:
+            if key is None:
+                continue
+            key = key.strip()
+            lookup[key] = AMBIGUOUS if key in lookup else pk
+        return lookup
+
+    def _resolve(self, lookup, value: str, label: str, errors: List[str]):
+        if not value:
+            return None
+        pk = lookup.get(value)
+        if pk is None:
+            errors.append(f"{label} '{value}' not found")
+        elif pk is AMBIGUOUS:
+            errors.append(f"{label} '{value}' is ambiguous")
+            return None
+        return pk
+
+    def _parse_time(self, value: str, label: str, errors: List[str]):
+        parsed = parse_datetime(value) if value else None
+        if parsed is None:
+            errors.append(f"invalid {label} '{value}'")
+            return None
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def _parse_row(
+        self, line: int, row: Dict[str, str], upsert: bool
+    ) -> FlightInstance | None:
+        """Validated, unsaved FlightInstance for a row, or None if invalid."""
+        row = {key: (row.get(key) or "").strip() for key in COLUMNS}
+        errors: List[str] = []
+
+        if not row["tail_number"]:
+            errors.append("tail_number is required")
+        if upsert and not row["callsign"]:
+            errors.append("callsign is required to upsert")
+        aircraft_id = self._resolve(
+            self._aircraft, row["tail_number"], "Aircraft", errors
+        )
+        route_id = self._resolve(self._routes, row["route_name"], "Route", errors)
+        departure_id = self._resolve(
+            self._vertiports, row["departure_code"], "Vertiport", errors
+        )
+        arrival_id = self._resolve(
+            self._vertiports, row["arrival_code"], "Vertiport", errors
+        )
+        departure: datetime | None = self._parse_time(
+            row["scheduled_departure"], "scheduled_departure", errors
+        )
+        arrival: datetime | None = self._parse_time(
+            row["scheduled_arrival"], "scheduled_arrival", errors
+        )
+        if departure and arrival and arrival <= departure:
+            errors.append("scheduled_arrival must be after scheduled_departure")
+
+        if errors:
+            self._counts["invalid"] += 1
+            if self._counts["invalid"] <= MAX_REPORTED_ERRORS:
+                self.stdout.write(
+                    self.style.WARNING(f"Line {line}: {'; '.join(errors)}")
+                )
+            return None
+
+        return FlightInstance(
+            aircraft_id=aircraft_id,
+            callsign=row["callsign"] or None,
+            route_id=route_id,
+            flight_status=FlightStatusEnum.PENDING.value,
+            departure_vertiport_id=departure_id,
+            arrival_vertiport_id=arrival_id,
+            scheduled_departure_datetime=departure,
+            scheduled_arrival_datetime=arrival,
+        )
+
+    def _flush(self, batch: List[FlightInstance], options):
+        if not options["upsert"]:
+            if not options["dry_run"]:
+                FlightInstance.objects.bulk_create(
+                    batch, batch_size=options["batch_size"]
+                )
+            self._counts["created"] += len(batch)
+            return
+
+        # Later rows of the same callsign win, as they would one by one
+        by_callsign = {fi.callsign: fi for fi in batch}
+        existing: Dict[str, List[UUID]] = {}
+        for callsign, pk in FlightInstance.objects.filter(
+            callsign__in=by_callsign
+        ).values_list("callsign", "id"):
+            existing.setdefault(callsign, []).append(pk)
+
+        rows = []
+        updated = 0
+        for callsign, fi in by_callsign.items():
+            pks = existing.get(callsign)
+            if not pks:
+                rows.append(fi)
+                continue
+            updated += len(pks)
+            for pk in pks:
+                rows.append(
+                    FlightInstance(
+                        id=pk,
+                        aircraft_id=fi.aircraft_id,
+                        callsign=callsign,
+                        route_id=fi.route_id,
+                        flight_status=fi.flight_status,  # Kept on update
+                        departure_vertiport_id=fi.departure_vertiport_id,
+                        arrival_vertiport_id=fi.arrival_vertiport_id,
+                        scheduled_departure_datetime=fi.scheduled_departure_datetime,
+                        scheduled_arrival_datetime=fi.scheduled_arrival_datetime,
+                    )
+                )
+
+        if not options["dry_run"]:
+            # One INSERT ... ON CONFLICT (id) DO UPDATE for new and existing
+            # rows; bulk_update would build a CASE per field and row instead
+            FlightInstance.objects.bulk_create(
+                rows,
+                batch_size=options["batch_size"],
+                update_conflicts=True,
+                unique_fields=["id"],
+                update_fields=UPDATE_FIELDS,
+            )
+        self._counts["created"] += len(rows) - updated
+        self._counts["updated"] += updated
@@ -0,0 +1,185 @@
+# monitor/management/commands/replay_telemetry.py
+import json
+import time
+from datetime import datetime
+from typing import Dict
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import AircraftData
+from monitor.simulator.clock import parse_option_datetime
+from monitor.simulator.metrics import LatencyReservoir
+from monitor.simulator.sender import TrackingSender
+
+CHUNK_SIZE = 2000
+
+base_url = "http://localhost:8000/api"
+
+
+class Command(BaseCommand):
+    help = (
+        "Replays recorded AircraftData points of a time window into the tracking "
+        "ingest API, at original or scaled speed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="window_from", type=str, required=True)
+        parser.add_argument("--to", dest="window_to", type=str, required=True)
+        parser.add_argument(
+            "--speed",
+            type=float,
+            default=1.0,
+            help="Replay speed factor (2 = twice as fast, 0 = as fast as possible)",
+        )
+        parser.add_argument("--flight-instance", type=UUID, default=None)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+        parser.add_argument(
+            "--base-url",
+            type=str,
+            default=base_url,
+            help="Target API. Replaying into the recording server duplicates history.",
+        )
+
+    def handle(self, *args, **options):
+        window_from = parse_option_datetime(options["window_from"], "--from")
+        window_to = parse_option_datetime(options["window_to"], "--to")
+        if window_to <= window_from:
+            raise CommandError("--to must be after --from.")
+        if options["speed"] < 0:
+            raise CommandError("--speed must not be negative.")
+
+        queryset = AircraftData.objects.filter(
+            created_at__gte=window_from,
+            created_at__lt=window_to,
+            flight_instance__isnull=False,
+        )
+        if options["flight_instance"] is not None:
+            queryset = queryset.filter(flight_instance_id=options["flight_instance"])
+
+        final_points = self._final_points(queryset, window_to)
+
+        rows = (
+            queryset.order_by("created_at").values_list(
+                "flight_instance_id",
+                "latitude",
+                "longitude",
+                "altitude",
+                "speed",
+                "energy_level",
+                "created_at",
+            )
+            # Server-side cursor on PostgreSQL: memory bounded by chunk size
+            .iterator(chunk_size=options["chunk_size"])
+        )
+
+        url = f"{options['base_url']}/tracking"
+        speed = options["speed"]
+        self.stdout.write(
+            f"Replaying {window_from.isoformat()} -> {window_to.isoformat()} "
+            f"at {'max' if speed == 0 else f'{speed:g}x'} speed -> {url}"
+        )
+
+        sent = 0
+        lags_ms = LatencyReservoir()
+        first_recorded = last_recorded = None
+        with TrackingSender(url, concurrency=options["concurrency"]) as sender:
+            wall_started = time.monotonic()
+            for fi_id, lat, lon, alt, spd, energy, created_at in rows:
+                if first_recorded is None:
+                    first_recorded = created_at
+                last_recorded = created_at
+
+                if speed > 0:
+                    due = (
+                        wall_started
+                        + (created_at - first_recorded).total_seconds() / speed
+                    )
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        lags_ms.add(-delay * 1000)
+
+                active = final_points.get(fi_id) != created_at
+                sender.submit(
+                    json.dumps(
+                        {
+                            "flight_instance": fi_id,
+                            "latitude": lat,
+                            "longitude": lon,
+                            "altitude": alt,
+                            "speed": spd,
+                            "energy_level": energy,
+                            "active": active,
+                            "started_at": None,
+                            "finished_at": None if active else created_at,
+                            "updated_at": created_at,
+                        },
+                        cls=DjangoJSONEncoder,
+                    ),
+                    # One sender thread per flight keeps its points in order
+                    key=fi_id,
+                )
+                sent += 1
+        wall = time.monotonic() - wall_started
+
+        self._report(sent, wall, first_recorded, last_recorded, lags_ms, sender)
+
+    def _final_points(self, queryset, window_to: datetime) -> Dict[UUID, datetime]:
+        """Last recorded point of each terminated flight that landed in the window.
+
+        Those points are replayed with active=False so the flights terminate
+        again on the target server. A flight's last point is taken over its
+        whole history: one recorded after the window means the flight was
+        still airborne at the window end and must stay active.
+        """
+        return dict(
+            AircraftData.objects.filter(
+                flight_instance__in=queryset.values("flight_instance_id"),
+                flight_instance__flight_status=FlightStatusEnum.TERMINATED.value,
+            )
+            .values("flight_instance_id")
+            .annotate(last=Max("created_at"))
+            .filter(last__lt=window_to)
+            .values_list("flight_instance_id", "last")
+        )
+
+    def _report(self, sent, wall, first_recorded, last_recorded, lags_ms, sender):
+        if not sent:
+            self.stdout.write(self.style.WARNING("No points found in the window."))
+            return
+
+        recorded_span = (last_recorded - first_recorded).total_seconds()
+        recorded_rate = sent / recorded_span if recorded_span > 0 else 0.0
+        lag = lags_ms.summary()
+        latency = sender.latencies_ms.summary()
+
+        self.stdout.write(self.style.SUCCESS("Replay finished"))
+        self.stdout.write(
+            f"  points={sent} ok={sender.ok} errors={sender.errors} wall={wall:.1f}s"
+        )
+        self.stdout.write(
+            f"  recorded span={recorded_span:.1f}s rate={recorded_rate:.1f} points/s"
+        )
+        self.stdout.write(
+            f"  achieved={sender.ok / wall:.1f} reports/s "
+            f"time compression={recorded_span / wall:.1f}x"
+        )
+        # Fidelity: how far behind the recorded timeline points were dispatched
+        self.stdout.write(
+            f"  late points={len(lags_ms)} "
+            + " ".join(f"lag_{name}={value:.1f}ms" for name, value in lag.items())
+        )
+        self.stdout.write(
+            "  latency ms: "
+            + " ".join(f"{name}={value:.1f}" for name, value in latency.items())
+        )
+        for key, count in sorted(
+            sender.status_counts.items(), key=lambda kv: str(kv[0])
+        ):
+            self.stdout.write(f"  {key}: {count}")
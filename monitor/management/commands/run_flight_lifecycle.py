@@ -0,0 +1,64 @@
+# monitor/management/commands/run_flight_lifecycle.py
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from monitor.services.flight_lifecycle import (
+    TERMINATION_GRACE,
+    FlightLifecycleService,
+)
+
+INTERVAL_SECONDS = 60
+
+
+class Command(BaseCommand):
+    help = (
+        "Periodic lifecycle job: activates, expires and terminates flights "
+        "from their scheduled times, with set-based updates"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=INTERVAL_SECONDS,
+            help="Seconds between runs",
+        )
+        parser.add_argument(
+            "--grace-minutes",
+            type=float,
+            default=TERMINATION_GRACE.total_seconds() / 60,
+            help="Minutes past arrival a still reporting flight stays ACTIVATED",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Run a single pass and exit"
+        )
+
+    def handle(self, *args, **options):
+        if options["interval"] <= 0:
+            raise CommandError("--interval must be positive.")
+        if options["grace_minutes"] < 0:
+            raise CommandError("--grace-minutes must not be negative.")
+
+        service = FlightLifecycleService()
+        grace = timedelta(minutes=options["grace_minutes"])
+
+        try:
+            while True:
+                started = time.perf_counter()
+                result = service.run(grace=grace)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"[{timezone.localtime(result.now):%H:%M:%S}] "
+                    f"activated={result.activated} expired={result.expired} "
+                    f"terminated={result.terminated} "
+                    f"trackings_closed={result.trackings_closed} "
+                    f"({elapsed * 1000:.0f} ms)"
+                )
+                if options["once"]:
+                    return
+                time.sleep(max(0.0, options["interval"] - elapsed))
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Lifecycle job stopped."))
@@ -1,23 +1,44 @@
 # monitor/management/commands/run_flight_simulator.py
 import json
+import multiprocessing
+import queue
+import signal
 import time
+from collections import defaultdict
 from datetime import datetime
 from http import HTTPStatus
 from typing import Dict, List, Tuple
+from uuid import UUID
 
+import numpy as np
 import requests
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
 from django.utils import timezone
 
 from common_tools.schemas.flight_instance import FlightStatusEnum
 from common_tools.schemas.tracking import SubmitTrackingSchema
-from monitor.models import FlightInstance
+from monitor.models import FlightInstance, FlightStatusTransition, Waypoint
+from monitor.services.flight_lifecycle import FlightLifecycleService
+from monitor.services.route_geometry import RouteGeometryService
 from monitor.services.tracking import TrackingService
+from monitor.simulator.checkpoint import load_checkpoint, save_checkpoint, shard_path
+from monitor.simulator.clock import SimulationClock, parse_option_datetime
+from monitor.simulator.path import FlightPath, join_points
+from monitor.simulator.performance import (
+    CRUISE_SPEED_KTS,
+    KTS_TO_MPS,
+    MIN_ENERGY,
+    energy_at,
+)
+from monitor.simulator.scheduler import PhaseTimer, TickScheduler
+from monitor.simulator.state import FlightTable, ManagedFlight
+from monitor.simulator.wind import AirborneState, WindField
 
 INTERVAL_SECONDS = 5
-CRUISE_SPEED_KTS = 80.0
-MIN_ENERGY = 20.0  # Reserve energy on landing
+CHECKPOINT_EVERY = 12  # Ticks between checkpoints (1 min at the default tick)
+SHUTDOWN_GRACE_SECONDS = 5
 
 base_url = "http://localhost:8000/api"
 
@@ -25,82 +46,436 @@ base_url = "http://localhost:8000/api"
 class Command(BaseCommand):
     help = "Flight simulator: generates Tracking for PENDING/ACTIVATED FlightInstances"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--time-scale",
+            type=float,
+            default=1.0,
+            help="Simulated seconds per wall-clock second (e.g. 60 = 1h per minute)",
+        )
+        parser.add_argument(
+            "--start",
+            type=str,
+            default=None,
+            help="Simulated start time (ISO 8601). Defaults to now.",
+        )
+        parser.add_argument(
+            "--tick",
+            type=float,
+            default=INTERVAL_SECONDS,
+            help="Wall-clock seconds between simulator ticks",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Simulator processes, each owning a shard of the flights",
+        )
+        parser.add_argument(
+            "--wind-field",
+            type=str,
+            default=None,
+            help="Directory with a gridded u/v wind field (u.npy, v.npy, axes.npz)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=str,
+            default=None,
+            help="State file to resume from and checkpoint to (one per worker)",
+        )
+        parser.add_argument(
+            "--checkpoint-every",
+            type=int,
+            default=CHECKPOINT_EVERY,
+            help="Ticks between checkpoints",
+        )
+
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS("🚁 Flight Simulator started"))
-        tracking_service = TrackingService()
 
-        ACTIVATION_WINDOW = timezone.timedelta(seconds=30)  # 30s window
+        # Resolved once so that every worker shares the same simulated timeline
+        start = parse_option_datetime(options["start"], "--start") or timezone.now()
+        workers = options["workers"]
+        if options["checkpoint_every"] < 1:
+            raise CommandError("--checkpoint-every must be at least 1.")
+        if options["checkpoint"] and options["start"] is None:
+            start = self._resume_start(options, workers) or start
 
-        while True:
+        self._wind = None
+        if options["wind_field"]:
             try:
-                now = timezone.now()
+                self._wind = WindField(options["wind_field"])
+            except (OSError, KeyError, ValueError) as e:
+                raise CommandError(f"Invalid --wind-field: {e}")
+            self.stdout.write(
+                f"Wind field: {self._wind.u.shape} (time, alt, lat, lon) grid"
+            )
+
+        if workers > 1:
+            self._run_coordinator(options, start, workers)
+        else:
+            self._run(options, start)
+
+    # -------------------------------------------------------------------------
+    # Multi-process sharding
+    # -------------------------------------------------------------------------
+    def _run_coordinator(self, options, start: datetime, workers: int):
+        """Forks one simulator per shard and aggregates their tick stats."""
+        ctx = multiprocessing.get_context("fork")
+        stats_queue = ctx.Queue()
+
+        # Children must open their own DB connections
+        connections.close_all()
+        # Common tick grid for all workers
+        origin = time.monotonic()
+
+        processes = [
+            ctx.Process(
+                target=self._run,
+                args=(options, start),
+                kwargs={
+                    "shard": (index, workers),
+                    "stats_queue": stats_queue,
+                    "origin": origin,
+                },
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        self.stdout.write(f"Coordinator: {workers} workers started")
+
+        pending_ticks: Dict[int, List[dict]] = defaultdict(list)
+        latest_tick: Dict[int, int] = {}
+        try:
+            while any(process.is_alive() for process in processes):
+                try:
+                    stats = stats_queue.get(timeout=1)
+                except queue.Empty:
+                    continue
+
+                pending_ticks[stats["tick"]].append(stats)
+                latest_tick[stats["worker"]] = stats["tick"]
+                if len(latest_tick) < workers:
+                    continue
+
+                # A worker that overran skips ticks, so flush every tick that
+                # all workers have moved past instead of waiting for a full set
+                done = min(latest_tick.values())
+                for tick in sorted(t for t in pending_ticks if t <= done):
+                    self._write_aggregate(pending_ticks.pop(tick))
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Simulator stopped"))
+        finally:
+            # Workers stop on SIGTERM and get a moment to write their last
+            # checkpoint; further interrupts must not cut that short
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            for process in processes:
+                process.terminate()
+            deadline = time.monotonic() + SHUTDOWN_GRACE_SECONDS
+            for process in processes:
+                process.join(timeout=max(0.0, deadline - time.monotonic()))
+            for process in processes:
+                if process.is_alive():
+                    process.kill()
+                process.join()
+
+    def _write_aggregate(self, worker_stats: List[dict]):
+        totals = {
+            key: sum(stats[key] for stats in worker_stats)
+            for key in (
+                "activated",
+                "updated",
+                "terminated",
+                "ok",
+                "failed",
+                "skipped",
+            )
+        }
+        slowest = max(worker_stats, key=lambda stats: stats["duration"])
+        self.stdout.write(
+            f"[TICK {worker_stats[0]['tick']}] workers={len(worker_stats)} "
+            f"ACTIVATED={totals['activated']} UPDATED={totals['updated']} "
+            f"TERMINATED={totals['terminated']} "
+            f"reports ok={totals['ok']} failed={totals['failed']} "
+            f"skipped={totals['skipped']} "
+            f"slowest=w{slowest['worker']} {slowest['duration']:.2f}s"
+        )
+
+    def _owns(self, flight_instance_id: UUID) -> bool:
+        """Deterministic shard ownership of a flight by its UUID."""
+        if self._shard is None:
+            return True
+        index, count = self._shard
+        return flight_instance_id.int % count == index
+
+    # -------------------------------------------------------------------------
+    # Simulation loop
+    # -------------------------------------------------------------------------
+    def _run(
+        self,
+        options,
+        start: datetime,
+        shard: Tuple[int, int] | None = None,
+        stats_queue=None,
+        origin: float | None = None,
+    ):
+        # Paths (and their cumulative lengths) are built once per flight
+        self._paths: Dict[UUID, FlightPath] = {}
+        self._geometry = RouteGeometryService()
+        # Progress of flights flown through the wind field
+        self._airborne: Dict[UUID, AirborneState] = {}
+        self._reports_ok = 0
+        self._reports_failed = 0
+        self._shard = shard
+        # Flights owned by this process, synced incrementally every tick
+        self._flights = FlightTable(owns=self._owns)
+        tag = f"[w{shard[0]}] " if shard else ""
+        tracking_service = TrackingService()
+
+        clock = SimulationClock(
+            start=start,
+            time_scale=options["time_scale"],
+            tick=options["tick"],
+        )
+        self.stdout.write(
+            f"{tag}Clock: start={clock.start.isoformat()} "
+            f"scale={clock.time_scale}x tick={clock.tick}s"
+        )
 
-                # TOTAL PENDINGS
-                total_pendings = FlightInstance.objects.filter(
-                    flight_status=FlightStatusEnum.PENDING.value
-                ).count()
+        ACTIVATION_WINDOW = timezone.timedelta(seconds=30)  # 30s window
+        # A tick may cover more simulated time than the window; widen it so
+        # no departure falls between two ticks.
+        activation_half_window = max(ACTIVATION_WINDOW / 2, clock.step)
+
+        checkpoint_path = None
+        if options["checkpoint"]:
+            checkpoint_path = shard_path(options["checkpoint"], shard)
+            self._restore(checkpoint_path, tag)
+
+        # Transitions missed while the simulator was down, in one bulk pass
+        self._flights.refresh()
+        activated, cancelled, terminated = self._flights.catch_up(
+            clock.now(), activation_half_window
+        )
+        for flight_id in [*self._paths, *self._airborne]:
+            if flight_id not in self._flights.flights:
+                self._paths.pop(flight_id, None)
+                self._airborne.pop(flight_id, None)
+        self.stdout.write(
+            f"{tag}Catch-up: activated={activated} cancelled={cancelled} "
+            f"terminated={terminated}"
+        )
 
-                # 1) TO BE ACTIVATED (30s window)
-                eligible_pendings = (
-                    FlightInstance.objects.select_related(
-                        "departure_vertiport", "arrival_vertiport", "route"
+        scheduler = TickScheduler(period=clock.tick, origin=origin)
+        wall_started = time.monotonic()
+        processed = 0
+
+        if shard is not None:
+            # Only the coordinator reacts to Ctrl-C; it stops workers with SIGTERM
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, self._interrupt)
+
+        try:
+            while True:
+                tick_started = time.monotonic()
+                self._timer = PhaseTimer()
+                self._tick_counts = {"activated": 0, "updated": 0, "terminated": 0}
+                reports_before = (self._reports_ok, self._reports_failed)
+
+                try:
+                    now = clock.now()
+
+                    with self._timer.phase("query"):
+                        changed = self._flights.refresh()
+
+                    counts = self._flights.counts()
+                    eligible_pendings = [
+                        fi
+                        for fi in self._flights.with_status(
+                            FlightStatusEnum.PENDING.value
+                        )
+                        if abs(fi.scheduled_departure_datetime - now)
+                        <= activation_half_window
+                    ]
+                    actives = self._flights.with_status(
+                        FlightStatusEnum.ACTIVATED.value
                     )
-                    .prefetch_related("route__route_waypoints")
-                    .filter(
-                        flight_status=FlightStatusEnum.PENDING.value,
-                        scheduled_departure_datetime__isnull=False,
-                        scheduled_arrival_datetime__isnull=False,
-                        scheduled_departure_datetime__gte=now - ACTIVATION_WINDOW / 2,
-                        scheduled_departure_datetime__lte=now + ACTIVATION_WINDOW / 2,
+
+                    self.stdout.write(
+                        f"{tag}[{now.strftime('%H:%M:%S')}] "
+                        f"TOTAL_PENDING={counts[FlightStatusEnum.PENDING.value]} "
+                        f"TO BE ACTIVATED={len(eligible_pendings)} "
+                        f"ACTIVATED={len(actives)} "
+                        f"CHANGED={changed}"
                     )
+
+                    # Process "TO BE ACTIVATED" ones
+                    for fi in eligible_pendings:
+                        self._activate_flight(fi, tracking_service)
+
+                    # Process ACTIVATED
+                    flown = self._fly_through_wind(actives, now) if self._wind else {}
+                    for fi in actives:
+                        self._update_flight(fi, now, tracking_service, flown.get(fi.id))
+
+                    wall_elapsed = time.monotonic() - wall_started
+                    self.stdout.write(
+                        f"{tag}INGEST ok={self._reports_ok} "
+                        f"failed={self._reports_failed} "
+                        f"rate={self._reports_ok / wall_elapsed:.1f} reports/s"
+                    )
+
+                except KeyboardInterrupt:
+                    self.stdout.write(self.style.WARNING(f"{tag}Simulator stopped"))
+                    break
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f"{tag}Loop error: {e}"))
+
+                busy = time.monotonic() - tick_started
+                self.stdout.write(
+                    f"{tag}TIMING tick={scheduler.tick} "
+                    f"busy={busy:.2f}s/{scheduler.period:g}s {self._timer.summary()}"
                 )
 
-                # 2) ACTIVATED (Already departed)
-                actives = (
-                    FlightInstance.objects.select_related(
-                        "departure_vertiport", "arrival_vertiport", "route"
+                ticked = scheduler.tick
+                overrun, skipped = scheduler.wait_next()
+                if overrun > 0:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"{tag}OVERRUN tick={ticked} late={overrun:.2f}s "
+                            f"skipped={skipped} "
+                            f"(total overruns={scheduler.overruns} "
+                            f"skipped={scheduler.skipped})"
+                        )
                     )
-                    .prefetch_related("route__route_waypoints")
-                    .filter(
-                        flight_status=FlightStatusEnum.ACTIVATED.value,
-                        scheduled_departure_datetime__isnull=False,
-                        scheduled_arrival_datetime__isnull=False,
+
+                # Reported even on errors so the coordinator never waits on a tick
+                if stats_queue is not None:
+                    stats_queue.put(
+                        {
+                            "worker": shard[0],
+                            "tick": ticked,
+                            **self._tick_counts,
+                            "ok": self._reports_ok - reports_before[0],
+                            "failed": self._reports_failed - reports_before[1],
+                            "duration": busy,
+                            "skipped": skipped,
+                        }
                     )
-                )
 
-                self.stdout.write(
-                    f"[{now.strftime('%H:%M:%S')}] "
-                    f"TOTAL_PENDING={total_pendings} "
-                    f"TO BE ACTIVATED={eligible_pendings.count()} "
-                    f"ACTIVATED={actives.count()}"
+                processed += 1
+                if checkpoint_path and processed % options["checkpoint_every"] == 0:
+                    self._checkpoint(checkpoint_path, clock.now(), tag)
+
+                # Simulated time follows the tick grid, including skipped ticks
+                clock.advance(1 + skipped)
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING(f"{tag}Simulator stopped"))
+
+        if checkpoint_path:
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            self._checkpoint(checkpoint_path, clock.now(), tag)
+
+    def _interrupt(self, signum, frame):
+        raise KeyboardInterrupt
+
+    def _resume_start(self, options, workers: int) -> datetime | None:
+        """Simulated time the checkpointed run would have reached by now."""
+        shard = (0, workers) if workers > 1 else None
+        checkpoint = load_checkpoint(shard_path(options["checkpoint"], shard))
+        if checkpoint is None:
+            return None
+
+        downtime = timezone.now() - checkpoint.saved_at
+        self.stdout.write(
+            f"Resuming from checkpoint of {checkpoint.saved_at.isoformat()} "
+            f"(down {downtime.total_seconds():.0f}s)"
+        )
+        return checkpoint.clock_now + downtime * options["time_scale"]
+
+    def _restore(self, path: str, tag: str):
+        checkpoint = load_checkpoint(path)
+        if checkpoint is None:
+            return
+        if checkpoint.shard != self._shard:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{tag}Checkpoint was written for shard {checkpoint.shard}; "
+                    f"starting cold."
                 )
+            )
+            return
 
-                # Process "TO BE ACTIVATED" ones
-                for fi in eligible_pendings:
-                    self._activate_flight(fi, tracking_service)
+        self._flights.restore(checkpoint.flights, checkpoint.watermark)
+        self._paths = {
+            flight_id: FlightPath(points)
+            for flight_id, points in checkpoint.paths.items()
+            if flight_id in self._flights.flights
+        }
+        self._airborne = {
+            flight_id: state
+            for flight_id, state in checkpoint.airborne.items()
+            if flight_id in self._flights.flights
+        }
+        self.stdout.write(
+            f"{tag}Restored {len(self._flights.flights)} flights and "
+            f"{len(self._paths)} paths"
+        )
 
-                # Process ACTIVATED
-                for fi in actives:
-                    self._update_flight(fi, now, tracking_service)
+    def _checkpoint(self, path: str, now: datetime, tag: str):
+        started = time.monotonic()
+        save_checkpoint(
+            path,
+            saved_at=timezone.now(),
+            clock_now=now,
+            shard=self._shard,
+            table=self._flights,
+            paths=self._paths,
+            airborne=self._airborne,
+        )
+        self.stdout.write(
+            f"{tag}CHECKPOINT flights={len(self._flights.flights)} "
+            f"{(time.monotonic() - started) * 1000:.0f}ms"
+        )
 
-            except KeyboardInterrupt:
-                self.stdout.write(self.style.WARNING("Simulator stopped"))
-                break
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"Loop error: {e}"))
+    def _post_tracking(self, payload: SubmitTrackingSchema) -> requests.Response:
+        url = f"{base_url}/tracking"
+        with self._timer.phase("send"):
+            response = requests.post(
+                url,
+                data=json.dumps(payload.model_dump(), cls=DjangoJSONEncoder),
+                headers={"Content-Type": "application/json"},
+            )
 
-            time.sleep(INTERVAL_SECONDS)
+        if response.status_code == HTTPStatus.CREATED:
+            self._reports_ok += 1
+        else:
+            self._reports_failed += 1
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                # Deleted flights never show up in the incremental refresh
+                self._flights.discard(payload.flight_instance)
+                self._paths.pop(payload.flight_instance, None)
+                self._airborne.pop(payload.flight_instance, None)
+
+        return response
 
     # -------------------------------------------------------------------------
     # Flight activation
     # -------------------------------------------------------------------------
-    def _activate_flight(self, fi: FlightInstance, tracking_service: TrackingService):
-        """Changes PENDING -> ACTIVATED and creates initial tracking at departure vertiport."""
-        dep = fi.departure_vertiport
-        arr = fi.arrival_vertiport
-
-        if not dep or not arr:
-            waypoints = fi.route.route_waypoints.order_by("sequence_order").all()
+    def _activate_flight(self, fi: ManagedFlight, tracking_service: TrackingService):
+        """Changes PENDING -> ACTIVATED and creates initial tracking.
+
+        The tracking starts at the departure vertiport.
+        """
+        if not fi.departure_vertiport_id or not fi.arrival_vertiport_id:
+            waypoints = list(
+                Waypoint.objects.filter(route_id=fi.route_id)
+                .order_by("sequence_order")
+                .values_list("vertiport_id", flat=True)
+            )
             if not waypoints:
                 self.stdout.write(
                     self.style.WARNING(
@@ -109,17 +484,22 @@ class Command(BaseCommand):
                 )
                 return
 
-            if not dep:
-                first_wp = waypoints[0]
-                dep = first_wp.vertiport
-                fi.departure_vertiport = dep
-            if not arr:
-                last_wp = waypoints.last()
-                arr = last_wp.vertiport
-                fi.arrival_vertiport = arr
+            if not fi.departure_vertiport_id:
+                fi.departure_vertiport_id = waypoints[0]
+            if not fi.arrival_vertiport_id:
+                fi.arrival_vertiport_id = waypoints[-1]
 
-            fi.save(update_fields=["departure_vertiport", "arrival_vertiport"])
+            FlightInstance.objects.filter(id=fi.id).update(
+                departure_vertiport_id=fi.departure_vertiport_id,
+                arrival_vertiport_id=fi.arrival_vertiport_id,
+                updated_at=timezone.now(),
+            )
+            self._flights.load_vertiports(
+                [fi.departure_vertiport_id, fi.arrival_vertiport_id]
+            )
 
+        dep = self._flights.vertiport(fi.departure_vertiport_id)
+        arr = self._flights.vertiport(fi.arrival_vertiport_id)
         if not dep or not arr:
             self.stdout.write(
                 self.style.WARNING(
@@ -128,11 +508,21 @@ class Command(BaseCommand):
             )
             return
 
-        # fi.flight_status = FlightStatusEnum.ACTIVATED.value
-        # fi.save(update_fields=["flight_status"])
+        # Atomic claim: only one worker can move the flight out of PENDING. It
+        # goes through the lifecycle service so the activation is audited
+        claimed = FlightLifecycleService().transition(
+            FlightInstance.objects.filter(id=fi.id),
+            FlightStatusEnum.PENDING.value,
+            FlightStatusEnum.ACTIVATED.value,
+            timezone.now(),
+            source=FlightStatusTransition.Source.TRACKING,
+        )
+        if not claimed:
+            self._flights.discard(fi.id)
+            return
+        self._flights.set_status(fi.id, FlightStatusEnum.ACTIVATED.value)
 
-        dep = fi.departure_vertiport
-        aircraft_max_energy = fi.aircraft.energy_fuel
+        aircraft_max_energy = fi.max_energy
 
         # Round to realistic precision
         lat = round(float(dep.latitude), 6)
@@ -152,15 +542,11 @@ class Command(BaseCommand):
             updated_at=None,
         )
 
-        url = f"{base_url}/tracking"
-        response = requests.post(
-            url,
-            data=json.dumps(payload.model_dump(), cls=DjangoJSONEncoder),
-            headers={"Content-Type": "application/json"},
-        )
+        response = self._post_tracking(payload)
         # tracking_service.create_or_update_tracking(payload=payload)
 
         if response.status_code == HTTPStatus.CREATED:
+            self._tick_counts["activated"] += 1
             self.stdout.write(self.style.SUCCESS(f"✅ [{fi.id}] ACTIVATED"))
 
     # -------------------------------------------------------------------------
@@ -168,11 +554,12 @@ class Command(BaseCommand):
     # -------------------------------------------------------------------------
     def _update_flight(
         self,
-        fi: FlightInstance,
+        fi: ManagedFlight,
         now: datetime,
         tracking_service: TrackingService,
+        flown: Tuple[float, float, float] | None = None,
     ):
-        aircraft_max_energy = fi.aircraft.energy_fuel
+        aircraft_max_energy = fi.max_energy
         dep_time = fi.scheduled_departure_datetime
         arr_time = fi.scheduled_arrival_datetime
         total_seconds = (arr_time - dep_time).total_seconds()
@@ -183,25 +570,30 @@ class Command(BaseCommand):
             self._terminate_flight(fi, now, tracking_service)
             return
 
-        elapsed = (now - dep_time).total_seconds()
-        progress = max(0.0, min(elapsed / total_seconds, 1.0))
+        if flown is not None:
+            # Wind-driven progress, energy and ground speed
+            progress, energy_raw, speed_kts = flown
+        else:
+            elapsed = (now - dep_time).total_seconds()
+            progress = max(0.0, min(elapsed / total_seconds, 1.0))
+            energy_raw = energy_at(aircraft_max_energy, progress)
+            speed_kts = CRUISE_SPEED_KTS
 
         if progress >= 1.0:
             self._terminate_flight(fi, now, tracking_service)
             return
 
-        path = self._build_path(fi)
-        pos = self._interpolate_path(path, progress)
+        path = self._get_path(fi)
 
-        # Monotonic decreasing energy: always decreases, never increases
-        energy_raw = aircraft_max_energy - (aircraft_max_energy - MIN_ENERGY) * progress
+        with self._timer.phase("interpolation"):
+            pos = path.interpolate(progress)
         energy = round(energy_raw, 2)  # 2 decimal places precision
 
         # Round all values to realistic sensor precision
         lat = round(pos["lat"], 6)  # GPS ~1m
         lon = round(pos["lon"], 6)
         alt = round(pos["alt"], 1)  # 10cm
-        speed = round(CRUISE_SPEED_KTS, 1)  # 0.1kt
+        speed = round(speed_kts, 1)  # 0.1kt
 
         payload = SubmitTrackingSchema(
             flight_instance=fi.id,
@@ -218,14 +610,10 @@ class Command(BaseCommand):
 
         # tracking_service.create_or_update_tracking(payload=payload)
 
-        url = f"{base_url}/tracking"
-        response = requests.post(
-            url,
-            data=json.dumps(payload.model_dump(), cls=DjangoJSONEncoder),
-            headers={"Content-Type": "application/json"},
-        )
+        response = self._post_tracking(payload)
 
         if response.status_code == HTTPStatus.CREATED:
+            self._tick_counts["updated"] += 1
             self.stdout.write(
                 f"📡 [{fi.id}] {progress:.0%} energy={energy} speed={speed}kts"
             )
@@ -235,13 +623,17 @@ class Command(BaseCommand):
     # -------------------------------------------------------------------------
     def _terminate_flight(
         self,
-        fi: FlightInstance,
+        fi: ManagedFlight,
         now: datetime,
         tracking_service: TrackingService,
     ):
-        """Final tracking at arrival vertiport, sets TERMINATED status."""
-        if fi.arrival_vertiport:
-            arr = fi.arrival_vertiport
+        """Final tracking at arrival vertiport, sets TERMINATED status.
+
+        The flight stays in the table until the report is accepted, so a
+        failed POST is retried on the next tick instead of losing the flight.
+        """
+        arr = self._flights.vertiport(fi.arrival_vertiport_id)
+        if arr:
             lat = round(float(arr.latitude), 6)
             lon = round(float(arr.longitude), 6)
             alt = round(float(arr.altitude), 1)
@@ -266,80 +658,125 @@ class Command(BaseCommand):
         # fi.flight_status = FlightStatusEnum.TERMINATED.value
         # fi.save(update_fields=["flight_status"])
 
-        url = f"{base_url}/tracking"
-        response = requests.post(
-            url,
-            data=json.dumps(payload.model_dump(), cls=DjangoJSONEncoder),
-            headers={"Content-Type": "application/json"},
-        )
+        response = self._post_tracking(payload)
 
         if response.status_code == HTTPStatus.CREATED:
+            self._paths.pop(fi.id, None)
+            self._airborne.pop(fi.id, None)
+            self._flights.set_status(fi.id, FlightStatusEnum.TERMINATED.value)
+            self._tick_counts["terminated"] += 1
             self.stdout.write(self.style.SUCCESS(f"🛬 [{fi.id}] TERMINATED"))
 
     # -------------------------------------------------------------------------
-    # Flight path geometry
+    # Wind
     # -------------------------------------------------------------------------
-    def _build_path(self, fi: FlightInstance) -> List[Tuple[float, float, float]]:
-        """Builds flight path: departure → waypoints → arrival."""
-        points: List[Tuple[float, float, float]] = []
-
-        dep = fi.departure_vertiport
-        arr = fi.arrival_vertiport
-        if not dep or not arr:
-            return [(0.0, 0.0, 1000.0)]
-
-        # Departure vertiport
-        points.append((float(dep.latitude), float(dep.longitude), float(dep.altitude)))
-
-        # Route waypoints (ordered by sequence_order)
-        if fi.route:
-            waypoints = fi.route.route_waypoints.order_by("sequence_order").all()
-            for wp in waypoints:
-                lat = (
-                    float(wp.latitude)
-                    if wp.latitude is not None
-                    else float(wp.vertiport.latitude)
-                )
-                lon = (
-                    float(wp.longitude)
-                    if wp.longitude is not None
-                    else float(wp.vertiport.longitude)
-                )
-                alt = (
-                    float(wp.altitude)
-                    if wp.altitude is not None
-                    else float(wp.vertiport.altitude)
+    def _fly_through_wind(
+        self, actives: List[ManagedFlight], now: datetime
+    ) -> Dict[UUID, Tuple[float, float, float]]:
+        """Advances every active flight by one tick of wind-affected flight.
+
+        The aircraft keeps the airspeed that would fly its path exactly on
+        schedule in calm air; the wind at its last position (sampled for all
+        flights in one vectorized call) turns that into ground speed. Energy
+        burns per second of flight, so headwinds cost reserve and tailwinds
+        save it. Returns (progress, energy, ground speed kts) per flight.
+        """
+        flights = []
+        for fi in actives:
+            duration = (
+                fi.scheduled_arrival_datetime - fi.scheduled_departure_datetime
+            ).total_seconds()
+            if duration <= 0:
+                continue  # Terminated by _update_flight
+            path = self._get_path(fi)
+            if path.total_length <= 0:
+                continue  # Nowhere to fly; stays on the schedule timeline
+            state = self._airborne.get(fi.id)
+            if state is None:
+                # First tick airborne (or after a restart): resume on schedule
+                state = self._airborne[fi.id] = self._schedule_state(
+                    fi, path, duration, now
                 )
-                points.append((lat, lon, alt))
+            flights.append((fi, path, duration, state))
 
-        # Arrival vertiport
-        points.append((float(arr.latitude), float(arr.longitude), float(arr.altitude)))
+        if not flights:
+            return {}
 
-        # Ensure minimum 2 points for interpolation
-        if len(points) == 1:
-            points.append(points[0])
-
-        return points
-
-    def _interpolate_path(
-        self, path: List[Tuple[float, float, float]], progress: float
-    ) -> Dict[str, float]:
-        """Linear interpolation across path segments."""
-        if len(path) == 1:
-            lat, lon, alt = path[0]
-            return {"lat": lat, "lon": lon, "alt": alt}
-
-        # Map global progress (0-1) to segments
-        seg_count = len(path) - 1
-        seg_pos = progress * seg_count
-        seg_idx = min(int(seg_pos), seg_count - 1)
-        seg_t = seg_pos - seg_idx
+        with self._timer.phase("interpolation"):
+            airspeeds = np.array(
+                [path.total_length / duration for _, path, duration, _ in flights]
+            )
+            ground_speeds = self._wind.ground_speeds(
+                np.array([state.lat for *_, state in flights]),
+                np.array([state.lon for *_, state in flights]),
+                np.array([state.alt for *_, state in flights]),
+                np.array(
+                    [
+                        path.track_at(self._progress(path, state))
+                        for _, path, _, state in flights
+                    ]
+                ),
+                airspeeds,
+                now,
+            )
 
-        lat1, lon1, alt1 = path[seg_idx]
-        lat2, lon2, alt2 = path[seg_idx + 1]
+            flown = {}
+            for (fi, path, duration, state), ground_speed in zip(
+                flights, ground_speeds.tolist()
+            ):
+                dt = max(0.0, (now - state.updated).total_seconds())
+                state.distance_m += ground_speed * dt
+                state.energy -= (fi.max_energy - MIN_ENERGY) / duration * dt
+                state.updated = now
+
+                progress = self._progress(path, state)
+                pos = path.interpolate(progress)
+                state.lat, state.lon, state.alt = pos["lat"], pos["lon"], pos["alt"]
+                flown[fi.id] = (progress, state.energy, ground_speed / KTS_TO_MPS)
+        return flown
+
+    def _schedule_state(
+        self, fi: ManagedFlight, path: FlightPath, duration: float, now: datetime
+    ) -> AirborneState:
+        elapsed = (now - fi.scheduled_departure_datetime).total_seconds()
+        progress = max(0.0, min(elapsed / duration, 1.0))
+        pos = path.interpolate(progress)
+        return AirborneState(
+            distance_m=progress * path.total_length,
+            energy=energy_at(fi.max_energy, progress),
+            updated=now,
+            lat=pos["lat"],
+            lon=pos["lon"],
+            alt=pos["alt"],
+        )
 
-        lat = lat1 + (lat2 - lat1) * seg_t
-        lon = lon1 + (lon2 - lon1) * seg_t
-        alt = alt1 + (alt2 - alt1) * seg_t
+    def _progress(self, path: FlightPath, state: AirborneState) -> float:
+        return min(state.distance_m / path.total_length, 1.0)
 
-        return {"lat": lat, "lon": lon, "alt": alt}
+    # -------------------------------------------------------------------------
+    # Flight path geometry
+    # -------------------------------------------------------------------------
+    def _get_path(self, fi: ManagedFlight) -> FlightPath:
+        """Cached arc-length path for the flight, built on first use."""
+        path = self._paths.get(fi.id)
+        if path is None:
+            with self._timer.phase("path"):
+                path = FlightPath(self._build_path(fi))
+            self._paths[fi.id] = path
+        return path
+
+    def _build_path(self, fi: ManagedFlight) -> List[Tuple[float, float, float]]:
+        """Builds flight path: departure → cached route points → arrival."""
+        route_points = []
+        if fi.route_id:
+            try:
+                route_points = self._geometry.get_points(fi.route_id)
+            except ValueError:
+                # Route deleted since the flight was loaded
+                route_points = []
+
+        return join_points(
+            self._flights.vertiport(fi.departure_vertiport_id),
+            self._flights.vertiport(fi.arrival_vertiport_id),
+            route_points,
+        )
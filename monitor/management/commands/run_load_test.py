@@ -0,0 +1,321 @@
+# monitor/management/commands/run_load_test.py
+import json
+import random
+import time
+from datetime import timedelta
+from typing import List, Tuple
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from monitor.models import (
+    Aircraft,
+    AircraftType,
+    FlightInstance,
+    Route,
+    Vertiport,
+    Waypoint,
+)
+from monitor.simulator.path import FlightPath
+from monitor.simulator.performance import CRUISE_SPEED_KTS, energy_at, flight_seconds
+from monitor.simulator.sender import TrackingSender
+
+BATCH_SIZE = 1000
+CENTER_LAT = -23.55  # Greater São Paulo
+CENTER_LON = -46.63
+SPREAD_DEG = 0.4  # ~40 km around the center
+CRUISE_ALTITUDE = 1100.0
+MAX_ENERGY = 100.0
+
+base_url = "http://localhost:8000/api"
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a synthetic fleet (vertiports, routes, aircraft, flights) and "
+        "drives tracking traffic against the API at a target rate"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vertiports", type=int, default=20)
+        parser.add_argument("--routes", type=int, default=50)
+        parser.add_argument("--waypoints", type=int, default=4)
+        parser.add_argument("--aircraft", type=int, default=200)
+        parser.add_argument("--flights", type=int, default=5000)
+        parser.add_argument(
+            "--schedule-hours",
+            type=float,
+            default=24.0,
+            help="Window, from now, over which departures are spread",
+        )
+        parser.add_argument(
+            "--rate", type=float, default=50.0, help="Target tracking reports/sec"
+        )
+        parser.add_argument(
+            "--duration", type=float, default=60.0, help="Traffic duration (seconds)"
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=8, help="Concurrent HTTP senders"
+        )
+        parser.add_argument("--base-url", type=str, default=base_url)
+        parser.add_argument("--prefix", type=str, default="SYN")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--cleanup",
+            action="store_true",
+            help="Delete previously generated synthetic data before generating",
+        )
+        parser.add_argument(
+            "--no-traffic",
+            action="store_true",
+            help="Only generate the fleet, do not send tracking reports",
+        )
+
+    def handle(self, *args, **options):
+        if options["vertiports"] < 2:
+            raise CommandError("--vertiports must be at least 2.")
+        for option in ("routes", "aircraft", "flights"):
+            if options[option] < 1:
+                raise CommandError(f"--{option} must be at least 1.")
+        if options["waypoints"] < 0:
+            raise CommandError("--waypoints must not be negative.")
+        if options["rate"] <= 0:
+            raise CommandError("--rate must be positive.")
+
+        rng = random.Random(options["seed"])
+        prefix = options["prefix"]
+
+        if options["cleanup"]:
+            self._cleanup(prefix)
+        elif self._exists(prefix):
+            # Generated names are deterministic and tail numbers unique
+            raise CommandError(
+                f"'{prefix}' synthetic data already exists. "
+                "Pass --cleanup to replace it or choose another --prefix."
+            )
+
+        started = time.perf_counter()
+        flights = self._generate(rng, prefix, options)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {len(flights)} flights in "
+                f"{time.perf_counter() - started:.1f}s"
+            )
+        )
+
+        if options["no_traffic"]:
+            return
+
+        self._drive_traffic(
+            rng,
+            flights,
+            url=f"{options['base_url']}/tracking",
+            rate=options["rate"],
+            duration=options["duration"],
+            concurrency=options["concurrency"],
+        )
+
+    # -------------------------------------------------------------------------
+    # Synthetic data
+    # -------------------------------------------------------------------------
+    def _exists(self, prefix: str) -> bool:
+        return (
+            Aircraft.objects.filter(tail_number__startswith=prefix).exists()
+            or Route.objects.filter(name__startswith=prefix).exists()
+            or Vertiport.objects.filter(vertiport_code__startswith=prefix).exists()
+            or AircraftType.objects.filter(name__startswith=prefix).exists()
+        )
+
+    def _cleanup(self, prefix: str):
+        # Flights, tracking and waypoints cascade from aircraft and routes
+        Aircraft.objects.filter(tail_number__startswith=prefix).delete()
+        Route.objects.filter(name__startswith=prefix).delete()
+        Vertiport.objects.filter(vertiport_code__startswith=prefix).delete()
+        AircraftType.objects.filter(name__startswith=prefix).delete()
+        self.stdout.write(f"Removed previous '{prefix}' synthetic data")
+
+    def _random_point(self, rng: random.Random) -> Tuple[float, float]:
+        return (
+            round(CENTER_LAT + rng.uniform(-SPREAD_DEG, SPREAD_DEG), 6),
+            round(CENTER_LON + rng.uniform(-SPREAD_DEG, SPREAD_DEG), 6),
+        )
+
+    @transaction.atomic
+    def _generate(
+        self, rng: random.Random, prefix: str, options
+    ) -> List[Tuple[UUID, FlightPath]]:
+        aircraft_type = AircraftType.objects.create(
+            name=f"{prefix} eVTOL",
+            manufacturer="Synthetic",
+            energy_type=AircraftType.EnergyType.ELECTRIC,
+            model_type=AircraftType.ModelType.EVTOL,
+        )
+
+        vertiports = []
+        for i in range(options["vertiports"]):
+            lat, lon = self._random_point(rng)
+            vertiports.append(
+                Vertiport(
+                    vertiport_code=f"{prefix}{i:03d}",
+                    vertiport_name=f"Synthetic vertiport {i}",
+                    latitude=lat,
+                    longitude=lon,
+                    altitude=round(rng.uniform(650.0, 850.0), 1),
+                )
+            )
+        Vertiport.objects.bulk_create(vertiports, batch_size=BATCH_SIZE)
+
+        routes = []
+        waypoints = []
+        route_meta = []
+        for i in range(options["routes"]):
+            dep, arr = rng.sample(vertiports, 2)
+            route = Route(name=f"{prefix} {dep.vertiport_code}-{arr.vertiport_code}")
+            routes.append(route)
+
+            points = [(dep.latitude, dep.longitude, dep.altitude)]
+            for _ in range(options["waypoints"]):
+                lat, lon = self._random_point(rng)
+                points.append((lat, lon, CRUISE_ALTITUDE))
+            points.append((arr.latitude, arr.longitude, arr.altitude))
+
+            for seq, (lat, lon, alt) in enumerate(points, start=1):
+                vertiport = None
+                if seq == 1:
+                    vertiport = dep
+                elif seq == len(points):
+                    vertiport = arr
+                waypoints.append(
+                    Waypoint(
+                        route=route,
+                        vertiport=vertiport,
+                        name=f"{route.name} #{seq}",
+                        latitude=lat,
+                        longitude=lon,
+                        altitude=alt,
+                        sequence_order=seq,
+                    )
+                )
+            route_meta.append((route, dep, arr, FlightPath(points)))
+        Route.objects.bulk_create(routes, batch_size=BATCH_SIZE)
+        Waypoint.objects.bulk_create(waypoints, batch_size=BATCH_SIZE)
+
+        aircrafts = [
+            Aircraft(
+                tail_number=f"{prefix}-{i:05d}",
+                aircraft_type=aircraft_type,
+                year=rng.randint(2025, 2030),
+                energy_fuel=MAX_ENERGY,
+            )
+            for i in range(options["aircraft"])
+        ]
+        Aircraft.objects.bulk_create(aircrafts, batch_size=BATCH_SIZE)
+
+        now = timezone.now()
+        window_seconds = options["schedule_hours"] * 3600
+        flight_instances = []
+        flights = []
+        for i in range(options["flights"]):
+            route, dep, arr, path = rng.choice(route_meta)
+            departure = now + timedelta(seconds=rng.uniform(0, window_seconds))
+            arrival = departure + timedelta(
+                seconds=flight_seconds(path.total_length, CRUISE_SPEED_KTS)
+            )
+            fi = FlightInstance(
+                aircraft=rng.choice(aircrafts),
+                callsign=f"{prefix}{i:05d}",
+                route=route,
+                departure_vertiport=dep,
+                arrival_vertiport=arr,
+                scheduled_departure_datetime=departure,
+                scheduled_arrival_datetime=arrival,
+            )
+            flight_instances.append(fi)
+            flights.append((fi.id, path))
+        FlightInstance.objects.bulk_create(flight_instances, batch_size=BATCH_SIZE)
+
+        self.stdout.write(
+            f"Vertiports={len(vertiports)} Routes={len(routes)} "
+            f"Waypoints={len(waypoints)} Aircraft={len(aircrafts)} "
+            f"Flights={len(flight_instances)}"
+        )
+
+        return flights
+
+    # -------------------------------------------------------------------------
+    # Tracking traffic
+    # -------------------------------------------------------------------------
+    def _drive_traffic(
+        self,
+        rng: random.Random,
+        flights: List[Tuple[UUID, FlightPath]],
+        url: str,
+        rate: float,
+        duration: float,
+        concurrency: int,
+    ):
+        if not flights:
+            raise CommandError("No flights to drive traffic for.")
+
+        self.stdout.write(
+            f"Driving {rate:.0f} reports/s for {duration:.0f}s "
+            f"with {concurrency} senders -> {url}"
+        )
+
+        interval = 1.0 / rate
+        sent = 0
+        with TrackingSender(url, concurrency=concurrency) as sender:
+            started = time.monotonic()
+            deadline = started + duration
+            while True:
+                # Absolute send times keep the rate from drifting
+                next_send = started + sent * interval
+                if next_send >= deadline:
+                    break
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+                flight_id, path = flights[sent % len(flights)]
+                progress = rng.random()
+                pos = path.interpolate(progress)
+                body = json.dumps(
+                    {
+                        "flight_instance": flight_id,
+                        "latitude": round(pos["lat"], 6),
+                        "longitude": round(pos["lon"], 6),
+                        "altitude": round(pos["alt"], 1),
+                        "speed": CRUISE_SPEED_KTS,
+                        "energy_level": round(energy_at(MAX_ENERGY, progress), 2),
+                        "active": True,
+                        "started_at": None,
+                        "finished_at": None,
+                        "updated_at": None,
+                    },
+                    cls=DjangoJSONEncoder,
+                )
+                sender.submit(body)
+                sent += 1
+        wall = time.monotonic() - started
+
+        self._report(sent, wall, sender)
+
+    def _report(self, sent: int, wall: float, sender: TrackingSender):
+        summary = sender.latencies_ms.summary()
+
+        self.stdout.write(self.style.SUCCESS("Load test finished"))
+        self.stdout.write(
+            f"  sent={sent} ok={sender.ok} errors={sender.errors} wall={wall:.1f}s"
+        )
+        self.stdout.write(f"  achieved={sender.ok / wall:.1f} reports/s")
+        self.stdout.write(
+            "  latency ms: "
+            + " ".join(f"{name}={value:.1f}" for name, value in summary.items())
+        )
+        for key, count in sorted(
+            sender.status_counts.items(), key=lambda kv: str(kv[0])
+        ):
+            self.stdout.write(f"  {key}: {count}")
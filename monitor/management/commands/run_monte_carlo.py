@@ -0,0 +1,133 @@
+# monitor/management/commands/run_monte_carlo.py
+import os
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from monitor.models import Vertiport
+from monitor.simulator.clock import parse_option_datetime
+from monitor.simulator.engine import load_schedule
+from monitor.simulator.montecarlo import (
+    DELAY_DISTRIBUTIONS,
+    Perturbation,
+    distribution,
+    peak_occupancy_distributions,
+    run_monte_carlo,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Monte Carlo capacity analysis: randomized delays, speed and energy "
+        "variations of the schedule, simulated offline across a process pool"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="window_from", type=str, default=None)
+        parser.add_argument("--to", dest="window_to", type=str, default=None)
+        parser.add_argument("--runs", type=int, default=200)
+        parser.add_argument(
+            "--processes", type=int, default=os.cpu_count() or 1, help="Pool size"
+        )
+        parser.add_argument(
+            "--delay-mean",
+            type=float,
+            default=5.0,
+            help="Mean departure slip (minutes)",
+        )
+        parser.add_argument(
+            "--delay-dist", choices=DELAY_DISTRIBUTIONS, default="exponential"
+        )
+        parser.add_argument(
+            "--speed-sd",
+            type=float,
+            default=0.05,
+            help="Relative std dev of ground speed",
+        )
+        parser.add_argument(
+            "--energy-sd",
+            type=float,
+            default=0.05,
+            help="Relative std dev of energy burn",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1 or options["processes"] < 1:
+            raise CommandError("--runs and --processes must be at least 1.")
+
+        window_from = parse_option_datetime(options["window_from"], "--from")
+        if window_from is None:
+            window_from = timezone.localtime().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        window_to = parse_option_datetime(options["window_to"], "--to") or (
+            window_from + timedelta(days=1)
+        )
+
+        flights = load_schedule(window_from, window_to)
+        if not flights:
+            raise CommandError("No scheduled flights in the window.")
+
+        perturbation = Perturbation(
+            delay_mean_s=options["delay_mean"] * 60,
+            delay_dist=options["delay_dist"],
+            speed_sd=options["speed_sd"],
+            energy_sd=options["energy_sd"],
+        )
+        self.stdout.write(
+            f"{options['runs']} runs x {len(flights)} flights on "
+            f"{options['processes']} processes ({perturbation})"
+        )
+
+        started = time.perf_counter()
+        summaries = run_monte_carlo(
+            flights,
+            perturbation,
+            runs=options["runs"],
+            processes=options["processes"],
+            seed=options["seed"],
+        )
+        wall = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Finished in {wall:.2f}s ({len(summaries) / wall:.1f} runs/s)"
+            )
+        )
+        self._write_distribution(
+            "Mean arrival delay (min)",
+            distribution([s["delay_mean_s"] / 60 for s in summaries]),
+        )
+        self._write_distribution(
+            "P95 arrival delay (min)",
+            distribution([s["delay_p95_s"] / 60 for s in summaries]),
+        )
+        self._write_distribution(
+            "Reserve breaches per run",
+            distribution([s["reserve_breaches"] for s in summaries]),
+        )
+        runs_with_breach = sum(1 for s in summaries if s["reserve_breaches"])
+        self.stdout.write(
+            f"  P(any reserve breach) = {runs_with_breach / len(summaries):.1%}"
+        )
+
+        occupancy = peak_occupancy_distributions(summaries)
+        codes = dict(
+            Vertiport.objects.filter(id__in=occupancy).values_list(
+                "id", "vertiport_code"
+            )
+        )
+        self.stdout.write("Vertiport peak pad occupancy")
+        for vertiport_id, dist in sorted(
+            occupancy.items(), key=lambda kv: codes.get(kv[0], "")
+        ):
+            self._write_distribution(f"  {codes.get(vertiport_id)}", dist)
+
+    def _write_distribution(self, label: str, dist):
+        self.stdout.write(
+            f"{label:<28}"
+            + " ".join(f"{name}={value:.1f}" for name, value in dist.items())
+        )
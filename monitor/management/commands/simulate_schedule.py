@@ -0,0 +1,126 @@
+# monitor/management/commands/simulate_schedule.py
+import json
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from monitor.models import Vertiport
+from monitor.simulator.clock import parse_option_datetime
+from monitor.simulator.engine import DiscreteEventEngine, load_schedule
+
+
+class Command(BaseCommand):
+    help = (
+        "Offline discrete-event run of the flight schedule: per-vertiport "
+        "throughput and energy statistics. Does not write telemetry."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="window_from",
+            type=str,
+            default=None,
+            help="Window start (ISO 8601). Defaults to today 00:00.",
+        )
+        parser.add_argument(
+            "--to",
+            dest="window_to",
+            type=str,
+            default=None,
+            help="Window end (ISO 8601). Defaults to one day after --from.",
+        )
+        parser.add_argument(
+            "--output", type=str, default=None, help="Also write the stats as JSON"
+        )
+
+    def handle(self, *args, **options):
+        window_from = parse_option_datetime(options["window_from"], "--from")
+        if window_from is None:
+            window_from = timezone.localtime().replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+        window_to = parse_option_datetime(options["window_to"], "--to") or (
+            window_from + timedelta(days=1)
+        )
+
+        started = time.perf_counter()
+        flights = load_schedule(window_from, window_to)
+        loaded = time.perf_counter()
+        result = DiscreteEventEngine(flights).run()
+        finished = time.perf_counter()
+
+        codes = dict(
+            Vertiport.objects.filter(id__in=result.vertiports).values_list(
+                "id", "vertiport_code"
+            )
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Simulated {result.flights} flights / {result.events} events in "
+                f"{finished - loaded:.2f}s (load {loaded - started:.2f}s)"
+            )
+        )
+        self.stdout.write(
+            f"Window {window_from.isoformat()} -> {window_to.isoformat()} "
+            f"peak airborne={result.peak_airborne} "
+            f"waypoint passages={result.waypoint_passages}"
+        )
+        self.stdout.write(
+            f"{'VERTIPORT':<12}{'DEP':>6}{'ARR':>6}{'PEAK/H':>8}{'PEAK PAD':>10}"
+            f"{'ENERGY USED':>13}{'MEAN ARR E':>12}{'MIN ARR E':>11}{'BREACH':>8}"
+        )
+
+        rows = []
+        for vertiport_id, stats in sorted(
+            result.vertiports.items(), key=lambda kv: codes.get(kv[0], "")
+        ):
+            row = {
+                "vertiport": vertiport_id,
+                "vertiport_code": codes.get(vertiport_id),
+                "departures": stats.departures,
+                "arrivals": stats.arrivals,
+                "peak_hourly_movements": stats.peak_hourly_movements,
+                "peak_occupancy": stats.peak_occupancy,
+                "energy_used": round(stats.energy_used, 2),
+                "mean_arrival_energy": (
+                    round(stats.mean_arrival_energy, 2)
+                    if stats.mean_arrival_energy is not None
+                    else None
+                ),
+                "min_arrival_energy": stats.min_arrival_energy,
+                "reserve_breaches": stats.reserve_breaches,
+            }
+            rows.append(row)
+            self.stdout.write(
+                f"{str(row['vertiport_code']):<12}{row['departures']:>6}"
+                f"{row['arrivals']:>6}{row['peak_hourly_movements']:>8}"
+                f"{row['peak_occupancy']:>10}{row['energy_used']:>13.1f}"
+                f"{self._fmt(row['mean_arrival_energy']):>12}"
+                f"{self._fmt(row['min_arrival_energy']):>11}"
+                f"{row['reserve_breaches']:>8}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as fp:
+                json.dump(
+                    {
+                        "from": window_from,
+                        "to": window_to,
+                        "flights": result.flights,
+                        "events": result.events,
+                        "peak_airborne": result.peak_airborne,
+                        "vertiports": rows,
+                    },
+                    fp,
+                    cls=DjangoJSONEncoder,
+                    indent=2,
+                )
+            self.stdout.write(f"Stats written to {options['output']}")
+
+    def _fmt(self, value: float | None) -> str:
+        return "-" if value is None else f"{value:.1f}"
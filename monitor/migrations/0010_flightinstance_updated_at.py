@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitor", "0009_alter_aircraft_energy_fuel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flightinstance",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitor", "0010_flightinstance_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="flightinstance",
+            name="callsign",
+            field=models.CharField(
+                blank=True, db_index=True, default=None, max_length=100, null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitor", "0011_alter_flightinstance_callsign"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="flightinstance",
+            index=models.Index(
+                fields=["aircraft", "scheduled_departure_datetime"],
+                name="fi_aircraft_departure_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitor", "0012_flightinstance_fi_aircraft_departure_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vertiport",
+            name="slot_capacity",
+            field=models.PositiveIntegerField(default=4),
+        ),
+    ]
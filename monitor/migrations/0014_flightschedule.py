@@ -0,0 +1,95 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:00
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitor", "0013_vertiport_slot_capacity"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="flightinstance",
+            name="schedule_occurrence",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="FlightSchedule",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                ("callsign_prefix", models.CharField(max_length=20)),
+                ("days_of_week", models.CharField(default="1234567", max_length=7)),
+                ("departure_times", models.JSONField(default=list)),
+                ("block_minutes", models.PositiveIntegerField()),
+                ("time_zone", models.CharField(default="UTC", max_length=50)),
+                ("valid_from", models.DateField()),
+                ("valid_to", models.DateField(blank=True, null=True)),
+                ("active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "aircraft",
+                    models.ManyToManyField(
+                        related_name="aircraft_flight_schedules", to="monitor.aircraft"
+                    ),
+                ),
+                (
+                    "arrival_vertiport",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="arrival_vertiport_flight_schedules",
+                        to="monitor.vertiport",
+                    ),
+                ),
+                (
+                    "departure_vertiport",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="departure_vertiport_flight_schedules",
+                        to="monitor.vertiport",
+                    ),
+                ),
+                (
+                    "route",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="route_flight_schedules",
+                        to="monitor.route",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="flightinstance",
+            name="schedule",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="schedule_flight_instances",
+                to="monitor.flightschedule",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="flightinstance",
+            constraint=models.UniqueConstraint(
+                fields=("schedule", "schedule_occurrence"),
+                name="fi_schedule_occurrence_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:00
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitor", "0014_flightschedule"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FlightStatusTransition",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "from_status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("ACTIVATED", "Activated"),
+                            ("CANCELLED", "Cancelled"),
+                            ("TERMINATED", "Terminated"),
+                        ],
+                        max_length=15,
+                    ),
+                ),
+                (
+                    "to_status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("ACTIVATED", "Activated"),
+                            ("CANCELLED", "Cancelled"),
+                            ("TERMINATED", "Terminated"),
+                        ],
+                        max_length=15,
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(
+                        choices=[("LIFECYCLE", "Lifecycle"), ("TRACKING", "Tracking")],
+                        max_length=15,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="flightinstance",
+            index=models.Index(
+                condition=models.Q(("flight_status__in", ["PENDING", "ACTIVATED"])),
+                fields=["flight_status", "scheduled_arrival_datetime"],
+                name="fi_open_arrival_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="flightstatustransition",
+            name="flight_instance",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="flight_instance_transitions",
+                to="monitor.flightinstance",
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-19 10:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("monitor", "0015_flightstatustransition"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RouteGeometry",
+            fields=[
+                (
+                    "route",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="route_geometry",
+                        serialize=False,
+                        to="monitor.route",
+                    ),
+                ),
+                ("points", models.BinaryField()),
+                ("cumulative", models.BinaryField()),
+                ("total_length", models.FloatField()),
+                ("min_latitude", models.FloatField(blank=True, null=True)),
+                ("min_longitude", models.FloatField(blank=True, null=True)),
+                ("max_latitude", models.FloatField(blank=True, null=True)),
+                ("max_longitude", models.FloatField(blank=True, null=True)),
+                (
+                    "computed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+        ),
+    ]
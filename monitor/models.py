@@ -98,6 +98,32 @@ class Waypoint(models.Model):
     sequence_order = models.PositiveIntegerField()
 
 
+class RouteGeometry(models.Model):
+    """Geometry of a route's ordered waypoints, computed once and cached.
+
+    ``points`` packs float64 (lat, lon, alt) triples and ``cumulative`` the
+    float64 distance in meters from the first point to each one.
+    """
+
+    route = models.OneToOneField(
+        Route,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="route_geometry",
+    )
+    points = models.BinaryField()
+    cumulative = models.BinaryField()
+    total_length = models.FloatField()
+    min_latitude = models.FloatField(null=True, blank=True)
+    min_longitude = models.FloatField(null=True, blank=True)
+    max_latitude = models.FloatField(null=True, blank=True)
+    max_longitude = models.FloatField(null=True, blank=True)
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Geometry of {self.route_id}"
+
+
 class Tracking(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     flight_instance = models.OneToOneField(
@@ -126,6 +152,8 @@ class Vertiport(models.Model):
     longitude = models.FloatField()
     latitude = models.FloatField()
     altitude = models.FloatField(null=True, blank=True)
+    # Departures plus arrivals the pads can handle in one slot
+    slot_capacity = models.PositiveIntegerField(default=4)
     created_at = models.DateTimeField(default=timezone.now)
 
     def __str__(self):
@@ -144,6 +172,7 @@ class FlightInstance(models.Model):
         default=None,
         null=True,
         blank=True,
+        db_index=True,
     )
     route = models.ForeignKey(
         Route,
@@ -173,6 +202,104 @@ class FlightInstance(models.Model):
     )
     scheduled_departure_datetime = models.DateTimeField(null=True, blank=True)
     scheduled_arrival_datetime = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Set on flights generated from a recurring schedule: the template and the
+    # nominal departure it was expanded for, kept even if the flight moves
+    schedule = models.ForeignKey(
+        "FlightSchedule",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="schedule_flight_instances",
+    )
+    schedule_occurrence = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Availability checks: one aircraft's flights by departure time
+            models.Index(
+                fields=["aircraft", "scheduled_departure_datetime"],
+                name="fi_aircraft_departure_idx",
+            ),
+            # Lifecycle job: only open flights, which stay few as history grows
+            models.Index(
+                fields=["flight_status", "scheduled_arrival_datetime"],
+                name="fi_open_arrival_idx",
+                condition=models.Q(
+                    flight_status__in=[FlightStatus.PENDING, FlightStatus.ACTIVATED]
+                ),
+            ),
+        ]
+        constraints = [
+            # Makes schedule generation idempotent
+            models.UniqueConstraint(
+                fields=["schedule", "schedule_occurrence"],
+                name="fi_schedule_occurrence_uniq",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.callsign} - {self.id})"
+
+
+class FlightStatusTransition(models.Model):
+    """Audit trail of FlightInstance status changes."""
+
+    class Source(models.TextChoices):
+        LIFECYCLE = "LIFECYCLE"
+        TRACKING = "TRACKING"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    flight_instance = models.ForeignKey(
+        FlightInstance,
+        on_delete=models.CASCADE,
+        related_name="flight_instance_transitions",
+    )
+    from_status = models.CharField(max_length=15, choices=FlightStatus.choices)
+    to_status = models.CharField(max_length=15, choices=FlightStatus.choices)
+    source = models.CharField(max_length=15, choices=Source)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"{self.flight_instance_id}: {self.from_status} -> {self.to_status}"
+
+
+class FlightSchedule(models.Model):
+    """Recurring flight template, expanded into FlightInstance rows."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=100)
+    callsign_prefix = models.CharField(max_length=20)
+    route = models.ForeignKey(
+        Route,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="route_flight_schedules",
+    )
+    departure_vertiport = models.ForeignKey(
+        Vertiport,
+        on_delete=models.CASCADE,
+        related_name="departure_vertiport_flight_schedules",
+    )
+    arrival_vertiport = models.ForeignKey(
+        Vertiport,
+        on_delete=models.CASCADE,
+        related_name="arrival_vertiport_flight_schedules",
+    )
+    aircraft = models.ManyToManyField(
+        Aircraft, related_name="aircraft_flight_schedules"
+    )
+    # ISO weekdays, 1 (Monday) to 7 (Sunday), e.g. "12345" for weekdays
+    days_of_week = models.CharField(max_length=7, default="1234567")
+    # Local departure times as "HH:MM"
+    departure_times = models.JSONField(default=list)
+    block_minutes = models.PositiveIntegerField()
+    time_zone = models.CharField(max_length=50, default="UTC")
+    valid_from = models.DateField()
+    valid_to = models.DateField(null=True, blank=True)
+    active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,19 @@
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+
+
+class BulkItemErrorSchema(Schema):
+    index: int  # Position of the item in the submitted list
+    detail: str
+
+
+class BulkFlightInstanceResultSchema(Schema):
+    created: int
+    ids: List[UUID]
+
+
+class BulkFlightInstanceErrorSchema(Schema):
+    detail: str
+    errors: List[BulkItemErrorSchema]
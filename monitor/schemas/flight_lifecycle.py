@@ -0,0 +1,11 @@
+from datetime import datetime
+
+from ninja import Schema
+
+
+class LifecycleRunSchema(Schema):
+    now: datetime
+    activated: int  # PENDING flights inside their scheduled block
+    expired: int  # PENDING flights whose block passed: CANCELLED
+    terminated: int  # ACTIVATED flights past arrival and silent
+    trackings_closed: int
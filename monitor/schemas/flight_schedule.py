@@ -0,0 +1,27 @@
+from datetime import date, datetime
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+
+
+class ScheduleGenerationRequestSchema(Schema):
+    date_from: date
+    date_to: date  # Inclusive, in each template's time zone
+    schedules: List[UUID] | None = None  # Every active template if omitted
+    dry_run: bool = False
+
+
+class UnassignedOccurrenceSchema(Schema):
+    schedule: UUID
+    scheduled_departure_datetime: datetime
+    detail: str
+
+
+class ScheduleGenerationResultSchema(Schema):
+    schedules: int
+    occurrences: int  # Expanded from the templates over the window
+    existing: int  # Already generated by an earlier run
+    created: int
+    dry_run: bool
+    unassigned: List[UnassignedOccurrenceSchema]  # No aircraft of the pool free
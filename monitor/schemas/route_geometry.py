@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+
+
+class BoundingBoxSchema(Schema):
+    min_latitude: float
+    min_longitude: float
+    max_latitude: float
+    max_longitude: float
+
+
+class RouteGeometrySchema(Schema):
+    route: UUID
+    points: List[List[float]]  # [lat, lon, alt] in waypoint order
+    segment_lengths: List[float]  # Meters, between consecutive points
+    total_length: float  # Meters
+    bbox: BoundingBoxSchema | None = None  # None for routes without points
+    computed_at: datetime
@@ -0,0 +1,36 @@
+from enum import Enum
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+
+
+class PlanMetricEnum(str, Enum):
+    DISTANCE = "DISTANCE"
+    ENERGY = "ENERGY"  # Distance plus a penalty per meter climbed
+
+
+class RoutePlanRequestSchema(Schema):
+    departure_vertiport: UUID
+    arrival_vertiport: UUID
+    metric: PlanMetricEnum = PlanMetricEnum.DISTANCE
+    create_route: bool = False  # Store the plan as a new Route
+    name: str | None = None  # Name of the created Route
+
+
+class PlannedWaypointSchema(Schema):
+    vertiport: UUID | None = None
+    name: str | None = None
+    latitude: float
+    longitude: float
+    altitude: float
+
+
+class RoutePlanSchema(Schema):
+    departure_vertiport: UUID
+    arrival_vertiport: UUID
+    metric: PlanMetricEnum
+    distance: float  # Meters
+    cost: float  # In the metric's unit: meters, or distance-equivalent meters
+    waypoints: List[PlannedWaypointSchema]
+    route: UUID | None = None  # Set when the plan was stored
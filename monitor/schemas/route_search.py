@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import List, Tuple
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import Field
+
+MAX_RADIUS_KM = 500.0
+
+
+class RouteSearchFilterSchema(Schema):
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    radius_km: float = Field(gt=0, le=MAX_RADIUS_KM)
+    include_flights: bool = True
+
+
+class RouteCorridorSearchSchema(Schema):
+    # [lat, lon] points of the corridor's center line, in order
+    corridor: List[Tuple[float, float]] = Field(min_length=1)
+    radius_km: float = Field(gt=0, le=MAX_RADIUS_KM)  # Half width
+    include_flights: bool = True
+
+
+class RouteSearchFlightSchema(Schema):
+    id: UUID
+    callsign: str | None = None
+    flight_status: str
+    aircraft: UUID
+    departure_vertiport: UUID | None = None
+    arrival_vertiport: UUID | None = None
+    scheduled_departure_datetime: datetime | None = None
+    scheduled_arrival_datetime: datetime | None = None
+
+
+class RouteSearchMatchSchema(Schema):
+    id: UUID
+    name: str
+    distance: float  # Meters from the search area to the route's nearest segment
+    flights: List[RouteSearchFlightSchema]  # PENDING or ACTIVATED, by departure
+
+
+class RouteSearchResultSchema(Schema):
+    radius_km: float
+    routes: List[RouteSearchMatchSchema]  # Nearest first
+    flights: int
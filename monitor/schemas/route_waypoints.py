@@ -0,0 +1,43 @@
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import RootModel
+
+from common_tools.schemas.vertiport import VertiportSchema
+
+
+class RouteWaypointsFilterSchema(Schema):
+    name: str | None = None
+    compact: bool = False  # Coordinate arrays instead of waypoint objects
+
+
+class RouteWaypointSchema(Schema):
+    id: UUID
+    name: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: float | None = None
+    sequence_order: int
+    vertiport: VertiportSchema | None = None
+
+
+class RouteWithWaypointsSchema(Schema):
+    id: UUID
+    name: str
+    waypoints: List[RouteWaypointSchema]  # By sequence_order
+
+
+class CompactRouteSchema(Schema):
+    id: UUID
+    name: str
+    # [lat, lon, alt] by sequence_order, vertiport coordinates filled in
+    coordinates: List[List[float]]
+
+
+class RouteWithWaypointsSchemaList(RootModel[List[RouteWithWaypointsSchema]]):
+    pass
+
+
+class CompactRouteSchemaList(RootModel[List[CompactRouteSchema]]):
+    pass
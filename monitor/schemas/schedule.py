@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import RootModel
+
+
+class ScheduleConflictFilterSchema(Schema):
+    aircraft: UUID | None = None
+    window_from: datetime | None = None
+    window_to: datetime | None = None
+
+
+class ScheduleConflictSchema(Schema):
+    aircraft: UUID
+    flight_instance: UUID
+    conflicts_with: UUID
+    overlap_start: datetime
+    overlap_end: datetime
+
+
+class ScheduleConflictSchemaList(RootModel[List[ScheduleConflictSchema]]):
+    pass
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import Field, RootModel
+
+SLOT_MINUTES = 15
+MAX_DELAY_MINUTES = 240
+
+
+class SlotAllocationRequestSchema(Schema):
+    window_from: datetime
+    window_to: datetime
+    slot_minutes: int = Field(default=SLOT_MINUTES, ge=1, le=24 * 60)
+    max_delay_minutes: int = Field(default=MAX_DELAY_MINUTES, ge=0)
+    apply: bool = False  # Write the shifted times back
+
+
+class SlotAssignmentSchema(Schema):
+    flight_instance: UUID
+    delay_minutes: float
+    scheduled_departure_datetime: datetime
+    scheduled_arrival_datetime: datetime
+
+
+class OccupancyBucketSchema(Schema):
+    vertiport: UUID
+    start: datetime
+    end: datetime
+    departures: int
+    arrivals: int
+    capacity: int
+
+
+class OccupancyFilterSchema(Schema):
+    vertiport: UUID | None = None
+    window_from: datetime
+    window_to: datetime
+    slot_minutes: int = Field(default=SLOT_MINUTES, ge=1, le=24 * 60)
+
+
+class OccupancySchemaList(RootModel[List[OccupancyBucketSchema]]):
+    pass
+
+
+class SlotAllocationResultSchema(Schema):
+    flights: int
+    delayed: int
+    total_delay_minutes: float
+    max_delay_minutes: float
+    applied: bool
+    unallocated: List[UUID]  # Could not be placed within the delay limit
+    assignments: List[SlotAssignmentSchema]  # Delayed flights only
+    occupancy: List[OccupancyBucketSchema]
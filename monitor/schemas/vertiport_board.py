@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+from pydantic import Field
+
+BOARD_MINUTES = 60
+
+
+class VertiportBoardFilterSchema(Schema):
+    # Inbound and outbound flights due within this many minutes
+    minutes: int = Field(default=BOARD_MINUTES, ge=1, le=24 * 60)
+
+
+class BoardAircraftSchema(Schema):
+    aircraft: UUID
+    tail_number: str | None = None
+    flight_instance: UUID  # The flight it landed with
+    landed_at: datetime | None = None  # Scheduled arrival of that flight
+
+
+class BoardFlightSchema(Schema):
+    id: UUID
+    callsign: str | None = None
+    flight_status: str
+    aircraft: UUID
+    tail_number: str | None = None
+    departure_vertiport: UUID | None = None
+    arrival_vertiport: UUID | None = None
+    scheduled_departure_datetime: datetime | None = None
+    scheduled_arrival_datetime: datetime | None = None
+    # Last tracking report, for flights in the air
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: float | None = None
+    speed: float | None = None
+    reported_at: datetime | None = None
+
+
+class VertiportBoardSchema(Schema):
+    vertiport: UUID
+    vertiport_code: str
+    minutes: int
+    generated_at: datetime
+    synced_at: datetime  # Changes made by other processes are seen up to here
+    on_ground: List[BoardAircraftSchema]  # By landing time
+    inbound: List[BoardFlightSchema]  # ACTIVATED, by scheduled arrival
+    outbound: List[BoardFlightSchema]  # PENDING, by scheduled departure
@@ -0,0 +1,29 @@
+from typing import List
+from uuid import UUID
+
+from ninja import Schema
+
+from monitor.schemas.flight_instance import BulkItemErrorSchema
+from monitor.schemas.route_waypoints import RouteWithWaypointsSchema
+
+
+class RouteWaypointItemSchema(Schema):
+    id: UUID | None = None  # Existing waypoint of the route; None creates one
+    name: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: float | None = None
+    vertiport: UUID | None = None
+
+
+class BulkWaypointResultSchema(Schema):
+    created: int
+    updated: int
+    deleted: int
+    unchanged: int
+    route: RouteWithWaypointsSchema
+
+
+class BulkWaypointErrorSchema(Schema):
+    detail: str
+    errors: List[BulkItemErrorSchema]
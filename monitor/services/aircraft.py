@@ -10,14 +10,13 @@ from common_tools.schemas.aircraft import (
     UpdateAircraftSchema,
 )
 from common_tools.schemas.aircraft_type import AircraftTypeSchema
-from monitor.models import Aircraft, AircraftType
-from monitor.services.aircraft_type import AircraftTypeService
+from monitor.models import Aircraft
+from monitor.services import reference_cache
+from monitor.services.loader import BatchLoader
 
 
 class AircraftService:
     def get_aircrafts(self, filters: AircraftFilterSchema) -> AircraftSchemaList:
-        aircraft_type_service = AircraftTypeService()
-
         queryset = Aircraft.objects.all()
 
         if filters.id is not None:
@@ -29,11 +28,11 @@ class AircraftService:
         if filters.year is not None:
             queryset = queryset.filter(year=filters.year)
 
+        aircrafts = BatchLoader().attach(list(queryset), "aircraft_type")
+
         aircraft_schema_list = []
-        for aircraft in queryset:
-            aircraft_type = aircraft_type_service.get_aircraft_type_by_id(
-                aircraft.aircraft_type.id
-            )
+        for aircraft in aircrafts:
+            aircraft_type = aircraft.aircraft_type
             aircraft_schema_list.append(
                 AircraftSchema(
                     id=aircraft.id,
@@ -53,7 +52,7 @@ class AircraftService:
         return AircraftSchemaList(root=aircraft_schema_list)
 
     def create_aircraft(self, payload: SubmitAircraftSchema) -> AircraftSchema:
-        if not AircraftType.objects.filter(id=payload.aircraft_type).exists():
+        if reference_cache.aircraft_types.get("id", payload.aircraft_type) is None:
             raise ValueError("Aircraft type not found. Unable to create aircraft.")
 
         data = payload.model_dump()
@@ -77,13 +76,12 @@ class AircraftService:
         update_data = payload.model_dump(exclude_unset=True)
 
         if "aircraft_type" in update_data:
-            try:
-                aircraft_type = AircraftType.objects.get(
-                    id=update_data["aircraft_type"]
-                )
-                aircraft.aircraft_type = aircraft_type
-            except ObjectDoesNotExist:
+            aircraft_type = reference_cache.aircraft_types.get(
+                "id", update_data["aircraft_type"]
+            )
+            if aircraft_type is None:
                 raise ValueError("Aircraft type not found. Unable to update aircraft.")
+            aircraft.aircraft_type = aircraft_type
             del update_data["aircraft_type"]
 
         for attr, value in update_data.items():
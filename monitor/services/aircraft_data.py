@@ -7,6 +7,8 @@ from common_tools.schemas.aircraft_data import (
 )
 from common_tools.schemas.flight_instance import FlightInstanceSchema
 from monitor.models import AircraftData
+from monitor.services.flight_instance import FlightInstanceService
+from monitor.services.loader import BatchLoader
 
 
 class AircraftDataService:
@@ -14,13 +16,7 @@ class AircraftDataService:
         self, filters: AircraftDataFilterSchema
     ) -> AircraftDataSchemaList:
 
-        queryset = AircraftData.objects.select_related(
-            "flight_instance",
-            "flight_instance__aircraft",
-            "flight_instance__route",
-            "flight_instance__departure_vertiport",
-            "flight_instance__arrival_vertiport",
-        ).all()
+        queryset = AircraftData.objects.all()
 
         if filters.id is not None:
             queryset = queryset.filter(id=filters.id)
@@ -46,12 +42,23 @@ class AircraftDataService:
 
         queryset = queryset.order_by("created_at")
 
+        loader = BatchLoader()
+        points = loader.attach(list(queryset), "flight_instance")
+        fis = {
+            point.flight_instance_id: point.flight_instance
+            for point in points
+            if point.flight_instance_id is not None
+        }
+        FlightInstanceService().load_related(list(fis.values()), loader)
+        # A flight has many history points: serialized once
+        fi_schemas = {
+            fi_id: FlightInstanceSchema.model_validate(fi) for fi_id, fi in fis.items()
+        }
+
         schema_list = [
             AircraftDataSchema(
                 id=aircraft_data.id,
-                flight_instance=FlightInstanceSchema.model_validate(
-                    aircraft_data.flight_instance
-                ),
+                flight_instance=fi_schemas.get(aircraft_data.flight_instance_id),
                 latitude=aircraft_data.latitude,
                 longitude=aircraft_data.longitude,
                 altitude=aircraft_data.altitude,
@@ -60,7 +67,7 @@ class AircraftDataService:
                 created_at=aircraft_data.created_at,
                 updated_at=getattr(aircraft_data, "updated_at", None),
             )
-            for aircraft_data in queryset
+            for aircraft_data in points
         ]
 
         return AircraftDataSchemaList(root=schema_list)
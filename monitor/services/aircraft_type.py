@@ -10,11 +10,12 @@ from common_tools.schemas.aircraft_type import (
     UpdateAircraftTypeSchema,
 )
 from monitor.models import AircraftType
+from monitor.services import reference_cache
 
 
 class AircraftTypeService:
     def get_aircraft_type_by_id(self, id: UUID):
-        aircraft_type = AircraftType.objects.filter(id=id).first()
+        aircraft_type = reference_cache.aircraft_types.get("id", id)
 
         return aircraft_type
 
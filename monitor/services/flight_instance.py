@@ -1,10 +1,13 @@
+from typing import List
 from uuid import UUID
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 
 from common_tools.schemas.aircraft import AircraftSchema
 from common_tools.schemas.flight_instance import (
     FlightInstanceFilterSchema,
+    FlightStatusEnum,
     FlightInstanceSchema,
     FlightInstanceSchemaList,
     SubmitFlightInstance,
@@ -12,19 +15,36 @@ from common_tools.schemas.flight_instance import (
 )
 from common_tools.schemas.route import RouteSchema
 from common_tools.schemas.vertiport import VertiportSchema
-from monitor.models import Aircraft, FlightInstance, Route, Vertiport
+from monitor.models import FlightInstance
+from monitor.schemas.flight_instance import (
+    BulkFlightInstanceResultSchema,
+    BulkItemErrorSchema,
+)
+from monitor.services import reference_cache, vertiport_board
+from monitor.services.loader import BatchLoader
+from monitor.services.schedule import ScheduleValidationService
+
+BULK_BATCH_SIZE = 1000
+
+
+class BulkValidationError(ValueError):
+    """Raised when any item of a bulk request is invalid; nothing is written."""
+
+    def __init__(self, errors: List[BulkItemErrorSchema]):
+        super().__init__(
+            f"{len(errors)} invalid flight instance(s). No flight instance was created."
+        )
+        self.errors = errors
 
 
 class FlightInstanceService:
+    def __init__(self):
+        self.schedule = ScheduleValidationService()
+
     def get_flight_instances(
         self, filters: FlightInstanceFilterSchema
     ) -> FlightInstanceSchemaList:
-        queryset = FlightInstance.objects.select_related(
-            "aircraft",
-            "route",
-            "departure_vertiport",
-            "arrival_vertiport",
-        ).all()
+        queryset = FlightInstance.objects.all()
 
         if filters.id is not None:
             queryset = queryset.filter(id=filters.id)
@@ -45,8 +65,10 @@ class FlightInstanceService:
                 scheduled_arrival_datetime=filters.scheduled_arrival_datetime
             )
 
+        fis = self.load_related(list(queryset), BatchLoader())
+
         fi_schema_list = []
-        for fi in queryset:
+        for fi in fis:
             fi_schema_list.append(
                 FlightInstanceSchema(
                     id=fi.id,
@@ -71,37 +93,58 @@ class FlightInstanceService:
 
         return FlightInstanceSchemaList(root=fi_schema_list)
 
-    def _get_fk_or_error(self, model, pk, not_found_message: str):
+    def load_related(
+        self, fis: List[FlightInstance], loader: BatchLoader
+    ) -> List[FlightInstance]:
+        """Fills the relations FlightInstanceSchema reads, one query per model."""
+        loader.attach(
+            fis, "aircraft", "route", "departure_vertiport", "arrival_vertiport"
+        )
+        loader.attach([fi.aircraft for fi in fis], "aircraft_type")
+        return fis
+
+    def _get_fk_or_error(
+        self, cache: reference_cache.ReferenceCache, pk, not_found_message: str
+    ):
         if pk is None:
             return None
-        try:
-            return model.objects.get(id=pk)
-        except ObjectDoesNotExist:
+        row = cache.get("id", pk)
+        if row is None:
             raise ValueError(not_found_message)
+        return row
 
     def create_flight_instance(
         self, payload: SubmitFlightInstance
     ) -> FlightInstanceSchema:
         # Validates mandatory FK
         aircraft = self._get_fk_or_error(
-            Aircraft,
+            reference_cache.aircrafts,
             payload.aircraft,
             "Aircraft not found. Unable to create FlightInstance.",
         )
         route = self._get_fk_or_error(
-            Route, payload.route, "Route not found. Unable to create FlightInstance."
+            reference_cache.routes,
+            payload.route,
+            "Route not found. Unable to create FlightInstance.",
         )
         departure_vertiport = self._get_fk_or_error(
-            Vertiport,
+            reference_cache.vertiports,
             payload.departure_vertiport,
             "Departure vertiport not found. Unable to create FlightInstance.",
         )
         arrival_vertiport = self._get_fk_or_error(
-            Vertiport,
+            reference_cache.vertiports,
             payload.arrival_vertiport,
             "Arrival vertiport not found. Unable to create FlightInstance.",
         )
 
+        if payload.flight_status != FlightStatusEnum.CANCELLED:
+            self.schedule.check_availability(
+                aircraft.id,
+                payload.scheduled_departure_datetime,
+                payload.scheduled_arrival_datetime,
+            )
+
         data = payload.model_dump()
         # Replaces UUIDs for instances
         data["aircraft"] = aircraft
@@ -110,9 +153,97 @@ class FlightInstanceService:
         data["arrival_vertiport"] = arrival_vertiport
 
         fi = FlightInstance.objects.create(**data)
+        vertiport_board.notify_flights([fi])
 
         return FlightInstanceSchema.model_validate(fi)
 
+    def bulk_create_flight_instances(
+        self, payloads: List[SubmitFlightInstance]
+    ) -> BulkFlightInstanceResultSchema:
+        """Creates all flight instances or none.
+
+        Referenced rows come from the reference cache, with one ``in_bulk``
+        query per model for the misses, and every item is validated before
+        anything is written; the inserts then run as batched ``bulk_create``
+        calls in a single transaction.
+        """
+        aircrafts = reference_cache.aircrafts.get_many(p.aircraft for p in payloads)
+        routes = reference_cache.routes.get_many(p.route for p in payloads)
+        vertiports = reference_cache.vertiports.get_many(
+            {
+                pk
+                for p in payloads
+                for pk in (p.departure_vertiport, p.arrival_vertiport)
+                if pk is not None
+            }
+        )
+
+        # Items with unknown references are reported for those alone
+        conflicts = self.schedule.batch_conflicts(
+            [
+                (
+                    (
+                        payload.aircraft
+                        if payload.aircraft in aircrafts
+                        and payload.flight_status != FlightStatusEnum.CANCELLED
+                        else None
+                    ),
+                    payload.scheduled_departure_datetime,
+                    payload.scheduled_arrival_datetime,
+                )
+                for payload in payloads
+            ]
+        )
+
+        errors = []
+        fis = []
+        for index, payload in enumerate(payloads):
+            messages = []
+            if payload.aircraft not in aircrafts:
+                messages.append("Aircraft not found.")
+            if payload.route is not None and payload.route not in routes:
+                messages.append("Route not found.")
+            if (
+                payload.departure_vertiport is not None
+                and payload.departure_vertiport not in vertiports
+            ):
+                messages.append("Departure vertiport not found.")
+            if (
+                payload.arrival_vertiport is not None
+                and payload.arrival_vertiport not in vertiports
+            ):
+                messages.append("Arrival vertiport not found.")
+            if index in conflicts:
+                messages.append(conflicts[index])
+
+            if messages:
+                errors.append(
+                    BulkItemErrorSchema(
+                        index=index,
+                        detail=" ".join(messages) + " Unable to create FlightInstance.",
+                    )
+                )
+                continue
+
+            data = payload.model_dump()
+            # Replaces UUIDs for instances
+            data["aircraft"] = aircrafts[payload.aircraft]
+            data["route"] = routes.get(payload.route)
+            data["departure_vertiport"] = vertiports.get(payload.departure_vertiport)
+            data["arrival_vertiport"] = vertiports.get(payload.arrival_vertiport)
+            fis.append(FlightInstance(**data))
+
+        if errors:
+            raise BulkValidationError(errors)
+
+        with transaction.atomic():
+            FlightInstance.objects.bulk_create(fis, batch_size=BULK_BATCH_SIZE)
+        vertiport_board.notify_flights(fis)
+
+        return BulkFlightInstanceResultSchema(
+            created=len(fis), ids=[fi.id for fi in fis]
+        )
+
     def update_flight_instance(
         self, flight_instance_id: UUID, payload: UpdateFlightInstance
     ) -> FlightInstanceSchema:
@@ -122,10 +253,19 @@ class FlightInstanceService:
             raise ValueError("FlightInstance not found. Unable to update.")
 
         update_data = payload.model_dump(exclude_unset=True)
+        reschedules = bool(
+            update_data.keys()
+            & {
+                "aircraft",
+                "flight_status",
+                "scheduled_departure_datetime",
+                "scheduled_arrival_datetime",
+            }
+        )
 
         if "aircraft" in update_data:
             fi.aircraft = self._get_fk_or_error(
-                Aircraft,
+                reference_cache.aircrafts,
                 update_data["aircraft"],
                 "Aircraft not found. Unable to update FlightInstance.",
             )
@@ -133,7 +273,7 @@ class FlightInstanceService:
 
         if "route" in update_data:
             fi.route = self._get_fk_or_error(
-                Route,
+                reference_cache.routes,
                 update_data["route"],
                 "Route not found. Unable to update FlightInstance.",
             )
@@ -141,7 +281,7 @@ class FlightInstanceService:
 
         if "departure_vertiport" in update_data:
             fi.departure_vertiport = self._get_fk_or_error(
-                Vertiport,
+                reference_cache.vertiports,
                 update_data["departure_vertiport"],
                 "Departure vertiport not found. Unable to update FlightInstance.",
             )
@@ -149,7 +289,7 @@ class FlightInstanceService:
 
         if "arrival_vertiport" in update_data:
             fi.arrival_vertiport = self._get_fk_or_error(
-                Vertiport,
+                reference_cache.vertiports,
                 update_data["arrival_vertiport"],
                 "Arrival vertiport not found. Unable to update FlightInstance.",
             )
@@ -158,7 +298,16 @@ class FlightInstanceService:
         for attr, value in update_data.items():
             setattr(fi, attr, value)
 
+        if reschedules and fi.flight_status != FlightStatusEnum.CANCELLED:
+            self.schedule.check_availability(
+                fi.aircraft_id,
+                fi.scheduled_departure_datetime,
+                fi.scheduled_arrival_datetime,
+                exclude_id=fi.id,
+            )
+
         fi.save()
+        vertiport_board.notify_flights([fi])
 
         return FlightInstanceSchema.model_validate(fi)
 
@@ -169,3 +318,4 @@ class FlightInstanceService:
             raise ValueError("FlightInstance not found. Unable to delete.")
 
         fi.delete()
+        vertiport_board.forget_flight(flight_instance_id)
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+from typing import List
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import FlightInstance, FlightStatusTransition, Tracking
+from monitor.schemas.flight_lifecycle import LifecycleRunSchema
+from monitor.services import vertiport_board
+
+BATCH_SIZE = 1000
+# Telemetry keeps a late flight ACTIVATED this long past its arrival
+TERMINATION_GRACE = timedelta(minutes=15)
+
+
+class FlightLifecycleService:
+    """Moves flights through their statuses from the schedule alone.
+
+    PENDING flights are activated once their scheduled block starts and
+    expired (CANCELLED) if it ends before they were ever activated;
+    ACTIVATED flights are terminated after their arrival unless they still
+    report. Each transition runs per batch as one locking SELECT of ids, one
+    UPDATE guarded by the expected status and one INSERT of audit rows.
+    """
+
+    def transition(
+        self,
+        queryset: QuerySet,
+        from_status: str,
+        to_status: str,
+        now: datetime,
+        source: str = FlightStatusTransition.Source.LIFECYCLE,
+    ) -> List[UUID]:
+        """Moves the flights of the queryset still in from_status, audited.
+
+        Every writer that changes statuses in bulk goes through here, so each
+        change leaves a FlightStatusTransition row. Rows locked by another
+        transaction are skipped. Returns the ids that moved.
+        """
+        moved: List[UUID] = []
+        while True:
+            with transaction.atomic():
+                ids = list(
+                    queryset.filter(flight_status=from_status)
+                    .select_for_update(skip_locked=True)
+                    .values_list("id", flat=True)[:BATCH_SIZE]
+                )
+                if not ids:
+                    return moved
+
+                FlightInstance.objects.filter(
+                    id__in=ids, flight_status=from_status
+                ).update(flight_status=to_status, updated_at=timezone.now())
+                FlightStatusTransition.objects.bulk_create(
+                    [
+                        FlightStatusTransition(
+                            flight_instance_id=flight_instance_id,
+                            from_status=from_status,
+                            to_status=to_status,
+                            source=source,
+                            created_at=now,
+                        )
+                        for flight_instance_id in ids
+                    ]
+                )
+            moved.extend(ids)
+
+    def run(
+        self, now: datetime | None = None, grace: timedelta = TERMINATION_GRACE
+    ) -> LifecycleRunSchema:
+        now = now or timezone.now()
+        open_flights = FlightInstance.objects.filter(
+            scheduled_departure_datetime__isnull=False,
+            scheduled_arrival_datetime__isnull=False,
+        )
+
+        # Expired first so a missed block is not activated on the way
+        expired = self.transition(
+            open_flights.filter(scheduled_arrival_datetime__lte=now),
+            FlightStatusEnum.PENDING.value,
+            FlightStatusEnum.CANCELLED.value,
+            now,
+        )
+        activated = self.transition(
+            open_flights.filter(
+                scheduled_departure_datetime__lte=now,
+                scheduled_arrival_datetime__gt=now,
+            ),
+            FlightStatusEnum.PENDING.value,
+            FlightStatusEnum.ACTIVATED.value,
+            now,
+        )
+        reporting = Tracking.objects.filter(
+            flight_instance_id=OuterRef("pk"),
+            active=True,
+            updated_at__gt=now - grace,
+        )
+        terminated = self.transition(
+            open_flights.filter(scheduled_arrival_datetime__lte=now - grace).exclude(
+                Exists(reporting)
+            ),
+            FlightStatusEnum.ACTIVATED.value,
+            FlightStatusEnum.TERMINATED.value,
+            now,
+        )
+
+        trackings_closed = 0
+        for start in range(0, len(terminated), BATCH_SIZE):
+            trackings_closed += Tracking.objects.filter(
+                flight_instance_id__in=terminated[start : start + BATCH_SIZE],
+                active=True,
+            ).update(active=False, finished_at=now, updated_at=timezone.now())
+
+        vertiport_board.refresh_flights(expired + activated + terminated)
+
+        return LifecycleRunSchema(
+            now=now,
+            activated=len(activated),
+            expired=len(expired),
+            terminated=len(terminated),
+            trackings_closed=trackings_closed,
+        )
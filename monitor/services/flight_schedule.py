@@ -0,0 +1,256 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from typing import Dict, Iterable, Iterator, List, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.db import transaction
+from django.db.models import Q
+
+from monitor.models import FlightInstance, FlightSchedule
+from monitor.schemas.flight_schedule import (
+    ScheduleGenerationRequestSchema,
+    ScheduleGenerationResultSchema,
+    UnassignedOccurrenceSchema,
+)
+from monitor.services.schedule import ScheduleValidationService
+
+BATCH_SIZE = 1000
+# How far back an aircraft's last arrival is looked up to know where it is
+POSITION_LOOKBACK = timedelta(days=1)
+
+# (departure, arrival, arrival vertiport) of one flight
+Booking = Tuple[datetime, datetime, UUID | None]
+
+
+def _departure(booking: Booking) -> datetime:
+    return booking[0]
+
+
+class AircraftRoster:
+    """Bookings of each aircraft, sorted by departure, to find free aircraft."""
+
+    def __init__(self, bookings: Iterable[Tuple[UUID, datetime, datetime, UUID]]):
+        self.bookings: Dict[UUID, List[Booking]] = defaultdict(list)
+        for aircraft_id, departure, arrival, vertiport_id in bookings:
+            self.bookings[aircraft_id].append((departure, arrival, vertiport_id))
+        for flights in self.bookings.values():
+            flights.sort(key=_departure)
+
+    def _previous(
+        self, aircraft_id: UUID, departure: datetime, arrival: datetime
+    ) -> Tuple[bool, Booking | None]:
+        """Whether the aircraft is free, and its last flight before then."""
+        flights = self.bookings[aircraft_id]
+        # Flights from this index on depart once the new one has landed
+        index = bisect_left(flights, arrival, key=_departure)
+        previous = flights[index - 1] if index else None
+        return previous is None or previous[1] <= departure, previous
+
+    def pick(
+        self,
+        pool: List[UUID],
+        departure: datetime,
+        arrival: datetime,
+        vertiport_id: UUID,
+    ) -> UUID | None:
+        """A free aircraft of the pool, preferring one parked at the vertiport."""
+        fallback = None
+        for aircraft_id in pool:
+            free, previous = self._previous(aircraft_id, departure, arrival)
+            if not free:
+                continue
+            if previous is not None and previous[2] == vertiport_id:
+                return aircraft_id
+            if fallback is None:
+                fallback = aircraft_id
+        return fallback
+
+    def book(self, aircraft_id: UUID, booking: Booking):
+        insort(self.bookings[aircraft_id], booking, key=_departure)
+
+
+class FlightScheduleService:
+    def __init__(self):
+        self.schedule = ScheduleValidationService()
+
+    def _expand(
+        self, schedule: FlightSchedule, date_from: date, date_to: date
+    ) -> Iterator[datetime]:
+        """UTC departures of the template on its days within the window."""
+        try:
+            zone = ZoneInfo(schedule.time_zone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(
+                f"FlightSchedule {schedule.name} has an unknown time zone "
+                f"{schedule.time_zone!r}."
+            )
+        try:
+            times = sorted(time.fromisoformat(t) for t in schedule.departure_times)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"FlightSchedule {schedule.name} departure times must be 'HH:MM'."
+            )
+        weekdays = {int(d) for d in schedule.days_of_week if d in "1234567"}
+
+        day = max(date_from, schedule.valid_from)
+        last = min(date_to, schedule.valid_to) if schedule.valid_to else date_to
+        while day <= last:
+            if day.isoweekday() in weekdays:
+                for departure in times:
+                    yield datetime.combine(day, departure, tzinfo=zone).astimezone(
+                        dt_timezone.utc
+                    )
+            day += timedelta(days=1)
+
+    def generate(
+        self, payload: ScheduleGenerationRequestSchema
+    ) -> ScheduleGenerationResultSchema:
+        """Expands the templates into FlightInstance rows for the window.
+
+        Safe to re-run: occurrences already generated are skipped, found
+        with one query. Runs over the same templates take their rows' locks
+        and so run one after the other, each seeing the flights of the
+        last; the unique (schedule, occurrence) constraint backs that up
+        against other writers, and rows it skips are not counted as
+        created. Each occurrence
+        takes a free aircraft of its template's pool, preferring one that
+        landed at the departure vertiport, so shuttles ping-pong instead of
+        double-booking. New flights are written with batched bulk_create.
+        """
+        if payload.date_to < payload.date_from:
+            raise ValueError("date_to must not be before date_from.")
+
+        with transaction.atomic():
+            return self._generate(payload)
+
+    def _generate(
+        self, payload: ScheduleGenerationRequestSchema
+    ) -> ScheduleGenerationResultSchema:
+        queryset = (
+            FlightSchedule.objects.filter(active=True, valid_from__lte=payload.date_to)
+            .filter(Q(valid_to__isnull=True) | Q(valid_to__gte=payload.date_from))
+            .prefetch_related("aircraft")
+            .order_by("id")
+            .select_for_update()
+        )
+        if payload.schedules is not None:
+            queryset = queryset.filter(id__in=payload.schedules)
+        schedules = list(queryset)
+
+        occurrences = [
+            (departure, schedule)
+            for schedule in schedules
+            for departure in self._expand(schedule, payload.date_from, payload.date_to)
+        ]
+        if not occurrences:
+            return ScheduleGenerationResultSchema(
+                schedules=len(schedules),
+                occurrences=0,
+                existing=0,
+                created=0,
+                dry_run=payload.dry_run,
+                unassigned=[],
+            )
+
+        first = min(departure for departure, _ in occurrences)
+        last = max(departure for departure, _ in occurrences)
+        existing = set(
+            FlightInstance.objects.filter(
+                schedule__in=schedules,
+                schedule_occurrence__gte=first,
+                schedule_occurrence__lte=last,
+            ).values_list("schedule_id", "schedule_occurrence")
+        )
+        pending = sorted(
+            (
+                (departure, schedule)
+                for departure, schedule in occurrences
+                if (schedule.id, departure) not in existing
+            ),
+            key=lambda occurrence: (occurrence[0], str(occurrence[1].id)),
+        )
+
+        pools = {
+            schedule.id: sorted((a.id for a in schedule.aircraft.all()), key=str)
+            for schedule in schedules
+        }
+        longest = max(schedule.block_minutes for schedule in schedules)
+        roster = AircraftRoster(
+            self.schedule._scheduled()
+            .filter(
+                aircraft_id__in={pk for pool in pools.values() for pk in pool},
+                scheduled_departure_datetime__lt=last + timedelta(minutes=longest),
+                scheduled_arrival_datetime__gt=first - POSITION_LOOKBACK,
+            )
+            .values_list(
+                "aircraft_id",
+                "scheduled_departure_datetime",
+                "scheduled_arrival_datetime",
+                "arrival_vertiport_id",
+            )
+        )
+
+        fis = []
+        unassigned = []
+        for departure, schedule in pending:
+            arrival = departure + timedelta(minutes=schedule.block_minutes)
+            aircraft_id = roster.pick(
+                pools[schedule.id], departure, arrival, schedule.departure_vertiport_id
+            )
+            if aircraft_id is None:
+                unassigned.append(
+                    UnassignedOccurrenceSchema(
+                        schedule=schedule.id,
+                        scheduled_departure_datetime=departure,
+                        detail=(
+                            "Every aircraft of the pool is booked at this time."
+                            if pools[schedule.id]
+                            else "The schedule has no aircraft."
+                        ),
+                    )
+                )
+                continue
+
+            roster.book(
+                aircraft_id, (departure, arrival, schedule.arrival_vertiport_id)
+            )
+            local = departure.astimezone(ZoneInfo(schedule.time_zone))
+            fis.append(
+                FlightInstance(
+                    aircraft_id=aircraft_id,
+                    callsign=f"{schedule.callsign_prefix}{local:%m%d%H%M}",
+                    route_id=schedule.route_id,
+                    departure_vertiport_id=schedule.departure_vertiport_id,
+                    arrival_vertiport_id=schedule.arrival_vertiport_id,
+                    scheduled_departure_datetime=departure,
+                    scheduled_arrival_datetime=arrival,
+                    schedule=schedule,
+                    schedule_occurrence=departure,
+                )
+            )
+
+        created = len(fis)
+        if not payload.dry_run:
+            FlightInstance.objects.bulk_create(
+                fis, batch_size=BATCH_SIZE, ignore_conflicts=True
+            )
+            # Ids are set before the insert: only the rows written have them
+            ids = [fi.id for fi in fis]
+            created = sum(
+                FlightInstance.objects.filter(
+                    id__in=ids[start : start + BATCH_SIZE]
+                ).count()
+                for start in range(0, len(ids), BATCH_SIZE)
+            )
+
+        return ScheduleGenerationResultSchema(
+            schedules=len(schedules),
+            occurrences=len(occurrences),
+            existing=len(occurrences) - len(pending) + len(fis) - created,
+            created=created,
+            dry_run=payload.dry_run,
+            unassigned=unassigned,
+        )
@@ -0,0 +1,48 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Type
+
+from django.db.models import Model
+
+
+class BatchLoader:
+    """Per-request loader of related rows: one ``in_bulk`` query per model.
+
+    ``attach`` collects the foreign key ids of a list of objects and fills
+    their related-object caches, so reading ``waypoint.route`` afterwards
+    costs no query. Rows already fetched in the request are not fetched
+    again, and foreign keys to the same model share a single query.
+    """
+
+    def __init__(self):
+        self._rows: Dict[Type[Model], Dict[Any, Model]] = defaultdict(dict)
+
+    def load(self, model: Type[Model], ids: Iterable[Any]) -> Dict[Any, Model]:
+        rows = self._rows[model]
+        missing = {pk for pk in ids if pk is not None and pk not in rows}
+        if missing:
+            rows.update(model.objects.in_bulk(missing))
+        return rows
+
+    def attach(self, objects: List[Model], *fields: str) -> List[Model]:
+        if not objects:
+            return objects
+
+        relations = [objects[0]._meta.get_field(name) for name in fields]
+        ids = defaultdict(set)
+        for field in relations:
+            ids[field.related_model].update(
+                getattr(obj, field.attname) for obj in objects
+            )
+        for model, pks in ids.items():
+            self.load(model, pks)
+
+        for field in relations:
+            rows = self._rows[field.related_model]
+            for obj in objects:
+                pk = getattr(obj, field.attname)
+                if pk is None:
+                    field.set_cached_value(obj, None)
+                elif pk in rows:
+                    # Rows deleted meanwhile are left to the lazy lookup
+                    field.set_cached_value(obj, rows[pk])
+        return objects
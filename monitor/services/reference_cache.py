@@ -0,0 +1,236 @@
+import copy
+import threading
+import time
+from typing import Any, Dict, Iterable, Tuple, Type
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+from monitor.models import Aircraft, AircraftType, Route, Vertiport
+
+# Bounds how stale a process can be when no shared backend carries the
+# generations, and how long the backend keeps rows
+TTL_SECONDS = getattr(settings, "REFERENCE_CACHE_TTL_SECONDS", 300.0)
+# How often a process re-reads the shared generation of a model
+GENERATION_CHECK_SECONDS = 1.0
+
+
+def _backend():
+    alias = getattr(settings, "REFERENCE_CACHE_ALIAS", None)
+    return caches[alias] if alias else None
+
+
+class ReferenceCache:
+    """Read-through cache of one reference model, by id and natural keys.
+
+    Rows live in process memory, keyed by ``(field, value)``. A generation
+    counter is bumped whenever a row of the model (or of a model it
+    ``select_related``\\ s) is saved or deleted, which drops every cached
+    row. With ``REFERENCE_CACHE_ALIAS`` set, the generations and rows are
+    also kept in that Django cache, so a change made by one process
+    reaches the others within ``GENERATION_CHECK_SECONDS`` and a process
+    starting cold fills from the backend instead of the database.
+
+    A natural key that is not unique (``vertiport_code``) is only cached
+    once a lookup by it found a single row; one matching several rows
+    raises ``ValueError`` instead of picking one.
+
+    Lookups return a deep copy of the cached row, related rows included, so
+    callers may set fields on it or on its relations without touching the
+    cache.
+    Rows read inside a transaction are served but not cached, since the
+    transaction may roll back. Misses are not cached either: rows created
+    with ``bulk_create`` fire no signal and must be found on first lookup.
+    """
+
+    def __init__(
+        self,
+        model: Type[Model],
+        natural_keys: Tuple[str, ...] = (),
+        select_related: Tuple[str, ...] = (),
+    ):
+        self.model = model
+        self.fields = ("id", *natural_keys)
+        self.unique_fields = {
+            field for field in self.fields if model._meta.get_field(field).unique
+        }
+        self.select_related = select_related
+        self.label = model._meta.label_lower
+        self._lock = threading.Lock()
+        self._rows: Dict[Tuple[str, Any], Model] = {}
+        self._generation = 0
+        self._checked_at = self._filled_at = time.monotonic()
+
+    @property
+    def depends_on(self) -> Tuple[Type[Model], ...]:
+        """Models whose changes invalidate this cache."""
+        return (
+            self.model,
+            *(
+                self.model._meta.get_field(name).related_model
+                for name in self.select_related
+            ),
+        )
+
+    def _generation_key(self) -> str:
+        return f"reference:{self.label}:generation"
+
+    def _row_key(self, generation: int, field: str, value: Any) -> str:
+        return f"reference:{self.label}:{generation}:{field}:{value}"
+
+    def _sync(self, backend) -> int:
+        """Drops the rows if another process bumped the generation, or on TTL."""
+        now = time.monotonic()
+        with self._lock:
+            if backend is None:
+                if now - self._filled_at > TTL_SECONDS:
+                    self._rows.clear()
+                    self._generation += 1
+                    self._filled_at = now
+                return self._generation
+            if now - self._checked_at < GENERATION_CHECK_SECONDS:
+                return self._generation
+
+        shared = backend.get(self._generation_key(), 0)
+        with self._lock:
+            self._checked_at = now
+            if shared != self._generation:
+                self._rows.clear()
+                self._generation = shared
+            return self._generation
+
+    def _store(
+        self, generation: int, row: Model, backend, checked: Tuple[str, ...] = ()
+    ) -> None:
+        """Caches the row under its unique keys and those in ``checked``."""
+        if transaction.get_connection().in_atomic_block:
+            # The row may be uncommitted and the transaction may roll back
+            return
+        keys = [
+            (field, getattr(row, field))
+            for field in self.fields
+            if field in self.unique_fields or field in checked
+        ]
+        with self._lock:
+            # A change committed while the row was read makes it stale
+            if generation != self._generation:
+                return
+            for key in keys:
+                self._rows[key] = row
+        if backend is not None:
+            backend.set_many(
+                {self._row_key(generation, *key): row for key in keys},
+                timeout=TTL_SECONDS,
+            )
+
+    def get(self, field: str, value: Any) -> Model | None:
+        if field == "pk":
+            field = "id"
+        if field not in self.fields:
+            raise ValueError(f"{self.model.__name__} is not cached by {field}.")
+        if value is None:
+            return None
+        # A str id and a UUID must hit the same entry
+        value = self.model._meta.get_field(field).to_python(value)
+
+        backend = _backend()
+        generation = self._sync(backend)
+        with self._lock:
+            row = self._rows.get((field, value))
+        if row is not None:
+            return copy.deepcopy(row)
+
+        if backend is not None:
+            row = backend.get(self._row_key(generation, field, value))
+        if row is None:
+            rows = list(
+                self.model.objects.select_related(*self.select_related).filter(
+                    **{field: value}
+                )[:2]
+            )
+            if not rows:
+                return None
+            if len(rows) > 1:
+                raise ValueError(
+                    f"{self.model.__name__} {field} '{value}' is ambiguous."
+                )
+            row = rows[0]
+        self._store(generation, row, backend, checked=(field,))
+        return copy.deepcopy(row)
+
+    def get_many(self, ids: Iterable[Any]) -> Dict[Any, Model]:
+        """id -> row for the ids that exist, one query for all the misses."""
+        ids = {self.model._meta.pk.to_python(pk) for pk in ids if pk is not None}
+        backend = _backend()
+        generation = self._sync(backend)
+        found: Dict[Any, Model] = {}
+        with self._lock:
+            for pk in ids:
+                row = self._rows.get(("id", pk))
+                if row is not None:
+                    found[pk] = row
+        missing = ids - found.keys()
+
+        if missing and backend is not None:
+            keys = {self._row_key(generation, "id", pk): pk for pk in missing}
+            for key, row in backend.get_many(list(keys)).items():
+                found[keys[key]] = row
+                missing.discard(keys[key])
+        if missing:
+            rows = self.model.objects.select_related(*self.select_related).in_bulk(
+                missing
+            )
+            for row in rows.values():
+                self._store(generation, row, backend)
+            found.update(rows)
+        return {pk: copy.deepcopy(row) for pk, row in found.items()}
+
+    def invalidate(self) -> None:
+        backend = _backend()
+        if backend is not None:
+            # add() keeps an existing counter; incr() is atomic on the backend
+            backend.add(self._generation_key(), 0, timeout=None)
+            generation = backend.incr(self._generation_key())
+        with self._lock:
+            self._rows.clear()
+            self._generation = (
+                generation if backend is not None else self._generation + 1
+            )
+            self._checked_at = self._filled_at = time.monotonic()
+
+
+aircraft_types = ReferenceCache(AircraftType)
+aircrafts = ReferenceCache(
+    Aircraft, natural_keys=("tail_number",), select_related=("aircraft_type",)
+)
+vertiports = ReferenceCache(Vertiport, natural_keys=("vertiport_code",))
+routes = ReferenceCache(Route)
+
+REFERENCE_CACHES = (aircraft_types, aircrafts, vertiports, routes)
+
+
+def _invalidate(sender, **kwargs):
+    stale = [cache for cache in REFERENCE_CACHES if sender in cache.depends_on]
+    for cache in stale:
+        cache.invalidate()
+
+    if transaction.get_connection().in_atomic_block:
+        # Until the transaction commits other requests still read the old
+        # row and may cache it again: bump once more when the change is visible
+        def after_commit():
+            for cache in stale:
+                cache.invalidate()
+
+        transaction.on_commit(after_commit)
+
+
+def connect_signals() -> None:
+    """Called from MonitorConfig.ready()."""
+    models = {model for cache in REFERENCE_CACHES for model in cache.depends_on}
+    for model in models:
+        uid = f"reference-cache:{model._meta.label_lower}"
+        post_save.connect(_invalidate, sender=model, dispatch_uid=uid)
+        post_delete.connect(_invalidate, sender=model, dispatch_uid=uid)
@@ -1,6 +1,8 @@
+from typing import Iterable
 from uuid import UUID
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch
 
 from common_tools.schemas.route import (
     RouteFilterSchema,
@@ -9,12 +11,24 @@ from common_tools.schemas.route import (
     SubmitRouteSchema,
     UpdateRouteSchema,
 )
-from monitor.models import Route
+from common_tools.schemas.vertiport import VertiportSchema
+from monitor.models import Route, Waypoint
+from monitor.schemas.route_waypoints import (
+    CompactRouteSchema,
+    CompactRouteSchemaList,
+    RouteWaypointSchema,
+    RouteWaypointsFilterSchema,
+    RouteWithWaypointsSchema,
+    RouteWithWaypointsSchemaList,
+)
+from monitor.services import reference_cache
+from monitor.services.route_planner import invalidate_route_graph
+from monitor.simulator.path import waypoint_points
 
 
 class RouteService:
     def get_route_by_id(self, id: UUID) -> Route | None:
-        route = Route.objects.filter(id=id).first()
+        route = reference_cache.routes.get("id", id)
 
         return route
 
@@ -31,6 +45,73 @@ class RouteService:
 
         return RouteSchemaList(root=route_schema_list)
 
+    def get_routes_with_waypoints(
+        self, filters: RouteWaypointsFilterSchema
+    ) -> RouteWithWaypointsSchemaList | CompactRouteSchemaList:
+        """Every route with its ordered waypoints in two queries.
+
+        Waypoints and their vertiports come from a single prefetch query,
+        already in sequence order.
+        """
+        queryset = Route.objects.prefetch_related(
+            Prefetch(
+                "route_waypoints",
+                queryset=Waypoint.objects.select_related("vertiport").order_by(
+                    "sequence_order"
+                ),
+            )
+        ).order_by("name")
+
+        if filters.name is not None:
+            queryset = queryset.filter(name=filters.name)
+
+        if filters.compact:
+            return CompactRouteSchemaList(
+                root=[
+                    CompactRouteSchema(
+                        id=route.id,
+                        name=route.name,
+                        coordinates=[
+                            list(point)
+                            for point in waypoint_points(route.route_waypoints.all())
+                        ],
+                    )
+                    for route in queryset
+                ]
+            )
+
+        return RouteWithWaypointsSchemaList(
+            root=[
+                self.to_route_with_waypoints(route, route.route_waypoints.all())
+                for route in queryset
+            ]
+        )
+
+    def to_route_with_waypoints(
+        self, route: Route, waypoints: Iterable[Waypoint]
+    ) -> RouteWithWaypointsSchema:
+        """Waypoints must be ordered, with their vertiports already loaded."""
+        return RouteWithWaypointsSchema(
+            id=route.id,
+            name=route.name,
+            waypoints=[
+                RouteWaypointSchema(
+                    id=waypoint.id,
+                    name=waypoint.name,
+                    latitude=waypoint.latitude,
+                    longitude=waypoint.longitude,
+                    altitude=waypoint.altitude,
+                    sequence_order=waypoint.sequence_order,
+                    vertiport=(
+                        VertiportSchema.model_validate(waypoint.vertiport)
+                        if waypoint.vertiport is not None
+                        else None
+                    ),
+                )
+                for waypoint in waypoints
+            ],
+        )
+
     def create_route(self, payload: SubmitRouteSchema) -> RouteSchema:
 
         data = payload.model_dump()
@@ -64,3 +145,5 @@ class RouteService:
             route.delete()
         except ObjectDoesNotExist:
             raise ValueError("Route not found. Unable to delete.")
+
+        invalidate_route_graph()
@@ -0,0 +1,100 @@
+from array import array
+from typing import Iterable, List
+from uuid import UUID
+
+from django.utils import timezone
+
+from monitor.models import Route, RouteGeometry, Waypoint
+from monitor.schemas.route_geometry import BoundingBoxSchema, RouteGeometrySchema
+from monitor.simulator.path import Point, haversine_m, waypoint_points
+
+
+def _pack(values: Iterable[float]) -> bytes:
+    return array("d", values).tobytes()
+
+
+def _unpack(data) -> array:
+    values = array("d")
+    values.frombytes(bytes(data))
+    return values
+
+
+class RouteGeometryService:
+    """Read-through cache of route geometry.
+
+    The first read of a route computes its points, cumulative lengths and
+    bounding box from the ordered waypoints and stores them packed in one
+    RouteGeometry row; later reads decode that row. Waypoint and vertiport
+    edits delete the rows they affect, so the next read recomputes.
+    """
+
+    def _compute(self, route_id: UUID) -> RouteGeometry:
+        points = waypoint_points(
+            Waypoint.objects.filter(route_id=route_id)
+            .select_related("vertiport")
+            .order_by("sequence_order")
+        )
+        cumulative = [0.0] if points else []
+        for (lat1, lon1, _), (lat2, lon2, _) in zip(points, points[1:]):
+            cumulative.append(cumulative[-1] + haversine_m(lat1, lon1, lat2, lon2))
+
+        lats = [point[0] for point in points]
+        lons = [point[1] for point in points]
+        geometry, _ = RouteGeometry.objects.update_or_create(
+            route_id=route_id,
+            defaults={
+                "points": _pack(value for point in points for value in point),
+                "cumulative": _pack(cumulative),
+                "total_length": cumulative[-1] if cumulative else 0.0,
+                "min_latitude": min(lats, default=None),
+                "min_longitude": min(lons, default=None),
+                "max_latitude": max(lats, default=None),
+                "max_longitude": max(lons, default=None),
+                "computed_at": timezone.now(),
+            },
+        )
+        return geometry
+
+    def _get_or_compute(self, route_id: UUID) -> RouteGeometry:
+        geometry = RouteGeometry.objects.filter(route_id=route_id).first()
+        if geometry is None:
+            if not Route.objects.filter(id=route_id).exists():
+                raise ValueError("Route not found.")
+            geometry = self._compute(route_id)
+        return geometry
+
+    def get_points(self, route_id: UUID) -> List[Point]:
+        flat = _unpack(self._get_or_compute(route_id).points)
+        return [tuple(flat[i : i + 3]) for i in range(0, len(flat), 3)]
+
+    def get_geometry(self, route_id: UUID) -> RouteGeometrySchema:
+        geometry = self._get_or_compute(route_id)
+        flat = _unpack(geometry.points)
+        cumulative = _unpack(geometry.cumulative)
+
+        return RouteGeometrySchema(
+            route=geometry.route_id,
+            points=[list(flat[i : i + 3]) for i in range(0, len(flat), 3)],
+            segment_lengths=[b - a for a, b in zip(cumulative, cumulative[1:])],
+            total_length=geometry.total_length,
+            bbox=(
+                BoundingBoxSchema(
+                    min_latitude=geometry.min_latitude,
+                    min_longitude=geometry.min_longitude,
+                    max_latitude=geometry.max_latitude,
+                    max_longitude=geometry.max_longitude,
+                )
+                if geometry.min_latitude is not None
+                else None
+            ),
+            computed_at=geometry.computed_at,
+        )
+
+    def invalidate(self, route_ids: Iterable[UUID]) -> None:
+        RouteGeometry.objects.filter(route_id__in=set(route_ids)).delete()
+
+    def invalidate_vertiport(self, vertiport_id: UUID) -> None:
+        """Routes whose waypoints may take the vertiport's coordinates."""
+        RouteGeometry.objects.filter(
+            route__route_waypoints__vertiport_id=vertiport_id
+        ).delete()
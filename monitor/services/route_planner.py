@@ -0,0 +1,255 @@
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+
+from django.db import transaction
+
+from monitor.models import Route, Vertiport, Waypoint
+from monitor.schemas.route_planner import (
+    PlanMetricEnum,
+    PlannedWaypointSchema,
+    RoutePlanRequestSchema,
+    RoutePlanSchema,
+)
+from monitor.simulator.path import haversine_m, waypoint_point
+
+# Energy metric: each meter climbed costs as much as this many flown
+CLIMB_PENALTY = 10.0
+# Bounds how long another process's edits can go unseen
+GRAPH_TTL_SECONDS = 300.0
+
+
+@dataclass(slots=True)
+class RouteGraph:
+    """Directed graph of the route network.
+
+    A waypoint at a vertiport becomes that vertiport's node, so routes
+    sharing a vertiport connect there; other waypoints are nodes of their
+    own. Each pair of consecutive waypoints of a route is an edge in the
+    route's direction.
+    """
+
+    keys: List[Tuple[str, UUID]]  # ("vertiport" | "waypoint", id)
+    names: List[str | None]
+    lat: List[float]
+    lon: List[float]
+    alt: List[float]
+    # node -> [(neighbour, distance_m, climb_m)]
+    edges: List[List[Tuple[int, float, float]]]
+    # (node, neighbour) -> routes flying that edge
+    edge_routes: Dict[Tuple[int, int], Set[UUID]]
+    vertiports: Dict[UUID, int]
+    built_at: float
+
+
+def build_graph() -> RouteGraph:
+    """One query over every waypoint, in route and sequence order."""
+    rows = (
+        Waypoint.objects.select_related("vertiport")
+        .order_by("route_id", "sequence_order")
+        .iterator(chunk_size=2000)
+    )
+
+    index: Dict[Tuple[str, UUID], int] = {}
+    graph = RouteGraph([], [], [], [], [], [], {}, {}, time.monotonic())
+    # node -> {neighbour: (distance_m, climb_m)}, keeping the shortest edge
+    best: List[Dict[int, Tuple[float, float]]] = []
+
+    previous_route = previous_node = previous_point = None
+    for wp in rows:
+        # Where the route flies, as in its geometry
+        point = waypoint_point(wp)
+        if point is None:
+            # Nothing to place it with: breaks the route here
+            previous_route = previous_node = previous_point = None
+            continue
+        vertiport = wp.vertiport
+        if vertiport is not None:
+            key = ("vertiport", vertiport.id)
+            name = vertiport.vertiport_code
+        else:
+            key = ("waypoint", wp.id)
+            name = wp.name
+
+        node = index.get(key)
+        if node is None:
+            node = index[key] = len(graph.keys)
+            graph.keys.append(key)
+            graph.names.append(name)
+            # A vertiport's node sits at the pad, whatever height routes
+            # pass it at; other nodes where their waypoint is
+            place = point
+            if vertiport is not None and vertiport.latitude is not None:
+                place = (
+                    float(vertiport.latitude),
+                    float(vertiport.longitude),
+                    float(vertiport.altitude or 0.0),
+                )
+            graph.lat.append(place[0])
+            graph.lon.append(place[1])
+            graph.alt.append(place[2])
+            best.append({})
+            if vertiport is not None:
+                graph.vertiports[vertiport.id] = node
+
+        if wp.route_id == previous_route and node != previous_node:
+            # Measured between the route's own points, so costs follow the
+            # path the simulator flies
+            distance = haversine_m(
+                previous_point[0], previous_point[1], point[0], point[1]
+            )
+            climb = max(0.0, point[2] - previous_point[2])
+            known = best[previous_node].get(node)
+            if known is None or distance < known[0]:
+                best[previous_node][node] = (distance, climb)
+            graph.edge_routes.setdefault((previous_node, node), set()).add(wp.route_id)
+        previous_route, previous_node, previous_point = wp.route_id, node, point
+
+    graph.edges = [
+        [(neighbour, distance, climb) for neighbour, (distance, climb) in out.items()]
+        for out in best
+    ]
+    return graph
+
+
+_graph: RouteGraph | None = None
+_graph_lock = threading.Lock()
+
+
+def get_graph() -> RouteGraph:
+    """The cached graph, rebuilt after invalidation or GRAPH_TTL_SECONDS."""
+    global _graph
+    with _graph_lock:
+        if _graph is None or time.monotonic() - _graph.built_at > GRAPH_TTL_SECONDS:
+            _graph = build_graph()
+        return _graph
+
+
+def invalidate_route_graph() -> None:
+    global _graph
+    with _graph_lock:
+        _graph = None
+
+
+def shortest_path(
+    graph: RouteGraph, start: int, goal: int, metric: PlanMetricEnum
+) -> Tuple[List[int], float, float] | None:
+    """A* from start to goal: (nodes, distance_m, cost), or None if cut off.
+
+    The great-circle distance to the goal never exceeds the remaining cost
+    under either metric, so the first time the goal is popped the path is
+    optimal.
+    """
+    climb_penalty = CLIMB_PENALTY if metric == PlanMetricEnum.ENERGY else 0.0
+    goal_lat, goal_lon = graph.lat[goal], graph.lon[goal]
+
+    def heuristic(node: int) -> float:
+        return haversine_m(graph.lat[node], graph.lon[node], goal_lat, goal_lon)
+
+    cost = {start: 0.0}
+    distance = {start: 0.0}
+    came_from: Dict[int, int] = {}
+    frontier = [(heuristic(start), start)]
+    done = set()
+    while frontier:
+        _, node = heapq.heappop(frontier)
+        if node in done:
+            continue  # Stale entry of a node reached again more cheaply
+        done.add(node)
+        if node == goal:
+            path = [goal]
+            while path[-1] != start:
+                path.append(came_from[path[-1]])
+            path.reverse()
+            return path, distance[goal], cost[goal]
+
+        for neighbour, length, climb in graph.edges[node]:
+            candidate = cost[node] + length + climb_penalty * climb
+            if candidate < cost.get(neighbour, float("inf")):
+                cost[neighbour] = candidate
+                distance[neighbour] = distance[node] + length
+                came_from[neighbour] = node
+                heapq.heappush(frontier, (candidate + heuristic(neighbour), neighbour))
+    return None
+
+
+class RoutePlannerService:
+    def plan(self, payload: RoutePlanRequestSchema) -> RoutePlanSchema:
+        if payload.departure_vertiport == payload.arrival_vertiport:
+            raise ValueError("Departure and arrival vertiports must differ.")
+
+        graph = get_graph()
+        start = graph.vertiports.get(payload.departure_vertiport)
+        goal = graph.vertiports.get(payload.arrival_vertiport)
+        if start is None or goal is None:
+            raise ValueError("No route reaches the departure or arrival vertiport.")
+
+        found = shortest_path(graph, start, goal, payload.metric)
+        if found is None:
+            raise ValueError("No path between the vertiports on the route network.")
+        nodes, distance, cost = found
+
+        waypoints = [
+            PlannedWaypointSchema(
+                vertiport=(
+                    graph.keys[node][1] if graph.keys[node][0] == "vertiport" else None
+                ),
+                name=graph.names[node],
+                latitude=graph.lat[node],
+                longitude=graph.lon[node],
+                altitude=graph.alt[node],
+            )
+            for node in nodes
+        ]
+
+        route_id = None
+        if payload.create_route:
+            route_id = self._materialize(payload, waypoints)
+
+        return RoutePlanSchema(
+            departure_vertiport=payload.departure_vertiport,
+            arrival_vertiport=payload.arrival_vertiport,
+            metric=payload.metric,
+            distance=distance,
+            cost=cost,
+            waypoints=waypoints,
+            route=route_id,
+        )
+
+    def _materialize(
+        self, payload: RoutePlanRequestSchema, waypoints: List[PlannedWaypointSchema]
+    ) -> UUID:
+        name = payload.name
+        if not name:
+            codes = dict(
+                Vertiport.objects.filter(
+                    id__in=[payload.departure_vertiport, payload.arrival_vertiport]
+                ).values_list("id", "vertiport_code")
+            )
+            name = (
+                f"{codes.get(payload.departure_vertiport)}-"
+                f"{codes.get(payload.arrival_vertiport)} (planned)"
+            )
+
+        with transaction.atomic():
+            route = Route.objects.create(name=name)
+            Waypoint.objects.bulk_create(
+                [
+                    Waypoint(
+                        route=route,
+                        vertiport_id=waypoint.vertiport,
+                        name=waypoint.name,
+                        latitude=waypoint.latitude,
+                        longitude=waypoint.longitude,
+                        altitude=waypoint.altitude,
+                        sequence_order=sequence_order,
+                    )
+                    for sequence_order, waypoint in enumerate(waypoints, start=1)
+                ]
+            )
+        # The new route only repeats existing edges, but keeps the cache honest
+        invalidate_route_graph()
+        return route.id
@@ -0,0 +1,299 @@
+import math
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Sequence, Tuple
+from uuid import UUID
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import FlightInstance, Route
+from monitor.schemas.route_search import (
+    RouteSearchFlightSchema,
+    RouteSearchMatchSchema,
+    RouteSearchResultSchema,
+)
+from monitor.services.route_planner import RouteGraph, get_graph
+from monitor.simulator.path import EARTH_RADIUS_M
+
+# Children per R-tree node
+NODE_CAPACITY = 16
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+
+# (min lat, min lon, max lat, max lon)
+Box = Tuple[float, float, float, float]
+LatLon = Tuple[float, float]
+
+
+def _union(boxes: Iterator[Box]) -> Box:
+    min_lat, min_lon, max_lat, max_lon = next(boxes)
+    for box in boxes:
+        min_lat = min(min_lat, box[0])
+        min_lon = min(min_lon, box[1])
+        max_lat = max(max_lat, box[2])
+        max_lon = max(max_lon, box[3])
+    return min_lat, min_lon, max_lat, max_lon
+
+
+class SegmentRTree:
+    """Static R-tree over segment bounding boxes.
+
+    Bulk-loaded with Sort-Tile-Recursive packing: entries are sorted into
+    vertical slices by longitude, each slice by latitude, and cut into
+    full nodes, level by level up to the root. A box query then only
+    descends into the nodes it overlaps.
+    """
+
+    def __init__(self, boxes: Sequence[Box], capacity: int = NODE_CAPACITY):
+        self.capacity = capacity
+        self.height = 0
+        self.root = None
+
+        level = [(box, index) for index, box in enumerate(boxes)]
+        while level:
+            level = self._pack(level)
+            self.height += 1
+            if len(level) == 1:
+                self.root = level[0]
+                break
+
+    def _pack(self, entries: List[tuple]) -> List[tuple]:
+        nodes = math.ceil(len(entries) / self.capacity)
+        slice_size = math.ceil(math.sqrt(nodes)) * self.capacity
+        entries = sorted(entries, key=lambda entry: entry[0][1] + entry[0][3])
+
+        packed = []
+        for start in range(0, len(entries), slice_size):
+            column = sorted(
+                entries[start : start + slice_size],
+                key=lambda entry: entry[0][0] + entry[0][2],
+            )
+            for offset in range(0, len(column), self.capacity):
+                children = column[offset : offset + self.capacity]
+                packed.append((_union(box for box, _ in children), children))
+        return packed
+
+    def search(self, box: Box) -> Iterator[int]:
+        """Indexes of the boxes overlapping ``box``."""
+        if self.root is None:
+            return
+
+        min_lat, min_lon, max_lat, max_lon = box
+        stack = [(self.root[1], self.height)]
+        while stack:
+            children, level = stack.pop()
+            for (lat0, lon0, lat1, lon1), child in children:
+                if lat0 > max_lat or lat1 < min_lat or lon0 > max_lon or lon1 < min_lon:
+                    continue
+                if level == 1:
+                    yield child
+                else:
+                    stack.append((child, level - 1))
+
+
+def _project(point: LatLon, ref_lat: float) -> Tuple[float, float]:
+    """Equirectangular meters around ``ref_lat``: exact enough at km range."""
+    return (
+        point[1] * METERS_PER_DEGREE * math.cos(math.radians(ref_lat)),
+        point[0] * METERS_PER_DEGREE,
+    )
+
+
+def _point_segment(p, a, b) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length = dx * dx + dy * dy
+    t = 0.0
+    if length:
+        t = max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length))
+    return math.hypot(p[0] - a[0] - t * dx, p[1] - a[1] - t * dy)
+
+
+def _cross(o, a, b) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def segment_distance_m(a: LatLon, b: LatLon, c: LatLon, d: LatLon) -> float:
+    """Meters between segments a-b and c-d (a point when c == d)."""
+    ref_lat = (a[0] + b[0] + c[0] + d[0]) / 4
+    a, b, c, d = (_project(p, ref_lat) for p in (a, b, c, d))
+
+    if c == d:
+        return _point_segment(c, a, b)
+    if (_cross(a, b, c) > 0) != (_cross(a, b, d) > 0) and (_cross(c, d, a) > 0) != (
+        _cross(c, d, b) > 0
+    ):
+        return 0.0  # They cross
+    return min(
+        _point_segment(a, c, d),
+        _point_segment(b, c, d),
+        _point_segment(c, a, b),
+        _point_segment(d, a, b),
+    )
+
+
+@dataclass(slots=True)
+class SegmentIndex:
+    """Undirected route segments of a route graph, in an R-tree."""
+
+    graph: RouteGraph
+    ends: List[Tuple[int, int]]  # (node, node) of each segment
+    routes: List[Tuple[UUID, ...]]  # Routes flying it, either way
+    tree: SegmentRTree
+
+
+def build_index(graph: RouteGraph) -> SegmentIndex:
+    segments: Dict[Tuple[int, int], set] = {}
+    for (node, neighbour), routes in graph.edge_routes.items():
+        key = (min(node, neighbour), max(node, neighbour))
+        segments.setdefault(key, set()).update(routes)
+
+    ends = list(segments)
+    boxes = [
+        (
+            min(graph.lat[a], graph.lat[b]),
+            min(graph.lon[a], graph.lon[b]),
+            max(graph.lat[a], graph.lat[b]),
+            max(graph.lon[a], graph.lon[b]),
+        )
+        for a, b in ends
+    ]
+    return SegmentIndex(
+        graph=graph,
+        ends=ends,
+        routes=[tuple(segments[key]) for key in ends],
+        tree=SegmentRTree(boxes),
+    )
+
+
+_index: SegmentIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> SegmentIndex:
+    """The index of the cached route graph, rebuilt along with the graph.
+
+    Riding on the graph's cache means route, waypoint and vertiport edits
+    reach the index through the graph's invalidation and TTL.
+    """
+    global _index
+    graph = get_graph()
+    with _index_lock:
+        if _index is None or _index.graph is not graph:
+            _index = build_index(graph)
+        return _index
+
+
+class RouteSearchService:
+    def __init__(self):
+        self.open_statuses = [
+            FlightStatusEnum.PENDING.value,
+            FlightStatusEnum.ACTIVATED.value,
+        ]
+
+    def _nearest(self, corridor: List[LatLon], radius_m: float) -> Dict[UUID, float]:
+        """Route id -> meters from the corridor, for routes within radius_m."""
+        index = get_index()
+        graph = index.graph
+        legs = list(zip(corridor, corridor[1:])) or [(corridor[0], corridor[0])]
+
+        nearest: Dict[UUID, float] = {}
+        for c, d in legs:
+            # Degrees of longitude shrink towards the poles: pad by the widest
+            lat_pad = radius_m / METERS_PER_DEGREE
+            widest = min(89.0, max(abs(c[0]), abs(d[0])) + lat_pad)
+            lon_pad = lat_pad / math.cos(math.radians(widest))
+            box = (
+                min(c[0], d[0]) - lat_pad,
+                min(c[1], d[1]) - lon_pad,
+                max(c[0], d[0]) + lat_pad,
+                max(c[1], d[1]) + lon_pad,
+            )
+            for segment in index.tree.search(box):
+                a, b = index.ends[segment]
+                distance = segment_distance_m(
+                    (graph.lat[a], graph.lon[a]), (graph.lat[b], graph.lon[b]), c, d
+                )
+                if distance > radius_m:
+                    continue
+                for route_id in index.routes[segment]:
+                    if distance < nearest.get(route_id, math.inf):
+                        nearest[route_id] = distance
+        return nearest
+
+    def search(
+        self, corridor: List[LatLon], radius_km: float, include_flights: bool = True
+    ) -> RouteSearchResultSchema:
+        """Routes with a segment within radius_km of the point or corridor.
+
+        The segment R-tree narrows the candidates to the segments whose
+        padded boxes overlap the search area, so only those are measured.
+        Names and open flights of the matches take one query each.
+        """
+        for lat, lon in corridor:
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise ValueError(f"Invalid coordinate [{lat}, {lon}].")
+
+        nearest = self._nearest(corridor, radius_km * 1000)
+        names = dict(Route.objects.filter(id__in=nearest).values_list("id", "name"))
+
+        flights: Dict[UUID, List[RouteSearchFlightSchema]] = {
+            route_id: [] for route_id in names
+        }
+        if include_flights and names:
+            rows = (
+                FlightInstance.objects.filter(
+                    route_id__in=names, flight_status__in=self.open_statuses
+                )
+                .order_by("scheduled_departure_datetime", "id")
+                .values_list(
+                    "route_id",
+                    "id",
+                    "callsign",
+                    "flight_status",
+                    "aircraft_id",
+                    "departure_vertiport_id",
+                    "arrival_vertiport_id",
+                    "scheduled_departure_datetime",
+                    "scheduled_arrival_datetime",
+                )
+            )
+            for (
+                route_id,
+                fi_id,
+                callsign,
+                flight_status,
+                aircraft_id,
+                departure_vertiport_id,
+                arrival_vertiport_id,
+                departure,
+                arrival,
+            ) in rows:
+                flights[route_id].append(
+                    RouteSearchFlightSchema(
+                        id=fi_id,
+                        callsign=callsign,
+                        flight_status=flight_status,
+                        aircraft=aircraft_id,
+                        departure_vertiport=departure_vertiport_id,
+                        arrival_vertiport=arrival_vertiport_id,
+                        scheduled_departure_datetime=departure,
+                        scheduled_arrival_datetime=arrival,
+                    )
+                )
+
+        # A route deleted since the graph was built has no name: left out
+        routes = sorted(
+            (
+                RouteSearchMatchSchema(
+                    id=route_id,
+                    name=name,
+                    distance=nearest[route_id],
+                    flights=flights[route_id],
+                )
+                for route_id, name in names.items()
+            ),
+            key=lambda match: (match.distance, match.name),
+        )
+        return RouteSearchResultSchema(
+            radius_km=radius_km,
+            routes=routes,
+            flights=sum(len(match.flights) for match in routes),
+        )
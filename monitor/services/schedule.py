@@ -0,0 +1,172 @@
+from datetime import datetime
+from typing import Dict, Hashable, Iterable, Iterator, List, Tuple
+from uuid import UUID
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import FlightInstance
+from monitor.schemas.schedule import (
+    ScheduleConflictFilterSchema,
+    ScheduleConflictSchema,
+    ScheduleConflictSchemaList,
+)
+
+# (aircraft, departure, arrival, flight) sorted by aircraft then departure
+Interval = Tuple[Hashable, datetime, datetime, Hashable]
+
+
+class ScheduleConflictError(ValueError):
+    """The aircraft is already booked for part of the requested time."""
+
+
+def sweep_overlaps(
+    intervals: Iterable[Interval],
+) -> Iterator[Tuple[Hashable, Hashable, Hashable, datetime, datetime]]:
+    """Overlapping flights of each aircraft in one pass over sorted intervals.
+
+    Keeps, per aircraft, the flight reaching furthest in time so far; a
+    flight departing before that one lands overlaps it. Every flight that
+    overlaps an earlier one is reported once, against the flight holding the
+    aircraft longest, so the output stays linear even for heavily stacked
+    schedules. Yields (aircraft, flight, conflicts_with, start, end).
+    """
+    current = None
+    reach_flight = reach_end = None
+    for aircraft, departure, arrival, flight in intervals:
+        if aircraft != current:
+            current = aircraft
+            reach_flight, reach_end = flight, arrival
+            continue
+
+        if departure < reach_end:
+            yield aircraft, flight, reach_flight, departure, min(arrival, reach_end)
+        if arrival > reach_end:
+            reach_flight, reach_end = flight, arrival
+
+
+class ScheduleValidationService:
+    def _scheduled(self):
+        """Flights that hold their aircraft: both times set, not cancelled."""
+        return FlightInstance.objects.filter(
+            scheduled_departure_datetime__isnull=False,
+            scheduled_arrival_datetime__isnull=False,
+        ).exclude(flight_status=FlightStatusEnum.CANCELLED.value)
+
+    def check_availability(
+        self,
+        aircraft_id: UUID,
+        departure: datetime | None,
+        arrival: datetime | None,
+        exclude_id: UUID | None = None,
+    ) -> None:
+        """Raises ScheduleConflictError if the aircraft is booked in the slot.
+
+        A single range query over the (aircraft, departure) index.
+        """
+        if departure is None or arrival is None:
+            return
+
+        queryset = self._scheduled().filter(
+            aircraft_id=aircraft_id,
+            scheduled_departure_datetime__lt=arrival,
+            scheduled_arrival_datetime__gt=departure,
+        )
+        if exclude_id is not None:
+            queryset = queryset.exclude(id=exclude_id)
+
+        conflict = queryset.values_list("id", flat=True).first()
+        if conflict is not None:
+            raise ScheduleConflictError(
+                f"Aircraft already booked by FlightInstance {conflict} "
+                "in the requested time."
+            )
+
+    def batch_conflicts(
+        self, items: List[Tuple[UUID | None, datetime | None, datetime | None]]
+    ) -> Dict[int, str]:
+        """Conflicts of new (aircraft, departure, arrival) items, by index.
+
+        Checks the items against each other and against the existing
+        schedule of their aircraft, fetched in one query. Items without an
+        aircraft or times are skipped.
+        """
+        timed = [
+            (aircraft_id, departure, arrival, ("new", index))
+            for index, (aircraft_id, departure, arrival) in enumerate(items)
+            if aircraft_id is not None and departure is not None and arrival is not None
+        ]
+        if not timed:
+            return {}
+
+        existing = self._scheduled().filter(
+            aircraft_id__in={interval[0] for interval in timed},
+            scheduled_departure_datetime__lt=max(interval[2] for interval in timed),
+            scheduled_arrival_datetime__gt=min(interval[1] for interval in timed),
+        )
+        intervals = timed + [
+            (aircraft_id, departure, arrival, ("db", pk))
+            for aircraft_id, departure, arrival, pk in existing.values_list(
+                "aircraft_id",
+                "scheduled_departure_datetime",
+                "scheduled_arrival_datetime",
+                "id",
+            )
+        ]
+        intervals.sort(key=lambda interval: (interval[0], interval[1]))
+
+        conflicts = {}
+        for _, flight, other, _, _ in sweep_overlaps(intervals):
+            for this, that in ((flight, other), (other, flight)):
+                if this[0] == "new":
+                    conflicts.setdefault(
+                        this[1],
+                        (
+                            f"Overlaps item {that[1]} for the same aircraft."
+                            if that[0] == "new"
+                            else f"Aircraft already booked by FlightInstance {that[1]}."
+                        ),
+                    )
+        return conflicts
+
+    def audit(
+        self, filters: ScheduleConflictFilterSchema
+    ) -> ScheduleConflictSchemaList:
+        """Fleet-wide double bookings: a sort plus one linear sweep.
+
+        The database sorts by (aircraft, departure); rows are streamed
+        through the sweep without being held in memory.
+        """
+        queryset = self._scheduled()
+        if filters.aircraft is not None:
+            queryset = queryset.filter(aircraft_id=filters.aircraft)
+        if filters.window_from is not None:
+            queryset = queryset.filter(
+                scheduled_arrival_datetime__gt=filters.window_from
+            )
+        if filters.window_to is not None:
+            queryset = queryset.filter(
+                scheduled_departure_datetime__lt=filters.window_to
+            )
+
+        rows = (
+            queryset.order_by("aircraft_id", "scheduled_departure_datetime")
+            .values_list(
+                "aircraft_id",
+                "scheduled_departure_datetime",
+                "scheduled_arrival_datetime",
+                "id",
+            )
+            .iterator(chunk_size=2000)
+        )
+
+        return ScheduleConflictSchemaList(
+            root=[
+                ScheduleConflictSchema(
+                    aircraft=aircraft,
+                    flight_instance=flight,
+                    conflicts_with=other,
+                    overlap_start=start,
+                    overlap_end=end,
+                )
+                for aircraft, flight, other, start, end in sweep_overlaps(rows)
+            ]
+        )
@@ -0,0 +1,298 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F, Max, Q
+from django.utils import timezone
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import FlightInstance, Vertiport
+from monitor.schemas.slot import (
+    OccupancyBucketSchema,
+    OccupancyFilterSchema,
+    OccupancySchemaList,
+    SlotAllocationRequestSchema,
+    SlotAllocationResultSchema,
+    SlotAssignmentSchema,
+)
+
+BATCH_SIZE = 1000
+
+FLIGHT_FIELDS = (
+    "id",
+    "aircraft_id",
+    "flight_status",
+    "departure_vertiport_id",
+    "arrival_vertiport_id",
+    "scheduled_departure_datetime",
+    "scheduled_arrival_datetime",
+)
+
+
+class SlotAllocator:
+    """Greedy slot allocation over per-vertiport movement buckets.
+
+    Time is cut into ``slot`` buckets; each departure and arrival takes one
+    movement of its vertiport's bucket, up to ``slot_capacity``. Flights are
+    served in scheduled order (ration-by-schedule) and each one gets the
+    smallest whole-slot delay that fits both ends and keeps its aircraft
+    free of overlapping flights. Departure and arrival shift together, so
+    flight times never change.
+    """
+
+    def __init__(
+        self, capacities: Dict[UUID, int], slot: timedelta, max_delay: timedelta
+    ):
+        self.capacities = capacities
+        self.slot = slot
+        self.max_shift = int(max_delay / slot)
+        self.departures: Dict[Tuple[UUID, int], int] = defaultdict(int)
+        self.arrivals: Dict[Tuple[UUID, int], int] = defaultdict(int)
+        # Booked (departure, arrival) of each aircraft
+        self.busy: Dict[UUID, List[Tuple[datetime, datetime]]] = defaultdict(list)
+
+    def bucket(self, when: datetime) -> int:
+        return int(when.timestamp() // self.slot.total_seconds())
+
+    def book(self, flight: dict, shift: int = 0):
+        delay = self.slot * shift
+        dep_vertiport = flight["departure_vertiport_id"]
+        arr_vertiport = flight["arrival_vertiport_id"]
+        departure = flight["scheduled_departure_datetime"] + delay
+        arrival = flight["scheduled_arrival_datetime"] + delay
+        if dep_vertiport is not None:
+            self.departures[(dep_vertiport, self.bucket(departure))] += 1
+        if arr_vertiport is not None:
+            self.arrivals[(arr_vertiport, self.bucket(arrival))] += 1
+        self.busy[flight["aircraft_id"]].append((departure, arrival))
+
+    def allocate(self, flight: dict) -> int | None:
+        """Books the flight at its smallest feasible shift, in slots.
+
+        Returns None, without booking, if no shift up to the limit fits.
+        """
+        dep_vertiport = flight["departure_vertiport_id"]
+        arr_vertiport = flight["arrival_vertiport_id"]
+        departure = flight["scheduled_departure_datetime"]
+        arrival = flight["scheduled_arrival_datetime"]
+        dep_bucket = self.bucket(departure)
+        arr_bucket = self.bucket(arrival)
+        busy = self.busy[flight["aircraft_id"]]
+
+        for shift in range(self.max_shift + 1):
+            dep_key = (dep_vertiport, dep_bucket + shift)
+            arr_key = (arr_vertiport, arr_bucket + shift)
+            # A round trip inside one bucket takes two of its movements
+            same = dep_key == arr_key
+            if dep_vertiport is not None and not self._fits(dep_key, 1 + same):
+                continue
+            if arr_vertiport is not None and not self._fits(arr_key, 1 + same):
+                continue
+
+            delay = self.slot * shift
+            start, end = departure + delay, arrival + delay
+            if any(
+                booked_start < end and booked_end > start
+                for booked_start, booked_end in busy
+            ):
+                continue
+
+            self.book(flight, shift)
+            return shift
+        return None
+
+    def _fits(self, key: Tuple[UUID, int], movements: int) -> bool:
+        used = self.departures.get(key, 0) + self.arrivals.get(key, 0)
+        return used + movements <= self.capacities.get(key[0], 0)
+
+    def timeline(
+        self, window_from: datetime, window_to: datetime
+    ) -> List[OccupancyBucketSchema]:
+        """Non-empty buckets starting in the window, by vertiport and time."""
+        first = self.bucket(window_from)
+        last = self.bucket(window_to - timedelta(microseconds=1))
+        keys = sorted(
+            {
+                key
+                for key in (*self.departures, *self.arrivals)
+                if first <= key[1] <= last
+            },
+            key=lambda key: (str(key[0]), key[1]),
+        )
+        slot_s = self.slot.total_seconds()
+        timeline = []
+        for vertiport_id, bucket in keys:
+            start = datetime.fromtimestamp(bucket * slot_s, tz=dt_timezone.utc)
+            timeline.append(
+                OccupancyBucketSchema(
+                    vertiport=vertiport_id,
+                    start=start,
+                    end=start + self.slot,
+                    departures=self.departures.get((vertiport_id, bucket), 0),
+                    arrivals=self.arrivals.get((vertiport_id, bucket), 0),
+                    capacity=self.capacities.get(vertiport_id, 0),
+                )
+            )
+        return timeline
+
+
+class SlotAllocationService:
+    def _scheduled(self, window_from: datetime, window_to: datetime):
+        """Non-cancelled flights with a movement inside the window."""
+        return (
+            FlightInstance.objects.filter(
+                scheduled_departure_datetime__isnull=False,
+                scheduled_arrival_datetime__isnull=False,
+            )
+            .filter(
+                Q(
+                    scheduled_departure_datetime__gte=window_from,
+                    scheduled_departure_datetime__lt=window_to,
+                )
+                | Q(
+                    scheduled_arrival_datetime__gte=window_from,
+                    scheduled_arrival_datetime__lt=window_to,
+                )
+            )
+            .exclude(flight_status=FlightStatusEnum.CANCELLED.value)
+            .values(*FLIGHT_FIELDS)
+        )
+
+    def _capacities(self) -> Dict[UUID, int]:
+        return dict(Vertiport.objects.values_list("id", "slot_capacity"))
+
+    def allocate(
+        self, payload: SlotAllocationRequestSchema
+    ) -> SlotAllocationResultSchema:
+        """Fits the PENDING flights departing in the window to pad capacity.
+
+        Flights that are no longer PENDING, or that depart outside the
+        window, keep their times and are booked first. Flights moving up to
+        the latest arrival a shifted flight could have are loaded too, so
+        that shifted flights cannot run into them.
+        """
+        if payload.window_to <= payload.window_from:
+            raise ValueError("window_to must be after window_from.")
+
+        slot = timedelta(minutes=payload.slot_minutes)
+        max_delay = timedelta(minutes=payload.max_delay_minutes)
+        allocator = SlotAllocator(self._capacities(), slot, max_delay)
+        horizon = self._horizon(payload.window_from, payload.window_to, allocator)
+
+        pending = []
+        for flight in self._scheduled(payload.window_from, horizon):
+            if (
+                flight["flight_status"] == FlightStatusEnum.PENDING.value
+                and payload.window_from
+                <= flight["scheduled_departure_datetime"]
+                < payload.window_to
+            ):
+                pending.append(flight)
+            else:
+                allocator.book(flight)
+
+        pending.sort(key=lambda f: (f["scheduled_departure_datetime"], str(f["id"])))
+
+        shifts: Dict[UUID, int] = {}
+        unallocated = []
+        for flight in pending:
+            shift = allocator.allocate(flight)
+            if shift is None:
+                # Keeps its times, over capacity, and is reported
+                allocator.book(flight)
+                unallocated.append(flight["id"])
+            elif shift:
+                shifts[flight["id"]] = shift
+
+        if payload.apply and shifts:
+            self._apply(shifts, slot)
+
+        delays = [shift * slot for shift in shifts.values()]
+        by_id = {flight["id"]: flight for flight in pending}
+        return SlotAllocationResultSchema(
+            flights=len(pending),
+            delayed=len(shifts),
+            total_delay_minutes=sum(delays, timedelta()).total_seconds() / 60,
+            max_delay_minutes=max(delays, default=timedelta()).total_seconds() / 60,
+            applied=payload.apply,
+            unallocated=unallocated,
+            assignments=[
+                SlotAssignmentSchema(
+                    flight_instance=flight_id,
+                    delay_minutes=(shift * slot).total_seconds() / 60,
+                    scheduled_departure_datetime=by_id[flight_id][
+                        "scheduled_departure_datetime"
+                    ]
+                    + shift * slot,
+                    scheduled_arrival_datetime=by_id[flight_id][
+                        "scheduled_arrival_datetime"
+                    ]
+                    + shift * slot,
+                )
+                for flight_id, shift in shifts.items()
+            ],
+            occupancy=allocator.timeline(payload.window_from, horizon),
+        )
+
+    def _horizon(
+        self, window_from: datetime, window_to: datetime, allocator: SlotAllocator
+    ) -> datetime:
+        """End of the span shifted flights can reach: their latest arrival.
+
+        The pending flight arriving last, delayed by the limit, lands one
+        block time after the window end plus the delay; movements up to
+        there share buckets with it.
+        """
+        latest = FlightInstance.objects.filter(
+            flight_status=FlightStatusEnum.PENDING.value,
+            scheduled_departure_datetime__gte=window_from,
+            scheduled_departure_datetime__lt=window_to,
+        ).aggregate(latest=Max("scheduled_arrival_datetime"))["latest"]
+        end = max(window_to, latest) if latest is not None else window_to
+        # Through the end of the bucket the latest shifted arrival falls in
+        last = allocator.bucket(end + allocator.slot * allocator.max_shift)
+        return datetime.fromtimestamp(
+            (last + 1) * allocator.slot.total_seconds(), tz=dt_timezone.utc
+        )
+
+    def _apply(self, shifts: Dict[UUID, int], slot: timedelta):
+        """One UPDATE per distinct delay (and batch), not one per flight."""
+        by_shift: Dict[int, List[UUID]] = defaultdict(list)
+        for flight_id, shift in shifts.items():
+            by_shift[shift].append(flight_id)
+
+        with transaction.atomic():
+            for shift, flight_ids in by_shift.items():
+                delay = slot * shift
+                for start in range(0, len(flight_ids), BATCH_SIZE):
+                    FlightInstance.objects.filter(
+                        id__in=flight_ids[start : start + BATCH_SIZE],
+                        flight_status=FlightStatusEnum.PENDING.value,
+                    ).update(
+                        scheduled_departure_datetime=F("scheduled_departure_datetime")
+                        + delay,
+                        scheduled_arrival_datetime=F("scheduled_arrival_datetime")
+                        + delay,
+                        updated_at=timezone.now(),
+                    )
+
+    def get_occupancy(self, filters: OccupancyFilterSchema) -> OccupancySchemaList:
+        """Current movements per slot bucket, from the stored schedule."""
+        if filters.window_to <= filters.window_from:
+            raise ValueError("window_to must be after window_from.")
+
+        allocator = SlotAllocator(
+            self._capacities(), timedelta(minutes=filters.slot_minutes), timedelta()
+        )
+        for flight in self._scheduled(filters.window_from, filters.window_to):
+            allocator.book(flight)
+
+        timeline = allocator.timeline(filters.window_from, filters.window_to)
+        if filters.vertiport is not None:
+            timeline = [
+                bucket for bucket in timeline if bucket.vertiport == filters.vertiport
+            ]
+        return OccupancySchemaList(root=timeline)
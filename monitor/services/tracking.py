@@ -9,18 +9,20 @@ from common_tools.schemas.tracking import (
     TrackingSchema,
     TrackingSchemaList,
 )
-from monitor.models import AircraftData, FlightInstance, Tracking
+from monitor.models import (
+    AircraftData,
+    FlightInstance,
+    FlightStatusTransition,
+    Tracking,
+)
+from monitor.services import vertiport_board
+from monitor.services.flight_instance import FlightInstanceService
+from monitor.services.loader import BatchLoader
 
 
 class TrackingService:
     def get_tracking(self, filters: TrackingFilterSchema) -> TrackingSchemaList:
-        queryset = Tracking.objects.select_related(
-            "flight_instance",
-            "flight_instance__aircraft",
-            "flight_instance__route",
-            "flight_instance__departure_vertiport",
-            "flight_instance__arrival_vertiport",
-        ).all()
+        queryset = Tracking.objects.all()
 
         if filters.id is not None:
             queryset = queryset.filter(id=filters.id)
@@ -29,7 +31,13 @@ class TrackingService:
         if filters.active is not None:
             queryset = queryset.filter(active=filters.active)
 
-        schema_list = [TrackingSchema.model_validate(track) for track in queryset]
+        loader = BatchLoader()
+        trackings = loader.attach(list(queryset), "flight_instance")
+        FlightInstanceService().load_related(
+            [track.flight_instance for track in trackings], loader
+        )
+
+        schema_list = [TrackingSchema.model_validate(track) for track in trackings]
         return TrackingSchemaList(root=schema_list)
 
     def _get_flight_instance_or_error(self, pk: UUID) -> FlightInstance:
@@ -45,6 +53,7 @@ class TrackingService:
     ) -> TrackingSchema:
 
         fi = self._get_flight_instance_or_error(payload.flight_instance)
+        previous_status = fi.flight_status
 
         data = payload.model_dump()
 
@@ -65,6 +74,14 @@ class TrackingService:
             fi.flight_status = FlightStatusEnum.TERMINATED
             fi.save()
 
+        if fi.flight_status != previous_status:
+            FlightStatusTransition.objects.create(
+                flight_instance=fi,
+                from_status=previous_status,
+                to_status=fi.flight_status,
+                source=FlightStatusTransition.Source.TRACKING,
+            )
+
         # Creates history
         AircraftData.objects.create(
             flight_instance=fi,
@@ -75,6 +92,8 @@ class TrackingService:
             energy_level=tracking_obj.energy_level,
         )
 
+        vertiport_board.record_tracking(fi, tracking_obj)
+
         return TrackingSchema.model_validate(tracking_obj)
 
     def delete_tracking(self, tracking_id: UUID) -> None:
@@ -10,11 +10,16 @@ from common_tools.schemas.vertiport import (
     VertiportSchemaList,
 )
 from monitor.models import Vertiport
+from monitor.services import reference_cache
+from monitor.services.route_geometry import RouteGeometryService
+from monitor.services.route_planner import invalidate_route_graph
+
+COORDINATE_FIELDS = ("latitude", "longitude", "altitude")
 
 
 class VertiportService:
     def get_vertiport_by_id(self, id: UUID) -> Vertiport | None:
-        vertiport = Vertiport.objects.filter(id=id).first()
+        vertiport = reference_cache.vertiports.get("id", id)
 
         return vertiport
 
@@ -57,16 +62,30 @@ class VertiportService:
 
         update_data = payload.model_dump(exclude_unset=True)
 
+        moved = any(
+            field in update_data and update_data[field] != getattr(vertiport, field)
+            for field in COORDINATE_FIELDS
+        )
+
         for attr, value in update_data.items():
             setattr(vertiport, attr, value)
 
         vertiport.save()
 
+        if moved:
+            RouteGeometryService().invalidate_vertiport(vertiport.id)
+            invalidate_route_graph()
+
         return VertiportSchema.model_validate(vertiport)
 
     def delete_vertiport(self, vertiport_id: UUID) -> None:
         try:
             vertiport = Vertiport.objects.get(id=vertiport_id)
-            vertiport.delete()
         except ObjectDoesNotExist:
             raise ValueError("Vertiport not found. Unable to delete.")
+
+        # Before the delete nulls Waypoint.vertiport and the join stops matching
+        RouteGeometryService().invalidate_vertiport(vertiport.id)
+        vertiport.delete()
+
+        invalidate_route_graph()
@@ -0,0 +1,419 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+from django.utils import timezone
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import FlightInstance, Tracking
+from monitor.schemas.vertiport_board import (
+    BoardAircraftSchema,
+    BoardFlightSchema,
+    VertiportBoardSchema,
+)
+from monitor.services import reference_cache
+
+BATCH_SIZE = 1000
+# Changes made by other processes reach the board within this many seconds
+SYNC_SECONDS = 2.0
+# A transaction may commit rows stamped up to this long before the sync
+SYNC_OVERLAP = timedelta(seconds=30)
+# Full rebuild, which also drops flights deleted by other processes
+REBUILD_SECONDS = 300.0
+# How far back a landing still puts its aircraft on the ground
+GROUND_LOOKBACK = timedelta(days=1)
+
+PENDING = FlightStatusEnum.PENDING.value
+ACTIVATED = FlightStatusEnum.ACTIVATED.value
+TERMINATED = FlightStatusEnum.TERMINATED.value
+
+FLIGHT_FIELDS = (
+    "id",
+    "callsign",
+    "aircraft_id",
+    "flight_status",
+    "departure_vertiport_id",
+    "arrival_vertiport_id",
+    "scheduled_departure_datetime",
+    "scheduled_arrival_datetime",
+)
+TRACKING_FIELDS = (
+    "flight_instance_id",
+    "latitude",
+    "longitude",
+    "altitude",
+    "speed",
+    "updated_at",
+)
+
+
+@dataclass(slots=True)
+class BoardFlight:
+    id: UUID
+    callsign: str | None
+    aircraft_id: UUID
+    flight_status: str
+    departure_vertiport_id: UUID | None
+    arrival_vertiport_id: UUID | None
+    scheduled_departure_datetime: datetime | None
+    scheduled_arrival_datetime: datetime | None
+    latitude: float | None = None
+    longitude: float | None = None
+    altitude: float | None = None
+    speed: float | None = None
+    reported_at: datetime | None = None
+
+
+class OccupancyBoard:
+    """Open flights and parked aircraft of every vertiport, kept in memory.
+
+    Each flight row is applied on its own: PENDING flights are outbound at
+    their departure vertiport, ACTIVATED ones inbound at their arrival
+    vertiport and airborne, and a TERMINATED flight parks its aircraft at
+    the arrival vertiport unless the aircraft is already flying again or
+    landed later elsewhere. Applying a row twice changes nothing, so rows
+    seen both from a hook and from a sync are harmless.
+    """
+
+    def __init__(self):
+        self.flights: Dict[UUID, BoardFlight] = {}  # PENDING and ACTIVATED
+        self.outbound: Dict[UUID, Set[UUID]] = defaultdict(set)
+        self.inbound: Dict[UUID, Set[UUID]] = defaultdict(set)
+        # aircraft -> its ACTIVATED flights
+        self.airborne: Dict[UUID, Set[UUID]] = defaultdict(set)
+        # aircraft -> (vertiport, landing flight, landed at)
+        self.parked: Dict[UUID, Tuple[UUID, UUID, datetime | None]] = {}
+        self.on_ground: Dict[UUID, Set[UUID]] = defaultdict(set)
+        self.watermark = timezone.now()
+        self.built_at = self.synced_at = time.monotonic()
+
+    def _drop(self, flight_id: UUID) -> None:
+        flight = self.flights.pop(flight_id, None)
+        if flight is None:
+            return
+        self.outbound[flight.departure_vertiport_id].discard(flight_id)
+        self.inbound[flight.arrival_vertiport_id].discard(flight_id)
+        self.airborne[flight.aircraft_id].discard(flight_id)
+
+    def _unpark(self, aircraft_id: UUID) -> None:
+        parked = self.parked.pop(aircraft_id, None)
+        if parked is not None:
+            self.on_ground[parked[0]].discard(aircraft_id)
+
+    def _park(self, flight: BoardFlight) -> None:
+        aircraft_id = flight.aircraft_id
+        if self.airborne[aircraft_id]:
+            return
+        landed_at = flight.scheduled_arrival_datetime
+        parked = self.parked.get(aircraft_id)
+        if (
+            parked is not None
+            and parked[1] != flight.id
+            and parked[2] is not None
+            and (landed_at is None or landed_at < parked[2])
+        ):
+            return  # A later landing already parked it
+        self._unpark(aircraft_id)
+        self.parked[aircraft_id] = (flight.arrival_vertiport_id, flight.id, landed_at)
+        self.on_ground[flight.arrival_vertiport_id].add(aircraft_id)
+
+    def apply(self, flight: BoardFlight) -> None:
+        previous = self.flights.get(flight.id)
+        # Rows from the database carry no position: keep the last one
+        if previous is not None and flight.reported_at is None:
+            flight.latitude = previous.latitude
+            flight.longitude = previous.longitude
+            flight.altitude = previous.altitude
+            flight.speed = previous.speed
+            flight.reported_at = previous.reported_at
+        self._drop(flight.id)
+
+        status = flight.flight_status
+        if status == PENDING and flight.departure_vertiport_id is not None:
+            self.flights[flight.id] = flight
+            self.outbound[flight.departure_vertiport_id].add(flight.id)
+        elif status == ACTIVATED:
+            self.flights[flight.id] = flight
+            self.inbound[flight.arrival_vertiport_id].add(flight.id)
+            self.airborne[flight.aircraft_id].add(flight.id)
+            self._unpark(flight.aircraft_id)
+        elif status == TERMINATED and flight.arrival_vertiport_id is not None:
+            self._park(flight)
+
+    def forget(self, flight_id: UUID) -> None:
+        self._drop(flight_id)
+        for aircraft_id, parked in list(self.parked.items()):
+            if parked[1] == flight_id:
+                self._unpark(aircraft_id)
+
+    def report(self, flight_id: UUID, latitude, longitude, altitude, speed, at):
+        flight = self.flights.get(flight_id)
+        if flight is not None and (
+            flight.reported_at is None or at is None or at >= flight.reported_at
+        ):
+            flight.latitude = latitude
+            flight.longitude = longitude
+            flight.altitude = altitude
+            flight.speed = speed
+            flight.reported_at = at
+
+    def build(self, now: datetime) -> None:
+        """Open flights, recent landings and live positions: three queries.
+
+        Runs on a board nobody else sees yet, so it takes no lock.
+        """
+        self.watermark = now
+        open_rows = FlightInstance.objects.filter(
+            flight_status__in=[PENDING, ACTIVATED]
+        ).values(*FLIGHT_FIELDS)
+        # Oldest first, so each aircraft ends up parked at its last landing
+        landed_rows = (
+            FlightInstance.objects.filter(
+                flight_status=TERMINATED,
+                arrival_vertiport__isnull=False,
+                scheduled_arrival_datetime__gte=now - GROUND_LOOKBACK,
+            )
+            .order_by("scheduled_arrival_datetime", "id")
+            .values(*FLIGHT_FIELDS)
+        )
+        for row in open_rows.iterator(chunk_size=2000):
+            self.apply(BoardFlight(**row))
+        for row in landed_rows.iterator(chunk_size=2000):
+            self.apply(BoardFlight(**row))
+        for flight_id, *position in _read_positions():
+            self.report(flight_id, *position)
+
+    def merge(
+        self, now: datetime, flights: List[BoardFlight], positions: List[tuple]
+    ) -> None:
+        """Applies what ``read_changes`` found; the caller holds the lock."""
+        for flight in flights:
+            self.apply(flight)
+        for flight_id, *position in positions:
+            self.report(flight_id, *position)
+        self.watermark = now
+        self.synced_at = time.monotonic()
+
+    def snapshot(
+        self, vertiport_id: UUID, minutes: int, now: datetime
+    ) -> Tuple[
+        List[Tuple[UUID, UUID, datetime | None]], List[BoardFlight], List[BoardFlight]
+    ]:
+        """(parked aircraft, inbound, outbound) of one vertiport, copied.
+
+        Flights due within ``minutes`` are listed; overdue ones stay on the
+        board until they move on.
+        """
+        horizon = now + timedelta(minutes=minutes)
+        on_ground = sorted(
+            (
+                (aircraft_id, *self.parked[aircraft_id][1:])
+                for aircraft_id in self.on_ground.get(vertiport_id, ())
+            ),
+            key=lambda parked: (parked[2] or now, str(parked[0])),
+        )
+        inbound = [
+            replace(flight)
+            for flight in map(self.flights.get, self.inbound.get(vertiport_id, ()))
+            if (flight.scheduled_arrival_datetime or now) <= horizon
+        ]
+        inbound.sort(key=lambda f: (f.scheduled_arrival_datetime or now, str(f.id)))
+        outbound = [
+            replace(flight)
+            for flight in map(self.flights.get, self.outbound.get(vertiport_id, ()))
+            if (flight.scheduled_departure_datetime or now) <= horizon
+        ]
+        outbound.sort(key=lambda f: (f.scheduled_departure_datetime or now, str(f.id)))
+        return on_ground, inbound, outbound
+
+
+def _read_positions(since: datetime | None = None) -> List[tuple]:
+    """Live positions; the board ignores those of flights it does not hold."""
+    queryset = Tracking.objects.filter(active=True)
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
+    return list(queryset.values_list(*TRACKING_FIELDS))
+
+
+def read_changes(since: datetime) -> Tuple[List[BoardFlight], List[tuple]]:
+    """Flights and positions changed since ``since``, read without the lock.
+
+    ``updated_at`` is indexed and stamped by every writer, including the
+    lifecycle job's and slot allocation's set-based updates, so the changes
+    of other processes are found with one range query. A hook may apply a
+    newer row while these are read; the next sync reads it again.
+    """
+    rows = (
+        FlightInstance.objects.filter(updated_at__gte=since)
+        .order_by("updated_at", "id")
+        .values(*FLIGHT_FIELDS)
+    )
+    flights = [BoardFlight(**row) for row in rows.iterator(chunk_size=2000)]
+    return flights, _read_positions(since)
+
+
+_board: OccupancyBoard | None = None
+# Guards the board's contents; held only to apply rows or read a snapshot
+_board_lock = threading.Lock()
+# One thread at a time queries for a build or a sync
+_refresh_lock = threading.Lock()
+
+
+def _flight_of(fi: FlightInstance) -> BoardFlight:
+    return BoardFlight(*(getattr(fi, name) for name in FLIGHT_FIELDS))
+
+
+def get_board() -> OccupancyBoard:
+    """The process's board: built on first use, synced every SYNC_SECONDS.
+
+    Queries run outside ``_board_lock``, so requests and write hooks are
+    not held up by a build or a sync. While one thread refreshes, the
+    others keep serving the board as it is.
+    """
+    global _board
+    with _board_lock:
+        board = _board
+        if board is not None and not _due(board):
+            return board
+
+    # Only the first build makes the others wait
+    if not _refresh_lock.acquire(blocking=board is None):
+        return board
+    try:
+        with _board_lock:
+            board = _board
+            if board is not None and not _due(board):
+                return board  # Refreshed by another thread meanwhile
+            since = board.watermark - SYNC_OVERLAP if board is not None else None
+
+        now = timezone.now()
+        if board is None or time.monotonic() - board.built_at > REBUILD_SECONDS:
+            fresh = OccupancyBoard()
+            fresh.build(now)
+            with _board_lock:
+                _board = fresh
+            return fresh
+
+        flights, positions = read_changes(since)
+        with _board_lock:
+            board.merge(now, flights, positions)
+        return board
+    finally:
+        _refresh_lock.release()
+
+
+def _due(board: OccupancyBoard) -> bool:
+    now = time.monotonic()
+    return (
+        now - board.built_at > REBUILD_SECONDS or now - board.synced_at > SYNC_SECONDS
+    )
+
+
+# Hooks of the writers in this process. They only touch a board already
+# built, so processes that never serve one (the lifecycle job) pay nothing.
+
+
+def notify_flights(fis: Iterable[FlightInstance]) -> None:
+    with _board_lock:
+        if _board is not None:
+            for fi in fis:
+                _board.apply(_flight_of(fi))
+
+
+def refresh_flights(flight_ids: List[UUID]) -> None:
+    """Re-reads flights whose status changed with a set-based update."""
+    if _board is None:
+        return
+    flights = []
+    for start in range(0, len(flight_ids), BATCH_SIZE):
+        rows = FlightInstance.objects.filter(
+            id__in=flight_ids[start : start + BATCH_SIZE]
+        ).values(*FLIGHT_FIELDS)
+        flights.extend(BoardFlight(**row) for row in rows)
+    with _board_lock:
+        if _board is not None:
+            for flight in flights:
+                _board.apply(flight)
+
+
+def forget_flight(flight_id: UUID) -> None:
+    with _board_lock:
+        if _board is not None:
+            _board.forget(flight_id)
+
+
+def record_tracking(fi: FlightInstance, tracking: Tracking) -> None:
+    with _board_lock:
+        if _board is not None:
+            _board.apply(_flight_of(fi))
+            _board.report(
+                fi.id,
+                tracking.latitude,
+                tracking.longitude,
+                tracking.altitude,
+                tracking.speed,
+                tracking.updated_at,
+            )
+
+
+class VertiportBoardService:
+    def get_board(self, vertiport_id: UUID, minutes: int) -> VertiportBoardSchema:
+        vertiport = reference_cache.vertiports.get("id", vertiport_id)
+        if vertiport is None:
+            raise ValueError("Vertiport not found.")
+
+        now = timezone.now()
+        board = get_board()
+        with _board_lock:
+            on_ground, inbound, outbound = board.snapshot(vertiport_id, minutes, now)
+            synced_at = board.watermark
+
+        aircrafts = reference_cache.aircrafts.get_many(
+            {parked[0] for parked in on_ground}
+            | {flight.aircraft_id for flight in (*inbound, *outbound)}
+        )
+
+        def tail_number(aircraft_id: UUID) -> str | None:
+            aircraft = aircrafts.get(aircraft_id)
+            return aircraft.tail_number if aircraft is not None else None
+
+        def flight_schema(flight: BoardFlight) -> BoardFlightSchema:
+            return BoardFlightSchema(
+                id=flight.id,
+                callsign=flight.callsign,
+                flight_status=flight.flight_status,
+                aircraft=flight.aircraft_id,
+                tail_number=tail_number(flight.aircraft_id),
+                departure_vertiport=flight.departure_vertiport_id,
+                arrival_vertiport=flight.arrival_vertiport_id,
+                scheduled_departure_datetime=flight.scheduled_departure_datetime,
+                scheduled_arrival_datetime=flight.scheduled_arrival_datetime,
+                latitude=flight.latitude,
+                longitude=flight.longitude,
+                altitude=flight.altitude,
+                speed=flight.speed,
+                reported_at=flight.reported_at,
+            )
+
+        return VertiportBoardSchema(
+            vertiport=vertiport.id,
+            vertiport_code=vertiport.vertiport_code,
+            minutes=minutes,
+            generated_at=now,
+            synced_at=synced_at,
+            on_ground=[
+                BoardAircraftSchema(
+                    aircraft=aircraft_id,
+                    tail_number=tail_number(aircraft_id),
+                    flight_instance=flight_id,
+                    landed_at=landed_at,
+                )
+                for aircraft_id, flight_id, landed_at in on_ground
+            ],
+            inbound=[flight_schema(flight) for flight in inbound],
+            outbound=[flight_schema(flight) for flight in outbound],
+        )
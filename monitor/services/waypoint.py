@@ -1,6 +1,8 @@
+from typing import List
 from uuid import UUID
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 
 from common_tools.schemas.route import RouteSchema
 from common_tools.schemas.vertiport import VertiportSchema
@@ -12,15 +14,52 @@ from common_tools.schemas.waypoint import (
     WaypointSchemaList,
 )
 from monitor.models import Route, Vertiport, Waypoint
+from monitor.schemas.flight_instance import BulkItemErrorSchema
+from monitor.schemas.waypoint import BulkWaypointResultSchema, RouteWaypointItemSchema
+from monitor.services import reference_cache
+from monitor.services.loader import BatchLoader
 from monitor.services.route import RouteService
-from monitor.services.vertiport import VertiportService
+from monitor.services.route_geometry import RouteGeometryService
+from monitor.services.route_planner import invalidate_route_graph
+
+# Model field each RouteWaypointItemSchema field is written to
+ITEM_FIELDS = {
+    "name": "name",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "altitude": "altitude",
+    "vertiport": "vertiport_id",
+}
+
+
+class BulkWaypointValidationError(ValueError):
+    """Raised when any item of a waypoint list is invalid; nothing is written."""
+
+    def __init__(self, errors: List[BulkItemErrorSchema]):
+        super().__init__(
+            f"{len(errors)} invalid waypoint(s). The route was left unchanged."
+        )
+        self.errors = errors
 
 
 class WaypointService:
-    def get_waypoints(self, filters: WaypointFilterSchema) -> WaypointSchemaList:
-        route_service = RouteService()
-        vertiport_service = VertiportService()
+    def __init__(self):
+        self.geometry = RouteGeometryService()
+
+    def _invalidate(self, route_ids: List[UUID]) -> None:
+        """Drops the routes' geometry and the route graph once committed.
+
+        Dropped earlier, another reader could rebuild both from the old rows
+        and keep them until the TTL. Outside a transaction this runs now.
+        """
+
+        def invalidate():
+            self.geometry.invalidate(route_ids)
+            invalidate_route_graph()
+
+        transaction.on_commit(invalidate)
 
+    def get_waypoints(self, filters: WaypointFilterSchema) -> WaypointSchemaList:
         queryset = Waypoint.objects.all()
 
         if filters.id is not None:
@@ -32,25 +71,17 @@ class WaypointService:
         if filters.name is not None:
             queryset = queryset.filter(name=filters.name)
 
-        waypoint_schema_list = []
-        for waypoint in queryset:
-            route_id = waypoint.route.id
-            vertiport_id = waypoint.vertiport.id if waypoint.vertiport else None
-
-            route = route_service.get_route_by_id(route_id)
-            vertiport = (
-                vertiport_service.get_vertiport_by_id(vertiport_id)
-                if vertiport_id
-                else None
-            )
+        waypoints = BatchLoader().attach(list(queryset), "route", "vertiport")
 
+        waypoint_schema_list = []
+        for waypoint in waypoints:
             waypoint_schema_list.append(
                 WaypointSchema(
                     id=waypoint.id,
-                    route=RouteSchema.model_validate(route),
+                    route=RouteSchema.model_validate(waypoint.route),
                     vertiport=(
-                        VertiportSchema.model_validate(vertiport)
-                        if vertiport is not None
+                        VertiportSchema.model_validate(waypoint.vertiport)
+                        if waypoint.vertiport is not None
                         else None
                     ),
                     name=waypoint.name,
@@ -77,6 +108,8 @@ class WaypointService:
         except Exception as e:
             raise ValueError(f"Failed to create waypoint: {e}")
 
+        self._invalidate([waypoint.route_id])
+
         return WaypointSchema.model_validate(waypoint)
 
     def update_waypoint(
@@ -87,22 +120,21 @@ class WaypointService:
         except ObjectDoesNotExist:
             raise ValueError("Waypoint not found. Unable to update.")
 
+        previous_route_id = waypoint.route_id
         update_data = payload.model_dump(exclude_unset=True)
 
         if "route" in update_data:
-            try:
-                route = Route.objects.get(id=update_data["route"])
-                waypoint.route = route
-            except ObjectDoesNotExist:
+            route = reference_cache.routes.get("id", update_data["route"])
+            if route is None:
                 raise ValueError("Route not found. Unable to update waypoint.")
+            waypoint.route = route
             del update_data["route"]
 
         if "vertiport" in update_data:
-            try:
-                vertiport = Vertiport.objects.get(id=update_data["vertiport"])
-                waypoint.vertiport = vertiport
-            except ObjectDoesNotExist:
+            vertiport = reference_cache.vertiports.get("id", update_data["vertiport"])
+            if vertiport is None:
                 raise ValueError("Vertiport not found. Unable to update waypoint.")
+            waypoint.vertiport = vertiport
             del update_data["vertiport"]
 
         for attr, value in update_data.items():
@@ -110,6 +142,8 @@ class WaypointService:
 
         waypoint.save()
 
+        self._invalidate([previous_route_id, waypoint.route_id])
+
         return WaypointSchema.model_validate(waypoint)
 
     def delete_waypoint(self, waypoint_id: UUID) -> None:
@@ -118,3 +152,110 @@ class WaypointService:
             waypoint.delete()
         except ObjectDoesNotExist:
             raise ValueError("Waypoint not found. Unable to delete.")
+
+        self._invalidate([waypoint.route_id])
+
+    def replace_route_waypoints(
+        self, route_id: UUID, payload: List[RouteWaypointItemSchema]
+    ) -> BulkWaypointResultSchema:
+        """Makes the payload the route's waypoint list, in that order.
+
+        Items with an id update that waypoint, only in the fields they set;
+        items without one are created; waypoints left out are deleted. The
+        list position sets ``sequence_order``, from 1. The new list is
+        diffed against the stored rows and only the differences are
+        written, with one bulk statement per kind, in a single transaction
+        that holds the route locked.
+        """
+        with transaction.atomic():
+            try:
+                route = Route.objects.select_for_update().get(id=route_id)
+            except ObjectDoesNotExist:
+                raise ValueError("Route not found. Unable to update waypoints.")
+
+            existing = {
+                wp.id: wp
+                for wp in Waypoint.objects.filter(route=route).select_related(
+                    "vertiport"
+                )
+            }
+            vertiports = Vertiport.objects.in_bulk(
+                {item.vertiport for item in payload if item.vertiport is not None}
+            )
+
+            errors = []
+            listed = set()
+            for index, item in enumerate(payload):
+                messages = []
+                if item.id is not None:
+                    if item.id in listed:
+                        messages.append("Waypoint listed more than once.")
+                    elif item.id not in existing:
+                        messages.append("Waypoint not found on this route.")
+                    listed.add(item.id)
+                if item.vertiport is not None and item.vertiport not in vertiports:
+                    messages.append("Vertiport not found.")
+                if messages:
+                    errors.append(
+                        BulkItemErrorSchema(index=index, detail=" ".join(messages))
+                    )
+            if errors:
+                raise BulkWaypointValidationError(errors)
+
+            to_create = []
+            to_update = []
+            changed = set()
+            waypoints = []
+            for sequence_order, item in enumerate(payload, start=1):
+                values = {
+                    ITEM_FIELDS[name]: value
+                    for name, value in item.model_dump(
+                        exclude_unset=True, exclude={"id"}
+                    ).items()
+                }
+                values["sequence_order"] = sequence_order
+
+                if item.id is None:
+                    waypoint = Waypoint(route=route, **values)
+                    to_create.append(waypoint)
+                else:
+                    waypoint = existing[item.id]
+                    fields = [
+                        field
+                        for field, value in values.items()
+                        if getattr(waypoint, field) != value
+                    ]
+                    for field in fields:
+                        setattr(waypoint, field, values[field])
+                    if fields:
+                        to_update.append(waypoint)
+                        changed.update(fields)
+
+                if waypoint.vertiport_id in vertiports:
+                    waypoint.vertiport = vertiports[waypoint.vertiport_id]
+                waypoints.append(waypoint)
+
+            removed = existing.keys() - listed
+            if removed:
+                Waypoint.objects.filter(id__in=removed).delete()
+            if to_update:
+                Waypoint.objects.bulk_update(
+                    to_update,
+                    fields=sorted(
+                        "vertiport" if field == "vertiport_id" else field
+                        for field in changed
+                    ),
+                )
+            if to_create:
+                Waypoint.objects.bulk_create(to_create)
+
+            if removed or to_update or to_create:
+                self._invalidate([route.id])
+
+        return BulkWaypointResultSchema(
+            created=len(to_create),
+            updated=len(to_update),
+            deleted=len(removed),
+            unchanged=len(existing) - len(removed) - len(to_update),
+            route=RouteService().to_route_with_waypoints(route, waypoints),
+        )
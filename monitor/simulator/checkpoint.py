@@ -0,0 +1,122 @@
+import os
+import pickle
+from dataclasses import dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from monitor.simulator.path import FlightPath, Point
+from monitor.simulator.state import FlightTable, ManagedFlight
+from monitor.simulator.wind import AirborneState
+
+CHECKPOINT_VERSION = 1
+
+_FLIGHT_FIELDS = tuple(f.name for f in fields(ManagedFlight))
+_AIRBORNE_FIELDS = tuple(f.name for f in fields(AirborneState))
+# UUIDs are stored as their 16 raw bytes: pickling UUID objects dominates
+_UUID_FIELDS = tuple(name == "id" or name.endswith("_id") for name in _FLIGHT_FIELDS)
+
+
+def _pack(value):
+    return value.bytes if isinstance(value, UUID) else value
+
+
+def _unpack(value) -> UUID | None:
+    return UUID(bytes=value) if value is not None else None
+
+
+@dataclass
+class Checkpoint:
+    """Simulator state as of the end of one tick."""
+
+    saved_at: datetime  # Wall-clock time of the save
+    clock_now: datetime  # Simulated time of the last completed tick
+    shard: Tuple[int, int] | None
+    watermark: datetime | None
+    flights: List[ManagedFlight]
+    paths: Dict[UUID, List[Point]]
+    airborne: Dict[UUID, AirborneState]
+
+
+def shard_path(path: str, shard: Tuple[int, int] | None) -> str:
+    """One checkpoint file per worker process."""
+    return f"{path}.w{shard[0]}" if shard else path
+
+
+def save_checkpoint(
+    path: str,
+    *,
+    saved_at: datetime,
+    clock_now: datetime,
+    shard: Tuple[int, int] | None,
+    table: FlightTable,
+    paths: Dict[UUID, FlightPath],
+    airborne: Dict[UUID, AirborneState],
+):
+    """Writes the state as plain tuples; atomic through a rename.
+
+    Only path points are stored, cumulative lengths are rebuilt on load.
+    """
+    data = {
+        "version": CHECKPOINT_VERSION,
+        "saved_at": saved_at,
+        "clock_now": clock_now,
+        "shard": shard,
+        "watermark": table.watermark,
+        "flights": [
+            tuple(_pack(getattr(flight, name)) for name in _FLIGHT_FIELDS)
+            for flight in table.flights.values()
+        ],
+        "paths": {
+            flight_id.bytes: flight_path.points
+            for flight_id, flight_path in paths.items()
+        },
+        "airborne": {
+            flight_id.bytes: tuple(getattr(state, name) for name in _AIRBORNE_FIELDS)
+            for flight_id, state in airborne.items()
+        },
+    }
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as fp:
+        pickle.dump(data, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint | None:
+    """Reads a checkpoint written by ``save_checkpoint``.
+
+    Returns None when there is no file or it was written by another version.
+    The file is trusted: it is only ever written by the simulator itself.
+    """
+    if not Path(path).exists():
+        return None
+
+    with open(path, "rb") as fp:
+        data = pickle.load(fp)
+    if data.get("version") != CHECKPOINT_VERSION:
+        return None
+
+    return Checkpoint(
+        saved_at=data["saved_at"],
+        clock_now=data["clock_now"],
+        shard=data["shard"],
+        watermark=data["watermark"],
+        flights=[
+            ManagedFlight(
+                *(
+                    _unpack(value) if is_uuid else value
+                    for value, is_uuid in zip(row, _UUID_FIELDS)
+                )
+            )
+            for row in data["flights"]
+        ],
+        paths={
+            UUID(bytes=flight_id): points for flight_id, points in data["paths"].items()
+        },
+        airborne={
+            UUID(bytes=flight_id): AirborneState(*row)
+            for flight_id, row in data["airborne"].items()
+        },
+    )
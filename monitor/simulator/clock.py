@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+def parse_option_datetime(value: str | None, option: str) -> datetime | None:
+    """Aware datetime of a command's datetime option; naive means local time."""
+    if value is None:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise CommandError(f"Invalid {option} datetime: {value}")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class SimulationClock:
+    """Simulated time that advances a fixed step per tick.
+
+    Every tick moves simulated time forward by ``tick * time_scale`` seconds
+    regardless of how long the tick took to process, so the same start time
+    and scale always replay the same sequence of simulated instants.
+    """
+
+    def __init__(self, start: datetime, time_scale: float = 1.0, tick: float = 5.0):
+        if time_scale <= 0:
+            raise ValueError("time_scale must be positive.")
+        if tick <= 0:
+            raise ValueError("tick must be positive.")
+
+        self.start = start
+        self.time_scale = time_scale
+        self.tick = tick
+        self.ticks = 0
+
+    @property
+    def step(self) -> timedelta:
+        """Simulated time covered by one tick."""
+        return timedelta(seconds=self.tick * self.time_scale)
+
+    def now(self) -> datetime:
+        return self.start + self.step * self.ticks
+
+    def advance(self, ticks: int = 1) -> datetime:
+        self.ticks += ticks
+        return self.now()
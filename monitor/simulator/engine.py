@@ -0,0 +1,240 @@
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import IntEnum
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+from django.db.models import Prefetch
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import FlightInstance, Waypoint
+from monitor.simulator.path import FlightPath, build_points
+from monitor.simulator.performance import MIN_ENERGY, energy_at
+
+TURNAROUND = timedelta(minutes=5)  # Pad time before departure / after arrival
+DEFAULT_MAX_ENERGY = 100.0
+
+
+class EventKind(IntEnum):
+    # Same-instant ordering: pads are freed before they are taken
+    PAD_RELEASE = 0
+    DEPARTURE = 1
+    WAYPOINT = 2
+    ARRIVAL = 3
+    BOARDING = 4
+
+
+@dataclass(slots=True)
+class SimFlight:
+    """A flight as the offline engine sees it (no ORM objects)."""
+
+    id: UUID
+    departure_vertiport_id: UUID
+    arrival_vertiport_id: UUID
+    departure: datetime
+    duration_s: float
+    path: FlightPath
+    max_energy: float
+    burn_factor: float = 1.0
+    scheduled_arrival: datetime | None = None
+
+    @property
+    def arrival(self) -> datetime:
+        return self.departure + timedelta(seconds=self.duration_s)
+
+
+@dataclass(slots=True)
+class VertiportStats:
+    departures: int = 0
+    arrivals: int = 0
+    occupancy: int = 0
+    peak_occupancy: int = 0
+    energy_used: float = 0.0  # By flights departing from here
+    arrival_energy_total: float = 0.0
+    min_arrival_energy: float | None = None
+    reserve_breaches: int = 0
+    hourly_movements: Dict[datetime, int] = field(default_factory=dict)
+
+    @property
+    def peak_hourly_movements(self) -> int:
+        return max(self.hourly_movements.values(), default=0)
+
+    @property
+    def mean_arrival_energy(self) -> float | None:
+        return self.arrival_energy_total / self.arrivals if self.arrivals else None
+
+
+@dataclass
+class SimulationResult:
+    vertiports: Dict[UUID, VertiportStats]
+    flights: int = 0
+    events: int = 0
+    waypoint_passages: int = 0
+    peak_airborne: int = 0
+    arrival_delays_s: List[float] = field(default_factory=list)
+
+
+class DiscreteEventEngine:
+    """Event-driven run of a flight schedule, with no fixed ticks.
+
+    Every flight produces BOARDING → DEPARTURE → WAYPOINT… → ARRIVAL →
+    PAD_RELEASE events on a single priority queue. Waypoint events are
+    scheduled one at a time per flight, so the queue only holds the next
+    event of each flight. Passage times follow the arc-length position
+    along the path, like the live simulator.
+    """
+
+    def __init__(self, flights: Iterable[SimFlight], turnaround=TURNAROUND):
+        self.flights: List[SimFlight] = list(flights)
+        self.turnaround = turnaround
+
+    def run(self) -> SimulationResult:
+        result = SimulationResult(
+            vertiports=defaultdict(VertiportStats), flights=len(self.flights)
+        )
+        airborne = 0
+        queue: list = []
+        seq = 0
+
+        def push(when: datetime, kind: EventKind, index: int, wp_index: int = 0):
+            nonlocal seq
+            heapq.heappush(queue, (when, kind, seq, index, wp_index))
+            seq += 1
+
+        for index, flight in enumerate(self.flights):
+            push(flight.departure - self.turnaround, EventKind.BOARDING, index)
+
+        while queue:
+            when, kind, _, index, wp_index = heapq.heappop(queue)
+            flight = self.flights[index]
+            result.events += 1
+
+            if kind == EventKind.BOARDING:
+                self._take_pad(result.vertiports[flight.departure_vertiport_id])
+                push(flight.departure, EventKind.DEPARTURE, index)
+
+            elif kind == EventKind.DEPARTURE:
+                stats = result.vertiports[flight.departure_vertiport_id]
+                stats.occupancy -= 1
+                stats.departures += 1
+                self._count_movement(stats, when)
+                airborne += 1
+                result.peak_airborne = max(result.peak_airborne, airborne)
+                self._push_next_waypoint(push, flight, index, 1)
+
+            elif kind == EventKind.WAYPOINT:
+                result.waypoint_passages += 1
+                self._push_next_waypoint(push, flight, index, wp_index + 1)
+
+            elif kind == EventKind.ARRIVAL:
+                airborne -= 1
+                energy = energy_at(flight.max_energy, 1.0, flight.burn_factor)
+
+                dep_stats = result.vertiports[flight.departure_vertiport_id]
+                dep_stats.energy_used += flight.max_energy - energy
+
+                stats = result.vertiports[flight.arrival_vertiport_id]
+                stats.arrivals += 1
+                self._count_movement(stats, when)
+                self._take_pad(stats)
+                stats.arrival_energy_total += energy
+                if (
+                    stats.min_arrival_energy is None
+                    or energy < stats.min_arrival_energy
+                ):
+                    stats.min_arrival_energy = energy
+                if energy < MIN_ENERGY:
+                    stats.reserve_breaches += 1
+
+                if flight.scheduled_arrival is not None:
+                    result.arrival_delays_s.append(
+                        (when - flight.scheduled_arrival).total_seconds()
+                    )
+                push(when + self.turnaround, EventKind.PAD_RELEASE, index)
+
+            elif kind == EventKind.PAD_RELEASE:
+                result.vertiports[flight.arrival_vertiport_id].occupancy -= 1
+
+        result.vertiports = dict(result.vertiports)
+        return result
+
+    def _push_next_waypoint(self, push, flight: SimFlight, index: int, wp_index: int):
+        path = flight.path
+        # Intermediate points only; the last point is the arrival vertiport
+        if wp_index < len(path.points) - 1 and path.total_length > 0:
+            fraction = path.cumulative[wp_index] / path.total_length
+            when = flight.departure + timedelta(seconds=flight.duration_s * fraction)
+            push(when, EventKind.WAYPOINT, index, wp_index)
+        else:
+            push(flight.arrival, EventKind.ARRIVAL, index)
+
+    def _take_pad(self, stats: VertiportStats):
+        stats.occupancy += 1
+        stats.peak_occupancy = max(stats.peak_occupancy, stats.occupancy)
+
+    def _count_movement(self, stats: VertiportStats, when: datetime):
+        hour = when.replace(minute=0, second=0, microsecond=0)
+        stats.hourly_movements[hour] = stats.hourly_movements.get(hour, 0) + 1
+
+
+def load_schedule(window_from: datetime, window_to: datetime) -> List[SimFlight]:
+    """Scheduled flights departing in the window, as engine input.
+
+    Paths are built once per (route, departure, arrival) and shared by every
+    flight flying it. Flights without usable times or vertiports are left out.
+    """
+    queryset = (
+        FlightInstance.objects.filter(
+            scheduled_departure_datetime__gte=window_from,
+            scheduled_departure_datetime__lt=window_to,
+            scheduled_departure_datetime__isnull=False,
+            scheduled_arrival_datetime__isnull=False,
+        )
+        .exclude(flight_status=FlightStatusEnum.CANCELLED.value)
+        .select_related("aircraft", "departure_vertiport", "arrival_vertiport", "route")
+        .prefetch_related(
+            Prefetch(
+                "route__route_waypoints",
+                queryset=Waypoint.objects.select_related("vertiport").order_by(
+                    "sequence_order"
+                ),
+            )
+        )
+    )
+
+    paths: Dict[tuple, FlightPath] = {}
+    flights: List[SimFlight] = []
+    for fi in queryset:
+        waypoints = list(fi.route.route_waypoints.all()) if fi.route else []
+        dep = fi.departure_vertiport or (waypoints[0].vertiport if waypoints else None)
+        arr = fi.arrival_vertiport or (waypoints[-1].vertiport if waypoints else None)
+        if not dep or not arr:
+            continue
+
+        duration_s = (
+            fi.scheduled_arrival_datetime - fi.scheduled_departure_datetime
+        ).total_seconds()
+        if duration_s <= 0:
+            continue
+
+        key = (fi.route_id, dep.id, arr.id)
+        path = paths.get(key)
+        if path is None:
+            path = paths[key] = FlightPath(build_points(dep, arr, waypoints))
+
+        flights.append(
+            SimFlight(
+                id=fi.id,
+                departure_vertiport_id=dep.id,
+                arrival_vertiport_id=arr.id,
+                departure=fi.scheduled_departure_datetime,
+                duration_s=duration_s,
+                path=path,
+                max_energy=fi.aircraft.energy_fuel or DEFAULT_MAX_ENERGY,
+                scheduled_arrival=fi.scheduled_arrival_datetime,
+            )
+        )
+
+    return flights
@@ -0,0 +1,61 @@
+import random
+from typing import Dict, List, Sequence
+
+# Samples kept per reservoir: percentiles stay within ~1% of rank at any run
+# length while memory stays fixed
+RESERVOIR_SIZE = 10_000
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+def latency_summary(latencies_ms: Sequence[float]) -> Dict[str, float]:
+    """p50/p90/p99/max of request latencies in milliseconds."""
+    values = sorted(latencies_ms)
+    return {
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": values[-1] if values else 0.0,
+    }
+
+
+class LatencyReservoir:
+    """Fixed-size uniform sample of a stream of latencies.
+
+    Keeps at most ``size`` values (reservoir sampling, Algorithm R), so
+    long runs report percentiles without holding every value. The count
+    and the maximum are exact.
+    """
+
+    def __init__(self, size: int = RESERVOIR_SIZE, seed: int | None = None):
+        self.size = size
+        self.count = 0
+        self.max = 0.0
+        self.samples: List[float] = []
+        self._rng = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float):
+        self.count += 1
+        self.max = max(self.max, value)
+        if len(self.samples) < self.size:
+            self.samples.append(value)
+            return
+        slot = self._rng.randrange(self.count)
+        if slot < self.size:
+            self.samples[slot] = value
+
+    def summary(self) -> Dict[str, float]:
+        summary = latency_summary(self.samples)
+        summary["max"] = self.max
+        return summary
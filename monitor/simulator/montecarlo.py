@@ -0,0 +1,136 @@
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from typing import Dict, List
+from uuid import UUID
+
+from django.db import connections
+
+from monitor.simulator.engine import DiscreteEventEngine, SimFlight
+from monitor.simulator.metrics import percentile
+
+DELAY_DISTRIBUTIONS = ("exponential", "normal", "uniform")
+MIN_SPEED_FACTOR = 0.5
+
+# Base schedule of each pool process, set once by the initializer
+_flights: List[SimFlight] = []
+_perturbation = None
+
+
+@dataclass(frozen=True)
+class Perturbation:
+    """Random variation applied to every flight of a run."""
+
+    delay_mean_s: float = 0.0
+    delay_dist: str = "exponential"
+    speed_sd: float = 0.0  # Relative std dev of ground speed
+    energy_sd: float = 0.0  # Relative std dev of energy burn
+
+    def sample_delay(self, rng: random.Random) -> float:
+        if self.delay_mean_s <= 0:
+            return 0.0
+        if self.delay_dist == "normal":
+            return max(0.0, rng.gauss(self.delay_mean_s, self.delay_mean_s / 2))
+        if self.delay_dist == "uniform":
+            return rng.uniform(0.0, 2 * self.delay_mean_s)
+        return rng.expovariate(1 / self.delay_mean_s)
+
+    def apply(self, flights: List[SimFlight], rng: random.Random) -> List[SimFlight]:
+        varied = []
+        for flight in flights:
+            speed_factor = max(MIN_SPEED_FACTOR, rng.gauss(1.0, self.speed_sd))
+            varied.append(
+                replace(
+                    flight,
+                    departure=flight.departure
+                    + timedelta(seconds=self.sample_delay(rng)),
+                    duration_s=flight.duration_s / speed_factor,
+                    burn_factor=max(0.0, rng.gauss(1.0, self.energy_sd)),
+                )
+            )
+        return varied
+
+
+def _init_worker(flights: List[SimFlight], perturbation: Perturbation):
+    global _flights, _perturbation
+    _flights = flights
+    _perturbation = perturbation
+
+
+def run_variation(args) -> Dict:
+    """One randomized run; returns a compact summary for aggregation."""
+    run_index, seed = args
+    rng = random.Random(seed * 1_000_003 + run_index)
+    result = DiscreteEventEngine(_perturbation.apply(_flights, rng)).run()
+
+    delays = sorted(result.arrival_delays_s)
+    return {
+        "run": run_index,
+        "delay_mean_s": sum(delays) / len(delays) if delays else 0.0,
+        "delay_p95_s": percentile(delays, 95),
+        "delay_max_s": delays[-1] if delays else 0.0,
+        "peak_occupancy": {
+            vertiport_id: stats.peak_occupancy
+            for vertiport_id, stats in result.vertiports.items()
+        },
+        "reserve_breaches": sum(
+            stats.reserve_breaches for stats in result.vertiports.values()
+        ),
+    }
+
+
+def run_monte_carlo(
+    flights: List[SimFlight],
+    perturbation: Perturbation,
+    runs: int,
+    processes: int,
+    seed: int = 0,
+) -> List[Dict]:
+    """Runs the variations across a fork-based process pool.
+
+    The base schedule is shipped once per process through the initializer;
+    each task only carries its run index.
+    """
+    # Forked children must not share the parent's DB connections
+    connections.close_all()
+
+    ctx = multiprocessing.get_context("fork")
+    chunksize = max(1, runs // (processes * 4))
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(flights, perturbation),
+    ) as pool:
+        return list(
+            pool.map(
+                run_variation,
+                [(run_index, seed) for run_index in range(runs)],
+                chunksize=chunksize,
+            )
+        )
+
+
+def distribution(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    return {
+        "p5": percentile(values, 5),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": values[-1] if values else 0.0,
+    }
+
+
+def peak_occupancy_distributions(
+    summaries: List[Dict],
+) -> Dict[UUID, Dict[str, float]]:
+    per_vertiport: Dict[UUID, List[float]] = {}
+    for summary in summaries:
+        for vertiport_id, peak in summary["peak_occupancy"].items():
+            per_vertiport.setdefault(vertiport_id, []).append(peak)
+    return {
+        vertiport_id: distribution(peaks)
+        for vertiport_id, peaks in per_vertiport.items()
+    }
@@ -0,0 +1,142 @@
+import math
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+EARTH_RADIUS_M = 6371008.8  # Mean Earth radius (IUGG)
+
+Point = Tuple[float, float, float]
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two lat/lon points."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+
+    a = (
+        math.sin(dphi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bearing_deg(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Initial great-circle bearing from point 1 to point 2 (0 = north)."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dlambda = math.radians(lon2 - lon1)
+
+    y = math.sin(dlambda) * math.cos(phi2)
+    x = math.cos(phi1) * math.sin(phi2) - math.sin(phi1) * math.cos(phi2) * math.cos(
+        dlambda
+    )
+    return math.degrees(math.atan2(y, x)) % 360
+
+
+def waypoint_point(wp) -> Point | None:
+    """(lat, lon, alt) of a waypoint, or None if it has no coordinates.
+
+    Each of the waypoint's own values wins; the vertiport's only fills those
+    left empty, so an overflight keeps its own altitude above the pad.
+    """
+    vertiport = wp.vertiport
+    lat, lon, alt = (
+        own if own is not None else getattr(vertiport, name, None)
+        for name, own in (
+            ("latitude", wp.latitude),
+            ("longitude", wp.longitude),
+            ("altitude", wp.altitude),
+        )
+    )
+    if lat is None or lon is None:
+        return None
+    return float(lat), float(lon), float(alt or 0.0)
+
+
+def waypoint_points(waypoints: Iterable) -> List[Point]:
+    """(lat, lon, alt) of waypoints ordered by ``sequence_order``.
+
+    Waypoints with no coordinates, their own or their vertiport's, are
+    left out.
+    """
+    return [point for point in map(waypoint_point, waypoints) if point is not None]
+
+
+def join_points(dep, arr, route_points: Sequence[Point]) -> List[Point]:
+    """Flight path points: departure → route points → arrival."""
+    if not dep or not arr:
+        return [(0.0, 0.0, 1000.0)]
+
+    return [
+        (float(dep.latitude), float(dep.longitude), float(dep.altitude)),
+        *route_points,
+        (float(arr.latitude), float(arr.longitude), float(arr.altitude)),
+    ]
+
+
+def build_points(dep, arr, waypoints: Iterable) -> List[Point]:
+    """Flight path points: departure → waypoints → arrival.
+
+    ``dep``/``arr`` are vertiports and ``waypoints`` are ordered by
+    ``sequence_order`` (see ``waypoint_points``).
+    """
+    return join_points(dep, arr, waypoint_points(waypoints))
+
+
+class FlightPath:
+    """Ordered (lat, lon, alt) points with cumulative segment lengths.
+
+    Lengths are computed once so that every position lookup is a binary
+    search over the cumulative distances instead of a walk over the path.
+    """
+
+    __slots__ = ("points", "cumulative", "total_length")
+
+    def __init__(self, points: Sequence[Point]):
+        if not points:
+            raise ValueError("FlightPath requires at least one point.")
+
+        self.points: List[Point] = list(points)
+        self.cumulative: List[float] = [0.0]
+        for (lat1, lon1, _), (lat2, lon2, _) in zip(self.points, self.points[1:]):
+            self.cumulative.append(
+                self.cumulative[-1] + haversine_m(lat1, lon1, lat2, lon2)
+            )
+        self.total_length: float = self.cumulative[-1]
+
+    def _segment(self, target: float) -> int:
+        # Last segment whose start is <= target
+        return min(bisect_right(self.cumulative, target) - 1, len(self.points) - 2)
+
+    def interpolate(self, progress: float) -> Dict[str, float]:
+        """Position at a fraction (0-1) of the total path length."""
+        if len(self.points) == 1 or self.total_length <= 0:
+            lat, lon, alt = self.points[0]
+            return {"lat": lat, "lon": lon, "alt": alt}
+
+        target = max(0.0, min(progress, 1.0)) * self.total_length
+        seg_idx = self._segment(target)
+        seg_start = self.cumulative[seg_idx]
+        seg_len = self.cumulative[seg_idx + 1] - seg_start
+        seg_t = (target - seg_start) / seg_len if seg_len > 0 else 0.0
+
+        lat1, lon1, alt1 = self.points[seg_idx]
+        lat2, lon2, alt2 = self.points[seg_idx + 1]
+
+        lat = lat1 + (lat2 - lat1) * seg_t
+        lon = lon1 + (lon2 - lon1) * seg_t
+        alt = alt1 + (alt2 - alt1) * seg_t
+
+        return {"lat": lat, "lon": lon, "alt": alt}
+
+    def track_at(self, progress: float) -> float:
+        """Bearing (degrees) of the segment flown at a fraction of the path."""
+        if len(self.points) == 1 or self.total_length <= 0:
+            return 0.0
+
+        target = max(0.0, min(progress, 1.0)) * self.total_length
+        seg_idx = self._segment(target)
+        lat1, lon1, _ = self.points[seg_idx]
+        lat2, lon2, _ = self.points[seg_idx + 1]
+        return bearing_deg(lat1, lon1, lat2, lon2)
@@ -0,0 +1,17 @@
+CRUISE_SPEED_KTS = 80.0
+MIN_ENERGY = 20.0  # Reserve energy on landing
+KTS_TO_MPS = 0.514444
+
+
+def energy_at(max_energy: float, progress: float, burn_factor: float = 1.0) -> float:
+    """Monotonic decreasing energy: always decreases, never increases.
+
+    With ``burn_factor`` 1.0 the aircraft lands exactly on the reserve;
+    higher factors eat into it.
+    """
+    return max_energy - (max_energy - MIN_ENERGY) * progress * burn_factor
+
+
+def flight_seconds(length_m: float, speed_kts: float = CRUISE_SPEED_KTS) -> float:
+    """Time to fly a path length at the given ground speed."""
+    return length_m / (speed_kts * KTS_TO_MPS)
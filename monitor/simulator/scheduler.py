@@ -0,0 +1,69 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Tuple
+
+PHASES = ("query", "path", "interpolation", "send")
+
+
+class TickScheduler:
+    """Fixed-period ticks aligned to the monotonic clock.
+
+    Tick ``n`` is due at ``origin + n * period`` no matter how long the
+    previous ticks took, so processing time never accumulates as drift.
+    When a tick overruns its period the missed boundaries are skipped and
+    the loop resumes on the current slot of the grid.
+    """
+
+    def __init__(self, period: float, origin: float | None = None):
+        if period <= 0:
+            raise ValueError("period must be positive.")
+
+        self.period = period
+        # CLOCK_MONOTONIC is system-wide, so forked workers can share an origin
+        self.origin = time.monotonic() if origin is None else origin
+        self.tick = 0
+        self.overruns = 0
+        self.skipped = 0
+
+    def wait_next(self) -> Tuple[float, int]:
+        """Sleeps until the next tick is due.
+
+        Returns how late the next tick starts (seconds) and how many tick
+        boundaries were skipped to get back on the grid.
+        """
+        next_tick = self.tick + 1
+        deadline = self.origin + next_tick * self.period
+        now = time.monotonic()
+
+        if now <= deadline:
+            time.sleep(deadline - now)
+            self.tick = next_tick
+            return 0.0, 0
+
+        current = int((now - self.origin) // self.period)
+        skipped = current - next_tick
+        self.tick = current
+        self.overruns += 1
+        self.skipped += skipped
+        return now - deadline, skipped
+
+
+class PhaseTimer:
+    """Accumulated wall time per named phase within a tick."""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] += time.perf_counter() - started
+
+    def summary(self) -> str:
+        return " ".join(
+            f"{name}={self.totals.get(name, 0.0) * 1000:.0f}ms" for name in PHASES
+        )
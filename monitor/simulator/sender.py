@@ -0,0 +1,97 @@
+import queue
+import threading
+import time
+from http import HTTPStatus
+from typing import Dict, Hashable, List
+
+import requests
+
+from monitor.simulator.metrics import LatencyReservoir
+
+REQUEST_TIMEOUT = 10  # seconds
+
+
+class TrackingSender:
+    """Posts tracking bodies from a pool of keep-alive sessions.
+
+    Each sender thread drains its own queue. Bodies submitted with a ``key``
+    (a flight id) always go to the same thread, so the reports of a flight
+    reach the server in the order they were submitted; bodies without one
+    are spread round-robin. At most ``max_in_flight`` bodies are queued and
+    ``submit`` blocks beyond that, so memory stays bounded when the server
+    falls behind. A sample of latencies and every response status are
+    recorded for reporting.
+    """
+
+    def __init__(self, url: str, concurrency: int = 8, max_in_flight: int = 0):
+        self.url = url
+        self.latencies_ms = LatencyReservoir()
+        self.status_counts: Dict[object, int] = {}
+        self._lock = threading.Lock()
+        per_thread = max(1, (max_in_flight or concurrency * 4) // concurrency)
+        self._queues: List[queue.Queue] = [
+            queue.Queue(maxsize=per_thread) for _ in range(concurrency)
+        ]
+        self._next = 0
+        self._threads = [
+            threading.Thread(target=self._drain, args=(bodies,), daemon=True)
+            for bodies in self._queues
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, body: str, key: Hashable | None = None):
+        if key is None:
+            index = self._next
+            self._next = (self._next + 1) % len(self._queues)
+        else:
+            index = hash(key) % len(self._queues)
+        self._queues[index].put(body)
+
+    def close(self):
+        for bodies in self._queues:
+            bodies.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    @property
+    def ok(self) -> int:
+        return self.status_counts.get(HTTPStatus.CREATED, 0)
+
+    @property
+    def errors(self) -> int:
+        return sum(
+            count
+            for key, count in self.status_counts.items()
+            if key != HTTPStatus.CREATED
+        )
+
+    def _drain(self, bodies: queue.Queue):
+        # One keep-alive session per sender thread
+        with requests.Session() as session:
+            while (body := bodies.get()) is not None:
+                self._send(session, body)
+
+    def _send(self, session: requests.Session, body: str):
+        t0 = time.perf_counter()
+        try:
+            response = session.post(
+                self.url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=REQUEST_TIMEOUT,
+            )
+            key = response.status_code
+        except requests.RequestException as e:
+            key = type(e).__name__
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+
+        with self._lock:
+            self.latencies_ms.add(elapsed_ms)
+            self.status_counts[key] = self.status_counts.get(key, 0) + 1
@@ -0,0 +1,274 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from django.db import transaction
+from django.utils import timezone
+
+from common_tools.schemas.flight_instance import FlightStatusEnum
+from monitor.models import AircraftData, FlightInstance, Tracking, Vertiport
+from monitor.services.flight_lifecycle import FlightLifecycleService
+from monitor.simulator.performance import MIN_ENERGY
+
+WATERMARK_OVERLAP = timedelta(seconds=5)
+MANAGED_STATUSES = (
+    FlightStatusEnum.PENDING.value,
+    FlightStatusEnum.ACTIVATED.value,
+)
+BATCH_SIZE = 1000
+
+
+@dataclass(slots=True)
+class ManagedFlight:
+    """Compact row of a flight the simulator is driving."""
+
+    id: UUID
+    flight_status: str
+    aircraft_id: UUID
+    max_energy: float | None
+    route_id: UUID | None
+    departure_vertiport_id: UUID | None
+    arrival_vertiport_id: UUID | None
+    scheduled_departure_datetime: datetime | None
+    scheduled_arrival_datetime: datetime | None
+
+
+class FlightTable:
+    """In-memory table of PENDING/ACTIVATED flights kept in sync incrementally.
+
+    The first refresh loads every managed flight. Later refreshes only read
+    rows whose ``updated_at`` moved past the watermark, so the per-tick DB
+    cost follows the number of changed flights, not the fleet size.
+    """
+
+    def __init__(self, owns: Callable[[UUID], bool] | None = None):
+        self.flights: Dict[UUID, ManagedFlight] = {}
+        self.vertiports: Dict[UUID, Vertiport] = {}
+        self.watermark: datetime | None = None
+        self._owns = owns or (lambda flight_instance_id: True)
+
+    def refresh(self) -> int:
+        """Applies new and changed flights. Returns the number of rows read."""
+        started = timezone.now()
+
+        if self.watermark is None:
+            queryset = FlightInstance.objects.filter(flight_status__in=MANAGED_STATUSES)
+        else:
+            # Overlap covers late commits and clock skew; upserts are idempotent
+            queryset = FlightInstance.objects.filter(
+                updated_at__gte=self.watermark - WATERMARK_OVERLAP
+            )
+
+        rows = queryset.values(
+            "id",
+            "flight_status",
+            "aircraft_id",
+            "aircraft__energy_fuel",
+            "route_id",
+            "departure_vertiport_id",
+            "arrival_vertiport_id",
+            "scheduled_departure_datetime",
+            "scheduled_arrival_datetime",
+        )
+
+        count = 0
+        vertiport_ids = set()
+        for row in rows:
+            count += 1
+            if row["flight_status"] not in MANAGED_STATUSES or not self._owns(
+                row["id"]
+            ):
+                self.flights.pop(row["id"], None)
+                continue
+
+            self.flights[row["id"]] = ManagedFlight(
+                id=row["id"],
+                flight_status=row["flight_status"],
+                aircraft_id=row["aircraft_id"],
+                max_energy=row["aircraft__energy_fuel"],
+                route_id=row["route_id"],
+                departure_vertiport_id=row["departure_vertiport_id"],
+                arrival_vertiport_id=row["arrival_vertiport_id"],
+                scheduled_departure_datetime=row["scheduled_departure_datetime"],
+                scheduled_arrival_datetime=row["scheduled_arrival_datetime"],
+            )
+            vertiport_ids.add(row["departure_vertiport_id"])
+            vertiport_ids.add(row["arrival_vertiport_id"])
+
+        self.watermark = started
+        self.load_vertiports(vertiport_ids)
+
+        return count
+
+    def restore(self, flights: Iterable[ManagedFlight], watermark: datetime | None):
+        """Reloads a checkpointed table; the next refresh reads what changed since."""
+        self.flights = {
+            flight.id: flight for flight in flights if self._owns(flight.id)
+        }
+        self.watermark = watermark
+        self.load_vertiports(
+            vertiport_id
+            for flight in self.flights.values()
+            for vertiport_id in (
+                flight.departure_vertiport_id,
+                flight.arrival_vertiport_id,
+            )
+        )
+
+    def catch_up(
+        self, now: datetime, activation_half_window: timedelta
+    ) -> Tuple[int, int, int]:
+        """Bulk-applies the transitions missed while the simulator was down.
+
+        Flights past their scheduled arrival end as the lifecycle job ends
+        them: PENDING ones are cancelled, ACTIVATED ones terminated with
+        their live Tracking closed at the arrival vertiport. PENDING flights
+        that left the activation window but are still en route are
+        activated. Runs a handful of set-based statements per batch instead
+        of one API round trip per flight. Returns (activated, cancelled,
+        terminated).
+        """
+        to_end: List[UUID] = []
+        to_activate: List[UUID] = []
+        for flight in self.flights.values():
+            departure = flight.scheduled_departure_datetime
+            arrival = flight.scheduled_arrival_datetime
+            if departure is None or arrival is None:
+                continue
+            if arrival <= now:
+                to_end.append(flight.id)
+            elif (
+                flight.flight_status == FlightStatusEnum.PENDING.value
+                and departure < now - activation_half_window
+            ):
+                to_activate.append(flight.id)
+
+        # Same audited transitions as the lifecycle job
+        lifecycle = FlightLifecycleService()
+        activated = cancelled = terminated = 0
+        with transaction.atomic():
+            for start in range(0, len(to_end), BATCH_SIZE):
+                batch = to_end[start : start + BATCH_SIZE]
+                # Each guarded by the status in the database, not the table's
+                cancelled += len(
+                    lifecycle.transition(
+                        FlightInstance.objects.filter(id__in=batch),
+                        FlightStatusEnum.PENDING.value,
+                        FlightStatusEnum.CANCELLED.value,
+                        now,
+                    )
+                )
+                ended = lifecycle.transition(
+                    FlightInstance.objects.filter(id__in=batch),
+                    FlightStatusEnum.ACTIVATED.value,
+                    FlightStatusEnum.TERMINATED.value,
+                    now,
+                )
+                terminated += len(ended)
+                self._close_tracking(ended, now)
+
+            for start in range(0, len(to_activate), BATCH_SIZE):
+                activated += len(
+                    lifecycle.transition(
+                        FlightInstance.objects.filter(
+                            id__in=to_activate[start : start + BATCH_SIZE]
+                        ),
+                        FlightStatusEnum.PENDING.value,
+                        FlightStatusEnum.ACTIVATED.value,
+                        now,
+                    )
+                )
+
+        for flight_instance_id in to_end:
+            self.flights.pop(flight_instance_id, None)
+        for flight_instance_id in to_activate:
+            self.set_status(flight_instance_id, FlightStatusEnum.ACTIVATED.value)
+
+        return activated, cancelled, terminated
+
+    def _close_tracking(self, flight_instance_ids: List[UUID], now: datetime):
+        """Final report at the arrival vertiport, as the simulator would post."""
+        trackings = list(
+            Tracking.objects.filter(
+                flight_instance_id__in=flight_instance_ids, active=True
+            )
+        )
+        history = []
+        for tracking in trackings:
+            flight = self.flights[tracking.flight_instance_id]
+            arr = self.vertiport(flight.arrival_vertiport_id)
+            if arr:
+                tracking.latitude = float(arr.latitude)
+                tracking.longitude = float(arr.longitude)
+                tracking.altitude = float(arr.altitude or 0.0)
+            tracking.speed = 0.0
+            tracking.energy_level = MIN_ENERGY
+            tracking.active = False
+            tracking.finished_at = now
+            tracking.updated_at = timezone.now()
+            history.append(
+                AircraftData(
+                    flight_instance_id=tracking.flight_instance_id,
+                    latitude=tracking.latitude,
+                    longitude=tracking.longitude,
+                    altitude=tracking.altitude,
+                    speed=tracking.speed,
+                    energy_level=tracking.energy_level,
+                )
+            )
+
+        Tracking.objects.bulk_update(
+            trackings,
+            [
+                "latitude",
+                "longitude",
+                "altitude",
+                "speed",
+                "energy_level",
+                "active",
+                "finished_at",
+                "updated_at",
+            ],
+        )
+        AircraftData.objects.bulk_create(history)
+
+    def load_vertiports(self, vertiport_ids: Iterable[UUID | None]):
+        missing = {
+            vertiport_id
+            for vertiport_id in vertiport_ids
+            if vertiport_id is not None and vertiport_id not in self.vertiports
+        }
+        if missing:
+            self.vertiports.update(Vertiport.objects.in_bulk(missing))
+
+    def vertiport(self, vertiport_id: UUID | None) -> Vertiport | None:
+        return self.vertiports.get(vertiport_id) if vertiport_id else None
+
+    def counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in MANAGED_STATUSES}
+        for flight in self.flights.values():
+            counts[flight.flight_status] += 1
+        return counts
+
+    def with_status(self, status: str) -> List[ManagedFlight]:
+        return [
+            flight
+            for flight in self.flights.values()
+            if flight.flight_status == status
+            and flight.scheduled_departure_datetime is not None
+            and flight.scheduled_arrival_datetime is not None
+        ]
+
+    def set_status(self, flight_instance_id: UUID, status: str):
+        """Local transition, applied before the DB change is read back."""
+        if status not in MANAGED_STATUSES:
+            self.flights.pop(flight_instance_id, None)
+            return
+
+        flight = self.flights.get(flight_instance_id)
+        if flight is not None:
+            flight.flight_status = status
+
+    def discard(self, flight_instance_id: UUID):
+        self.flights.pop(flight_instance_id, None)
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence, Tuple
+
+import numpy as np
+
+MIN_GROUND_SPEED_FACTOR = 0.3  # Floor against headwinds stronger than airspeed
+
+
+@dataclass(slots=True)
+class AirborneState:
+    """Dead-reckoned progress of a flight flown through the wind field."""
+
+    distance_m: float
+    energy: float
+    updated: datetime
+    lat: float
+    lon: float
+    alt: float
+
+
+class WindField:
+    """Gridded u/v wind (m/s, east/north) loaded from a local directory.
+
+    The directory holds ``u.npy`` and ``v.npy`` shaped (time, alt, lat, lon)
+    and ``axes.npz`` with the ascending ``time`` (epoch seconds), ``alt``
+    (meters), ``lat`` and ``lon`` axes. Components are memory-mapped, so only
+    the cells around the sampled aircraft are ever read from disk. Points
+    outside the grid take the value at its edge.
+    """
+
+    def __init__(self, directory: str | Path):
+        directory = Path(directory)
+        self.u = np.load(directory / "u.npy", mmap_mode="r")
+        self.v = np.load(directory / "v.npy", mmap_mode="r")
+        with np.load(directory / "axes.npz") as axes:
+            self.times = np.asarray(axes["time"], dtype=np.float64)
+            self.alts = np.asarray(axes["alt"], dtype=np.float64)
+            self.lats = np.asarray(axes["lat"], dtype=np.float64)
+            self.lons = np.asarray(axes["lon"], dtype=np.float64)
+
+        shape = (len(self.times), len(self.alts), len(self.lats), len(self.lons))
+        if self.u.shape != shape or self.v.shape != shape:
+            raise ValueError(
+                f"Wind components must be shaped {shape} (time, alt, lat, lon); "
+                f"got u={self.u.shape} v={self.v.shape}"
+            )
+
+    @staticmethod
+    def save(
+        directory: str | Path,
+        u: np.ndarray,
+        v: np.ndarray,
+        times: Sequence[float],
+        alts: Sequence[float],
+        lats: Sequence[float],
+        lons: Sequence[float],
+    ):
+        """Writes a grid in the layout expected by the constructor."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "u.npy", np.asarray(u, dtype=np.float32))
+        np.save(directory / "v.npy", np.asarray(v, dtype=np.float32))
+        np.savez(directory / "axes.npz", time=times, alt=alts, lat=lats, lon=lons)
+
+    def sample(
+        self, lat: np.ndarray, lon: np.ndarray, alt: np.ndarray, when: datetime
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """u/v at every (lat, lon, alt) at one instant.
+
+        Trilinear in space on the two time slices around ``when``, blended
+        linearly in time; one pass over all aircraft.
+        """
+        t0, t1, wt = _bracket(self.times, np.asarray([when.timestamp()]))
+        t0, t1, wt = int(t0[0]), int(t1[0]), float(wt[0])
+        cells = (
+            _bracket(self.alts, alt),
+            _bracket(self.lats, lat),
+            _bracket(self.lons, lon),
+        )
+
+        u = _trilinear(self.u[t0], *cells)
+        v = _trilinear(self.v[t0], *cells)
+        if wt > 0:
+            u = u * (1 - wt) + _trilinear(self.u[t1], *cells) * wt
+            v = v * (1 - wt) + _trilinear(self.v[t1], *cells) * wt
+        return u, v
+
+    def ground_speeds(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        alt: np.ndarray,
+        track_deg: np.ndarray,
+        airspeed_mps: np.ndarray,
+        when: datetime,
+    ) -> np.ndarray:
+        """Ground speed (m/s) along each track, from airspeed plus tailwind."""
+        u, v = self.sample(lat, lon, alt, when)
+        track = np.radians(track_deg)
+        tailwind = u * np.sin(track) + v * np.cos(track)
+        return np.maximum(
+            airspeed_mps + tailwind, airspeed_mps * MIN_GROUND_SPEED_FACTOR
+        )
+
+
+def _bracket(axis: np.ndarray, values: np.ndarray):
+    """Lower/upper grid indices and the interpolation weight of each value."""
+    values = np.asarray(values, dtype=np.float64)
+    last = len(axis) - 1
+    i0 = np.clip(np.searchsorted(axis, values, side="right") - 1, 0, last)
+    i1 = np.minimum(i0 + 1, last)
+    span = axis[i1] - axis[i0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(span > 0, (values - axis[i0]) / span, 0.0)
+    return i0, i1, np.clip(weight, 0.0, 1.0)
+
+
+def _trilinear(grid, z, y, x) -> np.ndarray:
+    """Trilinear interpolation of a (alt, lat, lon) grid at bracketed points."""
+    z0, z1, wz = z
+    y0, y1, wy = y
+    x0, x1, wx = x
+
+    # Fancy indexing only touches the 8 corner cells of each point
+    c00 = grid[z0, y0, x0] * (1 - wx) + grid[z0, y0, x1] * wx
+    c01 = grid[z0, y1, x0] * (1 - wx) + grid[z0, y1, x1] * wx
+    c10 = grid[z1, y0, x0] * (1 - wx) + grid[z1, y0, x1] * wx
+    c11 = grid[z1, y1, x0] * (1 - wx) + grid[z1, y1, x1] * wx
+    c0 = c00 * (1 - wy) + c01 * wy
+    c1 = c10 * (1 - wy) + c11 * wy
+    return c0 * (1 - wz) + c1 * wz
@@ -1,3 +1,566 @@
-from django.test import TestCase
+import random
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.utils import timezone
+
+from common_tools.schemas.aircraft import AircraftFilterSchema
+from common_tools.schemas.aircraft_data import AircraftDataFilterSchema
+from common_tools.schemas.flight_instance import (
+    FlightInstanceFilterSchema,
+    FlightStatusEnum,
+)
+from common_tools.schemas.tracking import TrackingFilterSchema
+from common_tools.schemas.waypoint import UpdateWaypointSchema, WaypointFilterSchema
+from monitor.management.commands.replay_telemetry import Command as ReplayCommand
+from monitor.models import (
+    Aircraft,
+    AircraftData,
+    AircraftType,
+    FlightInstance,
+    FlightSchedule,
+    FlightStatusTransition,
+    Route,
+    RouteGeometry,
+    Tracking,
+    Vertiport,
+    Waypoint,
+)
+from monitor.services.aircraft import AircraftService
+from monitor.services.aircraft_data import AircraftDataService
+from monitor.schemas.flight_schedule import ScheduleGenerationRequestSchema
+from monitor.schemas.schedule import ScheduleConflictFilterSchema
+from monitor.schemas.slot import SlotAllocationRequestSchema
+from monitor.services import reference_cache, vertiport_board
+from monitor.services.flight_instance import FlightInstanceService
+from monitor.services.flight_schedule import FlightScheduleService
+from monitor.services.route_geometry import RouteGeometryService
+from monitor.services.route_planner import build_graph
+from monitor.services.schedule import (
+    ScheduleConflictError,
+    ScheduleValidationService,
+    sweep_overlaps,
+)
+from monitor.services.slot_allocation import SlotAllocationService
+from monitor.services.tracking import TrackingService
+from monitor.services.vertiport import VertiportService
+from monitor.services.waypoint import WaypointService
+from monitor.simulator.state import FlightTable
+
+MANY = 5
+
+
+def make_flight(index: int) -> FlightInstance:
+    """A flight whose aircraft, type, route and vertiports are its own."""
+    aircraft_type = AircraftType.objects.create(name=f"Type {index}")
+    aircraft = Aircraft.objects.create(
+        tail_number=f"TST-{index:03d}", aircraft_type=aircraft_type
+    )
+    route = Route.objects.create(name=f"Route {index}")
+    departure, arrival = (
+        Vertiport.objects.create(
+            vertiport_code=f"T{index:03d}{suffix}",
+            vertiport_name=f"Vertiport {index}{suffix}",
+            latitude=-23.5 + index * 0.01,
+            longitude=-46.6,
+            altitude=700,
+        )
+        for suffix in "AB"
+    )
+    departure_at = timezone.now() + timedelta(hours=index * 2)
+    return FlightInstance.objects.create(
+        aircraft=aircraft,
+        callsign=f"TST{index:03d}",
+        route=route,
+        departure_vertiport=departure,
+        arrival_vertiport=arrival,
+        scheduled_departure_datetime=departure_at,
+        scheduled_arrival_datetime=departure_at + timedelta(hours=1),
+    )
+
+
+def make_waypoint(index: int) -> Waypoint:
+    fi = make_flight(index)
+    return Waypoint.objects.create(
+        route=fi.route,
+        vertiport=fi.departure_vertiport,
+        name=f"WP {index}",
+        sequence_order=1,
+    )
+
+
+def make_tracking(index: int) -> Tracking:
+    return Tracking.objects.create(
+        flight_instance=make_flight(index),
+        latitude=-23.5,
+        longitude=-46.6,
+        altitude=300,
+        speed=40,
+        energy_level=80,
+    )
+
+
+def make_aircraft_data(index: int) -> AircraftData:
+    return AircraftData.objects.create(
+        flight_instance=make_flight(index), latitude=-23.5, longitude=-46.6
+    )
+
+
+class BatchedListQueriesTest(TestCase):
+    """The list services run as many queries for one row as for many."""
+
+    def assertConstantQueries(self, num, make_row, list_rows):
+        make_row(0)
+        with self.assertNumQueries(num):
+            self.assertEqual(len(list_rows().root), 1)
+
+        for index in range(1, MANY):
+            make_row(index)
+        with self.assertNumQueries(num):
+            self.assertEqual(len(list_rows().root), MANY)
+
+    def test_waypoints(self):
+        # Waypoints, routes, vertiports
+        self.assertConstantQueries(
+            3,
+            make_waypoint,
+            lambda: WaypointService().get_waypoints(WaypointFilterSchema()),
+        )
+
+    def test_aircrafts(self):
+        # Aircraft, aircraft types
+        self.assertConstantQueries(
+            2,
+            lambda index: make_flight(index).aircraft,
+            lambda: AircraftService().get_aircrafts(AircraftFilterSchema()),
+        )
+
+    def test_flight_instances(self):
+        # Flights, aircraft, routes, vertiports, aircraft types
+        self.assertConstantQueries(
+            5,
+            make_flight,
+            lambda: FlightInstanceService().get_flight_instances(
+                FlightInstanceFilterSchema()
+            ),
+        )
+
+    def test_tracking(self):
+        # Trackings plus the five queries of their flights
+        self.assertConstantQueries(
+            6,
+            make_tracking,
+            lambda: TrackingService().get_tracking(TrackingFilterSchema()),
+        )
+
+    def test_aircraft_data(self):
+        # History points plus the five queries of their flights
+        self.assertConstantQueries(
+            6,
+            make_aircraft_data,
+            lambda: AircraftDataService().get_aircraft_data(AircraftDataFilterSchema()),
+        )
+
+
+class CatchUpTest(TestCase):
+    """Catch-up ends missed flights as the lifecycle job does, audited."""
+
+    def test_past_arrival(self):
+        pending, tracking = make_flight(0), make_tracking(1)
+        activated = tracking.flight_instance
+        activated.flight_status = FlightStatusEnum.ACTIVATED.value
+        activated.save()
+
+        table = FlightTable()
+        table.refresh()
+        now = timezone.now() + timedelta(days=1)
+        self.assertEqual(table.catch_up(now, timedelta(minutes=5)), (0, 1, 1))
+
+        self.assertEqual(table.flights, {})
+        pending.refresh_from_db()
+        activated.refresh_from_db()
+        tracking.refresh_from_db()
+        self.assertEqual(pending.flight_status, FlightStatusEnum.CANCELLED.value)
+        self.assertEqual(activated.flight_status, FlightStatusEnum.TERMINATED.value)
+        self.assertFalse(tracking.active)
+        self.assertEqual(
+            set(
+                FlightStatusTransition.objects.values_list(
+                    "flight_instance_id", "from_status", "to_status", "source"
+                )
+            ),
+            {
+                (
+                    pending.id,
+                    FlightStatusEnum.PENDING.value,
+                    FlightStatusEnum.CANCELLED.value,
+                    FlightStatusTransition.Source.LIFECYCLE,
+                ),
+                (
+                    activated.id,
+                    FlightStatusEnum.ACTIVATED.value,
+                    FlightStatusEnum.TERMINATED.value,
+                    FlightStatusTransition.Source.LIFECYCLE,
+                ),
+            },
+        )
+
+
+class ReplayFinalPointsTest(TestCase):
+    """Only a flight's overall last point ends it on the replay target."""
+
+    def test_window_before_landing(self):
+        point = make_aircraft_data(0)
+        fi = point.flight_instance
+        fi.flight_status = FlightStatusEnum.TERMINATED.value
+        fi.save()
+        landed = point.created_at + timedelta(minutes=10)
+        AircraftData.objects.create(
+            flight_instance=fi, latitude=-23.6, longitude=-46.7, created_at=landed
+        )
+
+        command = ReplayCommand()
+        window_to = point.created_at + timedelta(minutes=5)
+        queryset = AircraftData.objects.filter(created_at__lt=window_to)
+        self.assertEqual(command._final_points(queryset, window_to), {})
+
+        window_to = landed + timedelta(minutes=5)
+        queryset = AircraftData.objects.filter(created_at__lt=window_to)
+        self.assertEqual(command._final_points(queryset, window_to), {fi.id: landed})
+
+
+class RouteGeometryTest(TestCase):
+    def test_delete_vertiport(self):
+        waypoint = make_waypoint(0)
+        RouteGeometryService().get_points(waypoint.route_id)
+
+        VertiportService().delete_vertiport(waypoint.vertiport_id)
+
+        self.assertFalse(
+            RouteGeometry.objects.filter(route_id=waypoint.route_id).exists()
+        )
+
+    def test_waypoint_edit_invalidates_on_commit(self):
+        waypoint = make_waypoint(0)
+        RouteGeometryService().get_points(waypoint.route_id)
+        geometry = RouteGeometry.objects.filter(route_id=waypoint.route_id)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            WaypointService().update_waypoint(
+                waypoint.id, UpdateWaypointSchema(altitude=1050)
+            )
+            # Readers still see the old rows until the commit
+            self.assertTrue(geometry.exists())
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(geometry.exists())
+
+    def test_own_coordinates_win(self):
+        # An overflight above the pad, with its position left to the vertiport
+        waypoint = make_waypoint(0)
+        waypoint.altitude = 1050
+        waypoint.save()
+        vertiport = waypoint.vertiport
+        expected = (float(vertiport.latitude), float(vertiport.longitude), 1050.0)
+
+        points = RouteGeometryService().get_points(waypoint.route_id)
+        self.assertEqual(points, [expected])
+
+        # The planner still keeps one node per vertiport, at the pad
+        graph = build_graph()
+        node = graph.vertiports[vertiport.id]
+        self.assertEqual(graph.alt[node], float(vertiport.altitude))
+
+
+class ReferenceCacheTest(TransactionTestCase):
+    """Rows read inside a transaction are not cached, so no TestCase here."""
+
+    def setUp(self):
+        for cache in reference_cache.REFERENCE_CACHES:
+            cache.invalidate()
+        self.aircraft = make_flight(0).aircraft
+
+    def test_hit_and_miss(self):
+        cache = reference_cache.aircrafts
+        with self.assertNumQueries(1):
+            cache.get("id", self.aircraft.id)
+        with self.assertNumQueries(0):
+            cache.get("id", self.aircraft.id)
+            cache.get("tail_number", self.aircraft.tail_number)
+            cache.get_many([self.aircraft.id])
+
+    def test_copies(self):
+        cache = reference_cache.aircrafts
+        cache.get("id", self.aircraft.id).aircraft_type.name = "Changed"
+        with self.assertNumQueries(0):
+            row = cache.get("id", self.aircraft.id)
+        self.assertEqual(row.aircraft_type.name, "Type 0")
+
+    def test_save_evicts(self):
+        cache = reference_cache.aircrafts
+        cache.get("id", self.aircraft.id)
+        aircraft_type = self.aircraft.aircraft_type
+        aircraft_type.name = "Renamed"
+        aircraft_type.save()
+        with self.assertNumQueries(1):
+            row = cache.get("id", self.aircraft.id)
+        self.assertEqual(row.aircraft_type.name, "Renamed")
+
+    def test_duplicate_codes(self):
+        cache = reference_cache.vertiports
+        vertiport = Vertiport.objects.get(vertiport_code="T000A")
+        with self.assertNumQueries(1):
+            cache.get("vertiport_code", "T000A")
+        with self.assertNumQueries(0):
+            cache.get("vertiport_code", "T000A")
+
+        Vertiport.objects.create(
+            vertiport_code="T000A",
+            vertiport_name="Duplicate",
+            latitude=-23.0,
+            longitude=-46.0,
+        )
+        # Cached by id, but not under a code other rows share
+        cache.get("id", vertiport.id)
+        with self.assertRaises(ValueError):
+            cache.get("vertiport_code", "T000A")
+
+    def test_delete_evicts(self):
+        cache = reference_cache.aircrafts
+        aircraft_id = self.aircraft.id
+        cache.get("id", aircraft_id)
+        self.aircraft.delete()
+        with self.assertNumQueries(1):
+            self.assertIsNone(cache.get("id", aircraft_id))
+
+
+class VertiportBoardTest(TestCase):
+    def setUp(self):
+        vertiport_board._board = None
+        self.addCleanup(setattr, vertiport_board, "_board", None)
+
+    def test_sync_reads_other_writers(self):
+        fi = make_flight(0)
+        board = vertiport_board.get_board()
+        self.assertIn(fi.id, board.outbound[fi.departure_vertiport_id])
+
+        # A set-based update runs no hook, as in another process
+        FlightInstance.objects.filter(id=fi.id).update(
+            flight_status=FlightStatusEnum.ACTIVATED.value,
+            updated_at=timezone.now(),
+        )
+        board.synced_at -= vertiport_board.SYNC_SECONDS + 1
+        with self.assertNumQueries(2):
+            self.assertIs(vertiport_board.get_board(), board)
+
+        self.assertNotIn(fi.id, board.outbound[fi.departure_vertiport_id])
+        self.assertIn(fi.id, board.inbound[fi.arrival_vertiport_id])
+        with self.assertNumQueries(0):
+            vertiport_board.get_board()
+
+
+class SlotAllocationTest(TestCase):
+    def setUp(self):
+        self.window_from = timezone.now().replace(
+            minute=0, second=0, microsecond=0
+        ) + timedelta(days=1)
+        self.window_to = self.window_from + timedelta(hours=1)
+
+    def test_shifted_arrival_beyond_delay_limit(self):
+        pending = make_flight(0)
+        fixed = make_flight(1)
+        pad = pending.arrival_vertiport
+        pad.slot_capacity = 1
+        pad.save()
+
+        # Departs near the window end, lands a block time after it
+        pending.scheduled_departure_datetime = self.window_from + timedelta(minutes=45)
+        pending.scheduled_arrival_datetime = self.window_from + timedelta(minutes=100)
+        pending.save()
+        # Moves only after window end + max delay, into the same pad bucket
+        fixed.flight_status = FlightStatusEnum.ACTIVATED.value
+        fixed.arrival_vertiport = pad
+        fixed.scheduled_departure_datetime = self.window_from + timedelta(minutes=92)
+        fixed.scheduled_arrival_datetime = self.window_from + timedelta(minutes=98)
+        fixed.save()
+
+        result = SlotAllocationService().allocate(
+            SlotAllocationRequestSchema(
+                window_from=self.window_from,
+                window_to=self.window_to,
+                slot_minutes=15,
+                max_delay_minutes=30,
+            )
+        )
+
+        self.assertEqual(result.unallocated, [])
+        self.assertEqual(
+            [(a.flight_instance, a.delay_minutes) for a in result.assignments],
+            [(pending.id, 15.0)],
+        )
+
+
+class FlightScheduleTest(TestCase):
+    day = date(2030, 1, 7)
+
+    def setUp(self):
+        fi = make_flight(0)
+        self.a, self.b = fi.departure_vertiport, fi.arrival_vertiport
+        self.first, self.second = sorted(
+            (make_flight(index).aircraft for index in (1, 2)), key=lambda a: str(a.id)
+        )
+        # Only the vertiports and aircraft are kept
+        FlightInstance.objects.all().delete()
+
+    def at(self, hour: int, minute: int = 0) -> datetime:
+        return datetime.combine(self.day, datetime.min.time(), dt_timezone.utc).replace(
+            hour=hour, minute=minute
+        )
+
+    def make_schedule(self, name, departure, arrival, times) -> FlightSchedule:
+        schedule = FlightSchedule.objects.create(
+            name=name,
+            callsign_prefix=name,
+            departure_vertiport=departure,
+            arrival_vertiport=arrival,
+            departure_times=times,
+            block_minutes=30,
+            valid_from=self.day,
+        )
+        schedule.aircraft.set([self.first, self.second])
+        return schedule
+
+    def generate(self):
+        return FlightScheduleService().generate(
+            ScheduleGenerationRequestSchema(date_from=self.day, date_to=self.day)
+        )
+
+    def test_rerun_is_idempotent(self):
+        self.make_schedule("OUT", self.a, self.b, ["08:00", "12:00"])
+
+        first = self.generate()
+        self.assertEqual((first.occurrences, first.existing, first.created), (2, 0, 2))
+        again = self.generate()
+        self.assertEqual((again.occurrences, again.existing, again.created), (2, 2, 0))
+        self.assertEqual(FlightInstance.objects.count(), 2)
+
+    def test_pool_assignment(self):
+        # The second aircraft is parked at A, the first nowhere known
+        FlightInstance.objects.create(
+            aircraft=self.second,
+            departure_vertiport=self.b,
+            arrival_vertiport=self.a,
+            scheduled_departure_datetime=self.at(6, 30),
+            scheduled_arrival_datetime=self.at(7),
+        )
+        outbound = self.make_schedule(
+            "OUT", self.a, self.b, ["08:00", "08:10", "08:15"]
+        )
+        self.make_schedule("RET", self.b, self.a, ["09:00"])
+
+        result = self.generate()
+
+        self.assertEqual(result.created, 3)
+        self.assertEqual(
+            [(u.schedule, u.scheduled_departure_datetime) for u in result.unassigned],
+            [(outbound.id, self.at(8, 15))],
+        )
+        self.assertEqual(
+            list(
+                FlightInstance.objects.filter(schedule__isnull=False)
+                .order_by("scheduled_departure_datetime")
+                .values_list("scheduled_departure_datetime", "aircraft_id")
+            ),
+            [
+                (self.at(8), self.second.id),  # Parked at A
+                (self.at(8, 10), self.first.id),  # The only one free
+                (self.at(9), self.first.id),  # Both at B: pool order
+            ],
+        )
+
+
+class SweepOverlapsTest(SimpleTestCase):
+    def test_matches_pairwise_check(self):
+        rng = random.Random(7)
+        start = datetime(2030, 1, 1, tzinfo=dt_timezone.utc)
+        intervals = []
+        for flight in range(300):
+            departure = start + timedelta(minutes=rng.randrange(0, 24 * 60, 5))
+            arrival = departure + timedelta(minutes=rng.randrange(5, 120, 5))
+            intervals.append((rng.randrange(10), departure, arrival, flight))
+        intervals.sort(key=lambda interval: (interval[0], interval[1]))
+
+        # Every flight overlapping one that departed no later is reported once
+        expected = {
+            b[3]
+            for i, a in enumerate(intervals)
+            for b in intervals[i + 1 :]
+            if a[0] == b[0] and b[1] < a[2]
+        }
+        reported = [flight for _, flight, *_ in sweep_overlaps(intervals)]
+        self.assertEqual(len(reported), len(set(reported)))
+        self.assertEqual(set(reported), expected)
+
+
+class ScheduleValidationTest(TestCase):
+    def setUp(self):
+        self.fi = make_flight(0)
+        self.departure = self.fi.scheduled_departure_datetime
+        self.arrival = self.fi.scheduled_arrival_datetime
+        self.aircraft_id = self.fi.aircraft_id
+
+    def test_check_availability(self):
+        service = ScheduleValidationService()
+        with self.assertRaises(ScheduleConflictError):
+            service.check_availability(
+                self.aircraft_id,
+                self.departure + timedelta(minutes=30),
+                self.arrival + timedelta(minutes=30),
+            )
+        # Back to back, the flight itself, and cancelled flights are free
+        service.check_availability(
+            self.aircraft_id, self.arrival, self.arrival + timedelta(hours=1)
+        )
+        service.check_availability(
+            self.aircraft_id, self.departure, self.arrival, exclude_id=self.fi.id
+        )
+        self.fi.flight_status = FlightStatusEnum.CANCELLED.value
+        self.fi.save()
+        service.check_availability(self.aircraft_id, self.departure, self.arrival)
+
+    def test_batch_conflicts(self):
+        later = self.arrival + timedelta(hours=1)
+        conflicts = ScheduleValidationService().batch_conflicts(
+            [
+                (self.aircraft_id, self.departure, self.arrival),
+                (self.aircraft_id, later, later + timedelta(hours=1)),
+                (
+                    self.aircraft_id,
+                    later + timedelta(minutes=30),
+                    later + timedelta(hours=2),
+                ),
+                (None, self.departure, self.arrival),
+            ]
+        )
+        self.assertEqual(set(conflicts), {0, 1, 2})
+        self.assertIn(str(self.fi.id), conflicts[0])
+        self.assertIn("item", conflicts[2])
+
+    def test_audit(self):
+        overlapping = FlightInstance.objects.create(
+            aircraft_id=self.aircraft_id,
+            scheduled_departure_datetime=self.departure + timedelta(minutes=30),
+            scheduled_arrival_datetime=self.arrival + timedelta(minutes=30),
+        )
+        conflicts = (
+            ScheduleValidationService().audit(ScheduleConflictFilterSchema()).root
+        )
+        self.assertEqual(
+            [(c.flight_instance, c.conflicts_with) for c in conflicts],
+            [(overlapping.id, self.fi.id)],
+        )
+        self.assertEqual(
+            (conflicts[0].overlap_start, conflicts[0].overlap_end),
+            (overlapping.scheduled_departure_datetime, self.arrival),
+        )
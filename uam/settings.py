@@ -135,3 +135,10 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Reference data cache (monitor.services.reference_cache)
+# Alias of a cache in CACHES shared by every process (e.g. Redis), or None to
+# keep the cached rows in each process alone
+REFERENCE_CACHE_ALIAS = None
+# Seconds a process-local cache may serve rows another process changed
+REFERENCE_CACHE_TTL_SECONDS = 300
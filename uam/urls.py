@@ -23,7 +23,9 @@ from monitor.apis.aircraft import aircraft
 from monitor.apis.aircraft_data import aircraft_data
 from monitor.apis.aircraft_type import aircraft_type
 from monitor.apis.flight_instance import flight_instance
+from monitor.apis.flight_schedule import flight_schedule
 from monitor.apis.route import route
+from monitor.apis.slot import slot
 from monitor.apis.tracking import tracking
 from monitor.apis.vertiport import vertiport
 from monitor.apis.waypoint import waypoint
@@ -38,6 +40,8 @@ api.add_router("/", waypoint)
 api.add_router("/", flight_instance)
 api.add_router("/", tracking)
 api.add_router("/", aircraft_data)
+api.add_router("/", slot)
+api.add_router("/", flight_schedule)
 
 
 urlpatterns = [